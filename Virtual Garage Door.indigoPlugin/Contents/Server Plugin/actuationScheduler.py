@@ -0,0 +1,415 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                        MODULE actuationScheduler.py                         #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  actuationScheduler.py
+   TITLE:  Non-blocking scheduling of door actuation steps
+FUNCTION:  Executes timed sequences of actuation steps (relay pulses, action
+           groups, delays, and physical lock operations) for multiple doors
+           concurrently on a single scheduler thread.
+   USAGE:  actuationScheduler.py is included in the Virtual Garage
+           Door.indigoPlugin bundle.  An ActuationScheduler instance is created
+           by the Plugin __init__ method, started by the Plugin startup method,
+           and stopped by the Plugin shutdown method.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE actuationScheduler.py DESCRIPTION:
+
+Prior to v1.6.0 the Plugin action methods executed door actuation steps
+inline and used sleep for the activation relay closure time, the optional
+action delays, and physical lock device toggling.  Actions for several doors
+(e.g., a HomeKit "close all" request) were serialized and the calling action
+thread was blocked for many seconds.
+
+The ActuationScheduler class replaces the inline sleeps with a heap of timed
+steps that is serviced by a single daemon thread.  The Plugin action methods
+schedule a sequence of steps and return immediately.  Each step is a tuple:
+
+(delay, stepName, function)
+
+where delay is the time in seconds to wait after the prior step (or after the
+sequence starts) before calling the function with no arguments.  A function
+of None is a pure delay.  Sequences are queued per door key (the opener device
+id).  The steps of a sequence and the sequences for a door are executed
+strictly in order, but the sequences for different doors are interleaved by
+due time.  If a step raises an exception, a warning is logged and the rest of
+the sequence is aborted.  The next queued sequence for the door then starts.
+
+A wait step has a fourth element, a hashable wait key:
+
+(deadline, stepName, timeoutFunction, waitKey)
+
+The wait is armed before the preceding step is executed so that a completion
+signal that arrives while the preceding step is in progress is not lost.  The
+sequence is then parked until the Plugin calls the signal method with the
+same wait key or until the deadline (seconds after the preceding step
+completes) passes.  If signalled, the wait step is skipped; otherwise, the
+timeoutFunction (if not None) is called and the sequence continues.  The
+Plugin uses wait steps to wait for physical lock devices to reach their
+target states as reported by the deviceUpdated method.
+
+Release steps return an actuator to its idle state (e.g., the 'ar-off' step
+that opens the activation relay after the closure time).  Their step names
+are given when the scheduler is created.  When a door is cancelled or the
+scheduler is stopped, the pending release steps of a sequence that has
+started are executed immediately, without their delays, rather than
+discarded.  If a step of the sequence is executing at the time, the release
+steps are executed by the scheduler thread after it completes.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from logging import getLogger
+from threading import Condition, Thread
+from time import monotonic
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                          CLASS ActuationScheduler                           #
+#                                                                             #
+###############################################################################
+
+class ActuationScheduler:
+    """
+    The ActuationScheduler class maintains per-door queues of step sequences
+    and a heap of the next due step for each door.  A sequence is a list with
+    the following structure:
+
+    [key, name, description, steps, stepIndex, waitState]
+    where:
+      key          is the door key (opener device id),
+      name         is the device name for log messages,
+      description  describes the sequence (e.g., 'closing'),
+      steps        is a tuple of (delay, stepName, function) tuples and
+                   (deadline, stepName, timeoutFunction, waitKey) tuples,
+      stepIndex    is the index of the next step to be executed, and
+      waitState    is None, 'armed', 'signalled', or 'parked' for a sequence
+                   whose next step is a wait step.
+
+    The heap holds (dueTime, sequenceNumber, sequence, stepIndex) entries.  At
+    most one live entry per door is in the heap at any time; the next step of
+    a sequence is pushed only after the prior step has completed.  An entry
+    whose stepIndex no longer matches the sequence (a wait step that was
+    signalled) is stale and is discarded when it is popped.
+    """
+
+    def __init__(self, releaseStepNames=()):
+        self._releaseStepNames = frozenset(releaseStepNames)
+        self._condition = Condition()
+        self._heap = []
+        self._sequenceNumbers = count()
+        self._doorQueues = {}  # {key: deque of queued sequences}
+        self._waiters = {}  # {waitKey: sequence}
+        self._executing = None  # Sequence with a step in progress.
+        self._thread = None
+        self._running = False
+
+        self.stepsExecuted = 0
+        self.sequencesAborted = 0
+        self.waitsSignalled = 0
+        self.waitsTimedOut = 0
+        self.releasesExecuted = 0
+
+    def start(self):
+        """ Start the scheduler thread. """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = Thread(target=self._run, name='actuationScheduler',
+                              daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the scheduler thread and discard all pending sequences after
+        executing their release steps.  Wait up to timeout seconds for a step
+        in progress to complete.
+        """
+        with self._condition:
+            self._running = False
+            pending = sum(len(doorQueue)
+                          for doorQueue in self._doorQueues.values())
+            releases = [(doorQueue[0], self._pendingReleases(doorQueue[0]))
+                        for doorQueue in self._doorQueues.values()]
+            self._heap.clear()
+            self._doorQueues.clear()
+            self._waiters.clear()
+            self._condition.notify()
+        for sequence, steps in releases:
+            self._executeReleases(sequence, steps)
+        if pending:
+            L.warning('actuation scheduler stopped with %s pending '
+                      'sequences', pending)
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def schedule(self, key, name, description, steps, exclusive=()):
+        """
+        Queue a sequence of steps for the door identified by key.  Start the
+        sequence immediately if no other sequence is active for the door.
+        Return without waiting for any step to execute.
+
+        exclusive is a collection of sequence descriptions.  If a sequence
+        with one of these descriptions is active or queued for the door,
+        don't queue the new sequence and return False; otherwise, return
+        True.
+        """
+        sequence = [key, name, description, tuple(steps), 0, None]
+        if not sequence[3]:
+            return True
+        with self._condition:
+            doorQueue = self._doorQueues.get(key, ())
+            if any(queued[2] in exclusive for queued in doorQueue):
+                return False
+            doorQueue = self._doorQueues.setdefault(key, deque())
+            doorQueue.append(sequence)
+            if len(doorQueue) == 1:  # Door is idle; start the sequence.
+                self._pushNextStep(sequence, monotonic())
+        L.threaddebug('"%s" %s sequence scheduled with %s steps', name,
+                      description, len(sequence[3]))
+        return True
+
+    def cancel(self, key):
+        """
+        Discard the active and queued sequences for a door after executing
+        the release steps of the active sequence.  A step that is already
+        executing is allowed to complete.
+        """
+        with self._condition:
+            doorQueue = self._doorQueues.pop(key, None)
+            if not doorQueue:
+                return
+            active = doorQueue[0]
+            releases = self._pendingReleases(active)
+            self._heap = [entry for entry in self._heap
+                          if entry[2][0] != key]
+            self._heap.sort()
+            self._waiters = {waitKey: sequence for waitKey, sequence
+                             in self._waiters.items()
+                             if sequence[0] != key}
+            self._condition.notify()
+        self._executeReleases(active, releases)
+
+    def signal(self, waitKey):
+        """
+        Signal the completion of a wait.  If a sequence is parked on the wait
+        key, skip its wait step and continue the sequence immediately.  If the
+        wait is armed but the preceding step is still in progress, mark it as
+        signalled.  Ignore signals with no waiter.
+        """
+        with self._condition:
+            sequence = self._waiters.pop(waitKey, None)
+            if not sequence:
+                return
+            self.waitsSignalled += 1
+            if sequence[5] == 'parked':
+                sequence[5] = None
+                self._advance(sequence, 1)  # Skip the parked wait step.
+            else:
+                sequence[5] = 'signalled'
+
+    def _pendingReleases(self, sequence, stepIndex=None):
+        """
+        Return the release steps of a sequence from stepIndex (default: the
+        next step) to the end.  Return no steps if the sequence has not
+        started or if a step is executing; the scheduler thread executes the
+        release steps after the step completes.  The caller must hold the
+        condition lock.
+        """
+        if stepIndex is None:
+            stepIndex = sequence[4]
+            if not stepIndex or sequence is self._executing:
+                return []
+        return [step for step in sequence[3][stepIndex:]
+                if len(step) == 3 and step[2]
+                and step[1] in self._releaseStepNames]
+
+    def _executeReleases(self, sequence, steps):
+        """
+        Execute the release steps of a cancelled sequence immediately.  Log a
+        warning for a step that raises an exception and continue.
+        """
+        name, description = sequence[1], sequence[2]
+        for step in steps:
+            L.threaddebug('"%s" %s cancelled; release step %s', name,
+                          description, step[1])
+            try:
+                step[2]()
+            except Exception as warningMessage:
+                L.warning('"%s" %s release step %s failed: %s', name,
+                          description, step[1], warningMessage)
+            with self._condition:
+                self.releasesExecuted += 1
+
+    def _pushNextStep(self, sequence, startTime):
+        """
+        Push the next step of a sequence onto the heap.  The caller must hold
+        the condition lock.
+        """
+        stepIndex = sequence[4]
+        delay = sequence[3][stepIndex][0]
+        heappush(self._heap, (startTime + delay, next(self._sequenceNumbers),
+                              sequence, stepIndex))
+        self._condition.notify()
+
+    def _advance(self, sequence, stepCount):
+        """
+        Advance a sequence by stepCount steps and push the next step or finish
+        the sequence.  The caller must hold the condition lock.
+        """
+        sequence[4] += stepCount
+        doorQueue = self._doorQueues.get(sequence[0])
+        if not doorQueue or doorQueue[0] is not sequence:
+            return  # Door was cancelled.
+        if sequence[4] < len(sequence[3]):
+            self._pushNextStep(sequence, monotonic())
+        else:
+            self._finishSequence(sequence)
+
+    def _finishSequence(self, sequence):
+        """
+        Remove a completed or aborted sequence from its door queue and start
+        the next queued sequence for the door, if any.  The caller must hold
+        the condition lock.
+        """
+        key = sequence[0]
+        doorQueue = self._doorQueues.get(key)
+        if not doorQueue or doorQueue[0] is not sequence:
+            return  # Door was cancelled.
+        doorQueue.popleft()
+        if doorQueue:
+            self._pushNextStep(doorQueue[0], monotonic())
+        else:
+            del self._doorQueues[key]
+
+    def _run(self):
+        """
+        Scheduler thread.  Wait for the next step to become due, execute it
+        without holding the lock, and then schedule the following step or
+        finish the sequence.  Arm a waiter before executing a step that is
+        followed by a wait step and park the sequence after the step if the
+        wait has not already been signalled.  Log a warning and abort the
+        sequence if a step raises an exception.  If the door was cancelled
+        while the step was executing, execute the release steps of the
+        sequence.
+        """
+        while True:
+            with self._condition:
+                while self._running:
+                    if self._heap:
+                        wait = self._heap[0][0] - monotonic()
+                        if wait <= 0.0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if not self._running:
+                    return
+                entry = heappop(self._heap)
+                sequence, stepIndex = entry[2], entry[3]
+                if stepIndex != sequence[4]:
+                    continue  # Stale entry for a signalled wait step.
+
+                key, name, description, steps = sequence[:4]
+                step = steps[stepIndex]
+                if len(step) == 4:  # Wait step deadline passed.
+                    self._waiters.pop(step[3], None)
+                    sequence[5] = None
+                    self.waitsTimedOut += 1
+                elif (stepIndex + 1 < len(steps)
+                        and len(steps[stepIndex + 1]) == 4):
+                    self._waiters[steps[stepIndex + 1][3]] = sequence
+                    sequence[5] = 'armed'
+                self._executing = sequence
+
+            stepName, function = step[1], step[2]
+            try:
+                if function:
+                    L.threaddebug('"%s" %s step %s', name, description,
+                                  stepName)
+                    function()
+            except Exception as warningMessage:
+                L.warning('"%s" %s step %s failed: %s; remaining %s steps '
+                          'aborted', name, description, stepName,
+                          warningMessage, description)
+                with self._condition:
+                    self._executing = None
+                    self.sequencesAborted += 1
+                    if sequence[5]:
+                        self._waiters.pop(steps[stepIndex + 1][3], None)
+                        sequence[5] = None
+                    self._finishSequence(sequence)
+                continue
+
+            releases = []
+            with self._condition:
+                self._executing = None
+                self.stepsExecuted += 1
+                doorQueue = self._doorQueues.get(key)
+                if not doorQueue or doorQueue[0] is not sequence:
+                    # Door was cancelled while the step was executing.
+                    releases = self._pendingReleases(sequence, stepIndex + 1)
+                elif sequence[5] == 'signalled':  # Skip the wait step.
+                    sequence[5] = None
+                    self._advance(sequence, 2)
+                elif sequence[5] == 'armed':  # Park until signal/deadline.
+                    sequence[5] = 'parked'
+                    self._advance(sequence, 1)
+                else:
+                    self._advance(sequence, 1)
+            self._executeReleases(sequence, releases)
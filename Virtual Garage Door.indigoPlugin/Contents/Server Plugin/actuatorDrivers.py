@@ -0,0 +1,180 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                          MODULE actuatorDrivers.py                          #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  actuatorDrivers.py
+   TITLE:  Activation relay driver registry
+FUNCTION:  Selects a driver for the activation relay device of each opener
+           device by device type id and resolves the device, plugin, and
+           channel once when the opener device is started.
+   USAGE:  actuatorDrivers.py is included in the Virtual Garage
+           Door.indigoPlugin bundle.  The Plugin class creates a
+           DriverRegistry instance from its relay device type id groups.
+           The Plugin _monitorDevices method resolves a driver for each
+           opener, and the _activationRelaySteps method uses it to press the
+           activation relay.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE actuatorDrivers.py DESCRIPTION:
+
+Prior to v1.6.0 every door action read the activation relay device from the
+Indigo server, tested its device type id for an EasyDAQ prefix, and, for an
+EasyDAQ relay, got the EasyDAQ plugin object from the server.
+
+A driver is created for an opener device when it is started.  It resolves
+everything that a press needs from the activation relay device object and the
+opener DeviceConfig and saves the press as a tuple of actuation scheduler
+steps (see the actuationScheduler module):
+
+(delay, description, function)
+
+The steps method returns a new list of the saved steps, so a press makes no
+server calls until the steps are executed.  The drivers are:
+
+RelayDriver    Indigo relay devices, including the ESPHome, Shelly Direct,
+               and Shelly MQTT relay devices.  indigo.device.turnOn, then
+               indigo.device.turnOff after the closure time.
+EasyDaqDriver  EasyDAQ relay and combination devices.  turnOnOutput and
+               turnOffOutput plugin actions for the relay channel parsed from
+               the activation relay state name (e.g., 3 for 'channel03').
+
+The DriverRegistry class maps device type ids to driver classes.  Device type
+ids that are not registered use the RelayDriver class.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import indigo
+
+from functools import partial
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS RelayDriver                              #
+#                                                                             #
+###############################################################################
+
+class RelayDriver:
+    """
+    The RelayDriver class presses a generic Indigo relay device.  Subclasses
+    override the _pressSteps method.
+    """
+
+    name = 'relay'
+
+    def __init__(self, arDev, config, closureTime):
+        """
+        Resolve the press steps for the activation relay device arDev of the
+        opener device with the parsed DeviceConfig object config.  The relay
+        is held on for closureTime seconds.
+        """
+        self.arDevId = arDev.id
+        self._steps = tuple(self._pressSteps(arDev, config, closureTime))
+
+    def steps(self):
+        """ Return a new list of the press steps. """
+        return list(self._steps)
+
+    def _pressSteps(self, arDev, config, closureTime):
+        """ Return the press steps for the relay device. """
+        return [(0.0, 'ar-on', partial(indigo.device.turnOn, arDev.id)),
+                (closureTime, 'ar-off',
+                 partial(indigo.device.turnOff, arDev.id))]
+
+
+class EasyDaqDriver(RelayDriver):
+    """ Press an EasyDAQ relay channel with EasyDAQ plugin actions. """
+
+    name = 'EasyDAQ'
+
+    def _pressSteps(self, arDev, config, closureTime):
+        plugin = indigo.server.getPlugin(arDev.pluginId)
+        props = dict(channelSel=config.arChannel)
+        return [(0.0, 'ar-on',
+                 partial(plugin.executeAction, 'turnOnOutput',
+                         deviceId=arDev.id, props=props)),
+                (closureTime, 'ar-off',
+                 partial(plugin.executeAction, 'turnOffOutput',
+                         deviceId=arDev.id, props=props))]
+
+
+###############################################################################
+#                                                                             #
+#                             CLASS DriverRegistry                            #
+#                                                                             #
+###############################################################################
+
+class DriverRegistry:
+    """
+    The DriverRegistry class maps activation relay device type ids to driver
+    classes.  It has the following structure:
+
+    self._drivers = {deviceTypeId: driverClass}
+    """
+
+    def __init__(self, default=RelayDriver):
+        self._drivers = {}
+        self._default = default
+
+    def register(self, deviceTypeIds, driverClass):
+        """ Register a driver class for a group of device type ids. """
+        for deviceTypeId in deviceTypeIds:
+            self._drivers[deviceTypeId] = driverClass
+
+    def resolve(self, arDev, config, closureTime):
+        """
+        Return a driver instance for the activation relay device arDev or None
+        if arDev is None.
+        """
+        if arDev is None:
+            return None
+        driverClass = self._drivers.get(arDev.deviceTypeId, self._default)
+        return driverClass(arDev, config, closureTime)
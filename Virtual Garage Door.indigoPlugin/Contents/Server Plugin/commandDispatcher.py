@@ -0,0 +1,263 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                         MODULE commandDispatcher.py                         #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  commandDispatcher.py
+   TITLE:  Per-door outbound command dispatching with coalescing
+FUNCTION:  Executes the server commands issued by the VirtualGarageDoor
+           transition methods (travel timer actions and vibration sensor,
+           virtual lock, and mechanical lock commands) on a dispatcher thread
+           instead of the event processing path.  Collapses pending commands
+           that are superseded by a newer command for the same target.
+   USAGE:  commandDispatcher.py is included in the Virtual Garage
+           Door.indigoPlugin bundle.  A CommandDispatcher instance is created
+           by the Plugin __init__ method, started by the Plugin startup
+           method, and stopped by the Plugin shutdown method.  Commands are
+           submitted by VirtualGarageDoor instances.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE commandDispatcher.py DESCRIPTION:
+
+The VirtualGarageDoor transition methods issue server commands as side
+effects of door state transitions: restartTimer and stopTimer actions for a
+Timers and Pesters travel timer, a delayed turnOff to reset the vibration
+sensor, a lock command for the virtual lock, and a turnOff command for the
+mechanical lock.  A burst of events during one door movement (e.g., vs-on,
+ar-on, cs-off) can issue several timer actions in quick succession, and each
+is a round trip to the Indigo server made on the event processing path.
+
+The CommandDispatcher class keeps a queue of pending commands for each door.
+Each command has a target slot (a hashable key such as ('timer', ttDevId)):
+
+(slot, description, function)
+
+where function is called with no arguments to execute the command.  When a
+command is submitted for a slot that already has a pending command for the
+door, the pending command is superseded: it is removed and the new command is
+queued at the end (e.g., a pending restartTimer followed by stopTimer becomes
+stopTimer alone).  The commands for a door are executed in order.  A single
+dispatcher thread serves the doors with pending commands in round-robin
+order, one command at a time, so that a door with many commands does not
+starve the others.
+
+The dispatcher counts the submitted, executed, coalesced (superseded),
+dropped (discarded by cancel or stop), and failed commands.  If there is no
+dispatcher thread (the dispatcher has not been started), submit executes the
+command immediately.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from collections import deque
+from logging import getLogger
+from threading import Condition, Thread
+from time import monotonic
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                          CLASS CommandDispatcher                            #
+#                                                                             #
+###############################################################################
+
+class CommandDispatcher:
+    """
+    The CommandDispatcher class maintains per-door dictionaries of pending
+    commands and a round-robin queue of doors with pending commands.  It has
+    the following structure:
+
+    self._pending = {key: {slot: (description, function)}}
+    self._ready = deque([key, ...])
+
+    where key is the door key (opener device id).  The pending commands
+    dictionary for a door preserves submission order.  A door key is in the
+    ready queue if and only if it has pending commands.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._pending = {}
+        self._ready = deque()
+        self._busy = False
+        self._thread = None
+        self._running = False
+
+        self.submitted = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self):
+        """ Start the dispatcher thread. """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = Thread(target=self._run, name='commandDispatcher',
+                              daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the dispatcher thread and drop all pending commands.  Wait up to
+        timeout seconds for a command in progress to complete.
+        """
+        with self._condition:
+            self._running = False
+            pending = sum(len(commands) for commands in self._pending.values())
+            self.dropped += pending
+            self._pending.clear()
+            self._ready.clear()
+            self._condition.notify_all()
+        if pending:
+            L.warning('command dispatcher stopped with %s pending commands',
+                      pending)
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, key, slot, description, function):
+        """
+        Queue a command for the door identified by key.  Supersede any pending
+        command for the same slot.  Return without waiting for the command to
+        execute.  Execute it immediately if the dispatcher is not running.
+        """
+        if not self._running:
+            function()
+            return
+        with self._condition:
+            self.submitted += 1
+            commands = self._pending.get(key)
+            if commands is None:
+                commands = self._pending[key] = {}
+                self._ready.append(key)
+            elif commands.pop(slot, None):
+                self.coalesced += 1
+                L.threaddebug('device id %s pending %s command superseded by '
+                              '%s', key, slot[0], description)
+            commands[slot] = (description, function)
+            self._condition.notify()
+
+    def cancel(self, key):
+        """
+        Drop the pending commands for a door.  A command that is already
+        executing is allowed to complete.
+        """
+        with self._condition:
+            commands = self._pending.pop(key, None)
+            if commands:
+                self.dropped += len(commands)
+                self._ready.remove(key)
+
+    def waitUntilIdle(self, timeout=10.0):
+        """
+        Wait until all pending commands have been executed.  Return False on
+        timeout.
+        """
+        deadline = monotonic() + timeout
+        with self._condition:
+            while self._pending or self._busy:
+                remaining = deadline - monotonic()
+                if remaining <= 0.0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def report(self):
+        """ Return a list of report lines with the command counts. """
+        with self._condition:
+            pending = sum(len(commands) for commands in self._pending.values())
+            return ['Command dispatcher:',
+                    '    %-28s %9s %9s %9s %9s %9s %9s'
+                    % ('commands', 'submitted', 'executed', 'coalesced',
+                       'dropped', 'failed', 'pending'),
+                    '    %-28s %9i %9i %9i %9i %9i %9i'
+                    % ('', self.submitted, self.executed, self.coalesced,
+                       self.dropped, self.failed, pending)]
+
+    def _run(self):
+        """
+        Dispatcher thread.  Take the oldest pending command of the next ready
+        door and execute it without holding the lock.  Return the door to the
+        end of the ready queue if it has more pending commands.  Log a
+        warning and continue if a command raises an exception.
+        """
+        while True:
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()  # Wake waitUntilIdle callers.
+                while self._running and not self._ready:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                key = self._ready.popleft()
+                commands = self._pending[key]
+                slot = next(iter(commands))
+                description, function = commands.pop(slot)
+                if commands:
+                    self._ready.append(key)
+                else:
+                    del self._pending[key]
+                self._busy = True
+
+            try:
+                function()
+            except Exception as warningMessage:
+                L.warning('device id %s %s command failed: %s', key,
+                          description, warningMessage)
+                with self._condition:
+                    self.failed += 1
+                continue
+
+            with self._condition:
+                self.executed += 1
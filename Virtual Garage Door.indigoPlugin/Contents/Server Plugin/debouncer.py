@@ -0,0 +1,187 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                            MODULE debouncer.py                              #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  debouncer.py
+   TITLE:  Per-monitored-device debouncing of sensor events
+FUNCTION:  Filters the on/off state changes of monitored sensor devices with a
+           settle window and minimum on and off times.  Collapses contact
+           bounce bursts into one net event before the event reaches the
+           VirtualGarageDoor state machine.
+   USAGE:  debouncer.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A Debouncer instance is created by the Plugin __init__
+           method and used by the Plugin deviceUpdated method for monitored
+           devices with debounce times in the opener device ConfigUI
+           (xxDebounce, xxMinOn, and xxMinOff fields).
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE debouncer.py DESCRIPTION:
+
+Prior to v1.6.0 the only noise handling was a check in the VirtualGarageDoor
+update method that discarded an event with the same name as the prior event
+within one second.  It missed contact bounce (e.g., cs-on, cs-off, cs-on in a
+few milliseconds), which produced spurious door state transitions, and it
+discarded legitimate repeated events.
+
+The Debouncer class adds a filter for each debounced monitored device of each
+opener device.  The duplicate event check is skipped for debounced devices
+and is retained for all others.  The filter keeps the accepted state (the
+state last reported to the state machine) and the raw state (the latest state
+reported by the device).  When the raw state changes, the filter waits for
+the hold time of the new raw state:
+
+hold = max(settle, minOn) for an on state or max(settle, minOff) for an off
+       state
+
+where settle is the settle window (the time the raw state must be stable
+after any change) and minOn and minOff are the minimum times that the device
+must stay on or off.  Each raw change restarts the wait.  When the wait
+expires, the raw state is accepted and reported as a net event if it differs
+from the accepted state.  A burst that returns to the accepted state before
+the wait expires is collapsed with no event.
+
+The waits are one-shot timers on the Plugin's built-in travel timer thread
+(see the travelTimer module) keyed by (devId, mDevTypeId) tuples, so they use
+the monotonic clock and no additional threads.  Monitored devices with zero
+debounce times are not filtered; their events are reported immediately and
+are subject to the duplicate event check.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from functools import partial
+from logging import getLogger
+from threading import Lock
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                               CLASS Debouncer                               #
+#                                                                             #
+###############################################################################
+
+class Debouncer:
+    """
+    The Debouncer class maintains the debounce filters for all debounced
+    monitored devices.  It has the following structure:
+
+    self._filters = {(devId, mDevTypeId): [acceptedState, rawState]}
+
+    where devId is the opener device id and mDevTypeId is the monitored device
+    type id.  A filter is created when its first state change is reported.
+    """
+
+    def __init__(self, timer):
+        self._timer = timer
+        self._filters = {}
+        self._lock = Lock()
+
+        self.changes = 0
+        self.events = 0
+        self.collapsed = 0
+
+    def filter(self, devId, mDevTypeId, oldState, newState, debounceTimes,
+               report):
+        """
+        Filter a monitored device state change.  debounceTimes is a
+        (settle, minOn, minOff) tuple in seconds.  report(event) is called on
+        the timer thread with the net event (e.g., 'cs-on') after the new
+        state has been held for its hold time.
+        """
+        key = (devId, mDevTypeId)
+        settle, minOn, minOff = debounceTimes
+        with self._lock:
+            self.changes += 1
+            states = self._filters.get(key)
+            if states is None:
+                states = self._filters[key] = [oldState, newState]
+            states[1] = newState
+            if newState == states[0]:  # Bounced back to the accepted state.
+                self._timer.cancel(key)
+                self.collapsed += 1
+                L.debug('device id %s %s bounce collapsed', devId, mDevTypeId)
+                return
+            hold = max(settle, minOn if newState else minOff)
+            self._timer.restart(key, hold,
+                                partial(self._settled, key, newState, report))
+
+    def cancel(self, devId):
+        """ Discard the filters and pending waits for an opener device. """
+        with self._lock:
+            for key in [key for key in self._filters if key[0] == devId]:
+                self._timer.cancel(key)
+                del self._filters[key]
+
+    def report(self):
+        """ Return a list of report lines with the filter counts. """
+        with self._lock:
+            return ['Debouncer:',
+                    '    %-28s %9s %9s %9s %9s'
+                    % ('state changes', 'changes', 'events', 'collapsed',
+                       'filters'),
+                    '    %-28s %9i %9i %9i %9i'
+                    % ('', self.changes, self.events, self.collapsed,
+                       len(self._filters))]
+
+    def _settled(self, key, state, report):
+        """
+        Hold time expiration callback on the timer thread.  Accept the state
+        and report the net event if it is still the raw state and it differs
+        from the accepted state.
+        """
+        with self._lock:
+            states = self._filters.get(key)
+            if not states or states[1] != state or states[0] == state:
+                return
+            states[0] = state
+            self.events += 1
+        report(key[1] + ('-on' if state else '-off'))
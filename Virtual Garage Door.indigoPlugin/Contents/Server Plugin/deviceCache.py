@@ -0,0 +1,182 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                           MODULE deviceCache.py                             #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  deviceCache.py
+   TITLE:  Door link index and cached device handles
+FUNCTION:  Links each started opener device to its virtual lock, physical
+           lock, and other monitored devices and caches the current device
+           objects so that the action methods evaluate their preconditions
+           without reading devices from the Indigo server.
+   USAGE:  deviceCache.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A DeviceCache instance is created by the Plugin __init__
+           method.  Doors are linked by the Plugin _monitorDevices method,
+           unlinked by deviceStopComm, and refreshed by deviceUpdated.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE deviceCache.py DESCRIPTION:
+
+Each indigo.devices lookup is an IPC round trip to the Indigo server that
+returns a new copy of the device.  Prior to v1.6.0 an open action read the
+virtual lock device twice and the latch sensor device once before it checked
+the door state, and the lock actions read the opener device in the same way.
+
+The DeviceCache class keeps a link index for each started opener device:
+
+self._doors = {opDevId: {typeId: devId}}
+self._links = {devId: set of opDevIds}
+
+where typeId is 'op' for the opener device itself or a monitored device type
+id (e.g., 'vl', 'ls', 'ps', or 'ml'), and _links is the reverse index from a
+linked device to the openers that link it.  The latest device object for each
+linked device is kept in self._devices = {devId: dev}.
+
+The Plugin deviceUpdated method passes every updated device to the refresh
+method, which replaces the cached object for a linked device with the new
+device object delivered by the server.  The cached objects are therefore as
+current as the last device update and are read without any server calls.
+They are replaced, never modified, so that a caller can hold one while it is
+refreshed.  The Plugin calls the cache methods on its main thread; the
+actuation scheduler thread only reads device objects with the get method.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS DeviceCache                              #
+#                                                                             #
+###############################################################################
+
+class DeviceCache:
+    """
+    The DeviceCache class holds the link index and the cached device objects
+    for the started opener devices (see the module description).
+    """
+
+    def __init__(self):
+        self._doors = {}
+        self._links = {}
+        self._devices = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def link(self, opDev, linkedDevs):
+        """
+        Link an opener device to the devices in linkedDevs, a dictionary of
+        device objects keyed by monitored device type id.  Replace any prior
+        links for the opener.
+        """
+        opDevId = opDev.id
+        self.unlink(opDevId)
+        door = self._doors[opDevId] = {'op': opDevId}
+        self._devices[opDevId] = opDev
+        self._links.setdefault(opDevId, set()).add(opDevId)
+        for typeId, dev in linkedDevs.items():
+            door[typeId] = dev.id
+            self._devices[dev.id] = dev
+            self._links.setdefault(dev.id, set()).add(opDevId)
+
+    def unlink(self, opDevId):
+        """
+        Remove the links for an opener device.  Discard the cached objects of
+        devices that are no longer linked to any opener.
+        """
+        door = self._doors.pop(opDevId, None)
+        if not door:
+            return
+        for devId in door.values():
+            opDevIds = self._links.get(devId)
+            if opDevIds:
+                opDevIds.discard(opDevId)
+                if not opDevIds:
+                    del self._links[devId]
+                    self._devices.pop(devId, None)
+
+    def refresh(self, dev):
+        """ Replace the cached object for a linked device. """
+        if dev.id in self._devices:
+            self._devices[dev.id] = dev
+
+    def get(self, devId):
+        """
+        Return the cached object for a linked device or None if the device is
+        not linked.
+        """
+        dev = self._devices.get(devId)
+        if dev is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return dev
+
+    def linked(self, devId, typeId):
+        """
+        Return the id of the device with the type id typeId that is linked to
+        the same door as the device devId (e.g., linked(vlDevId, 'op') is the
+        opener device id for a virtual lock).  Return None if there is no such
+        device.
+        """
+        for opDevId in self._links.get(devId, ()):
+            linkedDevId = self._doors[opDevId].get(typeId)
+            if linkedDevId is not None:
+                return linkedDevId
+        return None
+
+    def report(self):
+        """ Return a list of report lines with the cache counts. """
+        return ['Device cache:',
+                '    %-28s %9s %9s %9s %9s'
+                % ('device handles', 'doors', 'devices', 'hits', 'misses'),
+                '    %-28s %9i %9i %9i %9i'
+                % ('', len(self._doors), len(self._devices), self.hits,
+                   self.misses)]
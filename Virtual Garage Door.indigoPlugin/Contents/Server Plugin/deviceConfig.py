@@ -0,0 +1,274 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                           MODULE deviceConfig.py                            #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  deviceConfig.py
+   TITLE:  Parsed opener/virtual lock device configuration
+FUNCTION:  Parses the pluginProps of an opener or virtual lock device once and
+           saves the typed values for use by plugin.py and
+           virtualGarageDoor.py.
+   USAGE:  deviceConfig.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A DeviceConfig instance is created by the Plugin
+           deviceStartComm method for each opener and virtual lock device.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE deviceConfig.py DESCRIPTION:
+
+The Indigo server returns a new copy of the pluginProps dictionary each time
+the pluginProps attribute of a device object is accessed, and all numeric
+ConfigUI values are saved as text.  The DeviceConfig class reads the
+pluginProps of an opener or virtual lock device once and converts the values
+to Python types: device ids are int or None, delay times are float, and
+checkboxes are bool.  Keys that are missing from the pluginProps of devices
+created by older plugin versions are given default values.
+
+A DeviceConfig instance is immutable by convention.  Any change in the device
+pluginProps causes the Indigo server to call the Plugin
+didDeviceCommPropertyChange method, which creates a new DeviceConfig instance.
+The device is restarted only if the doorModel method returns a different
+value for the new instance; otherwise, the new instance replaces the old one
+in the running device.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  (1) Initial version.
+                    (2) Add the ttBuiltIn field for the built-in travel timer.
+                    (3) Add the debounceTimes field for the debouncer.
+                    (4) Add the doorModel method for incremental
+                    reconfiguration.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+
+###############################################################################
+#                                                                             #
+#                             CLASS DeviceConfig                              #
+#                                                                             #
+###############################################################################
+
+class DeviceConfig:
+    """
+    The DeviceConfig class holds the parsed pluginProps values for a single
+    opener or virtual lock device.  Opener device pluginProps include all of
+    the virtual lock fields; virtual lock device pluginProps include only the
+    virtual lock fields and the link to the opener device.  Fields that do not
+    apply to a device type have their default values.
+
+    Monitored device fields (xx is a monitored device type id):
+
+    xxDevId         int device id or None if not selected
+    xxStateName     on/off state name
+    xxInvert        True if the on/off state is inverted
+
+    debounceTimes
+        A {mDevTypeId: (settle, minOn, minOff)} dictionary of debounce times
+        in seconds for the debounced monitored devices (see the debouncer
+        module).  Devices with all zero times are omitted.
+
+    monitoredDevices
+        A tuple of (mDevTypeId, mDevId, mDevStateName, mDevInvert) tuples for
+        the monitored devices that are selected in the ConfigUI, in
+        MONITORED_DEVICE_TYPE_IDs order.
+    """
+
+    ###########################################################################
+    #                                                                         #
+    #                            CLASS DeviceConfig                           #
+    #                                                                         #
+    #                             CLASS CONSTANTS                             #
+    #                                                                         #
+    ###########################################################################
+
+    # Monitored device type ids (see the Plugin class constants).
+
+    MONITORED_DEVICE_TYPE_IDs = ('ar', 'cs', 'os', 'vs', 'tt',
+                                 'vl', 'ls', 'ps', 'ml')
+
+    # Monitored device type ids with debounce time fields (see the debouncer
+    # module).
+
+    DEBOUNCED_DEVICE_TYPE_IDs = ('cs', 'os', 'ls')
+
+    # ttName value for the built-in travel timer (see the travelTimer
+    # module).
+
+    BUILT_IN_TIMER = 'BUILT-IN'
+
+    # Optional action group ids keyed by action.
+
+    ACTION_GROUP_IDs = {'opening':   'oa',
+                        'closing':   'ca',
+                        'locking':   'la',
+                        'unlocking': 'ua'}
+
+    __slots__ = (
+        # Device links:
+        'opDevId',
+        # Monitored devices:
+        'arDevId', 'arStateName', 'arChannel',
+        'csDevId', 'csStateName', 'csInvert',
+        'osDevId', 'osStateName', 'osInvert',
+        'vsDevId', 'vsStateName', 'vsInvert', 'vsResetDelay',
+        'ttDevId', 'ttStateName', 'tTime', 'ttBuiltIn',
+        'vlDevId', 'vlStateName',
+        'lsDevId', 'lsStateName', 'lsInvert',
+        'psDevId', 'psStateName',
+        'mlDevId', 'mlStateName',
+        'monitoredDevices', 'debounceTimes',
+        # Optional actions:
+        'actions', 'unlockBeforeOpening', 'lockAfterClosing',
+        # Logging options:
+        'logDoorStateChanges', 'logLockStateChanges', 'logDoorStateTracks',
+        # Precomputed travel timer expired events:
+        'ttExpEvents')
+
+    ###########################################################################
+    #                                                                         #
+    #                            CLASS DeviceConfig                           #
+    #                                                                         #
+    #                         INITIALIZATION METHODS                          #
+    #                                                                         #
+    #  def __init__(self, pluginProps)                                        #
+    #  def _devId(value)                                                      #
+    #  def _float(value, default=0.0)                                         #
+    #  def doorModel(self)                                                    #
+    #                                                                         #
+    ###########################################################################
+
+    def __init__(self, pluginProps):
+        """
+        Parse the pluginProps dictionary of an opener or virtual lock device.
+        The caller should access dev.pluginProps only once and pass the
+        resulting dictionary.
+        """
+        get = pluginProps.get
+
+        # Device links.
+
+        self.opDevId = self._devId(get('opDevId'))
+
+        # Monitored devices.
+
+        monitoredDevices = []
+        for mDevTypeId in self.MONITORED_DEVICE_TYPE_IDs:
+            mDevId = self._devId(get(mDevTypeId + 'DevId'))
+            mDevStateName = get(mDevTypeId + 'StateName', 'onOffState')
+            mDevInvert = bool(get(mDevTypeId + 'Invert', False))
+            setattr(self, mDevTypeId + 'DevId', mDevId)
+            setattr(self, mDevTypeId + 'StateName', mDevStateName)
+            if mDevTypeId + 'Invert' in self.__slots__:
+                setattr(self, mDevTypeId + 'Invert', mDevInvert)
+            if mDevId is not None:
+                monitoredDevices.append((mDevTypeId, mDevId, mDevStateName,
+                                         mDevInvert))
+        self.monitoredDevices = tuple(monitoredDevices)
+
+        # Debounce times for the selected debounced devices.
+
+        self.debounceTimes = {}
+        for mDevTypeId in self.DEBOUNCED_DEVICE_TYPE_IDs:
+            times = (self._float(get(mDevTypeId + 'Debounce')),
+                     self._float(get(mDevTypeId + 'MinOn')),
+                     self._float(get(mDevTypeId + 'MinOff')))
+            if getattr(self, mDevTypeId + 'DevId') is not None and any(times):
+                self.debounceTimes[mDevTypeId] = times
+
+        # The EasyDAQ channel number is the numeric suffix of the activation
+        # relay state name, e.g., 3 for 'channel03'.
+
+        digits = ''.join(c for c in self.arStateName if c.isdigit())
+        self.arChannel = int(digits) if digits else None
+
+        self.vsResetDelay = int(round(self._float(get('vsResetDelay'))))
+        self.tTime = self._float(get('tTime'), 12.0)
+        self.ttBuiltIn = get('ttName') == self.BUILT_IN_TIMER
+
+        # Optional actions keyed by action: (action group name, delay time).
+
+        self.actions = {action: (get(groupId + 'Name', ''),
+                                 self._float(get(groupId + 'Delay')))
+                        for action, groupId in self.ACTION_GROUP_IDs.items()}
+        self.unlockBeforeOpening = bool(get('unlockBeforeOpening', False))
+        self.lockAfterClosing = bool(get('lockAfterClosing', False))
+
+        # Logging options.
+
+        self.logDoorStateChanges = bool(get('logDoorStateChanges', False))
+        self.logLockStateChanges = bool(get('logLockStateChanges', False))
+        self.logDoorStateTracks = bool(get('logDoorStateTracks', False))
+
+        # Travel timer expired events indexed by the opener direction (0 -->
+        # opening, 1 --> closing).  Qualify the event if there is no sensor to
+        # confirm the end of travel in that direction.
+
+        self.ttExpEvents = (
+            'tt-exp&os-none' if self.osDevId is None else 'tt-exp',
+            'tt-exp&cs-none' if self.csDevId is None else 'tt-exp')
+
+    @staticmethod
+    def _devId(value):
+        """ Return an int device id or None for a null/missing value. """
+        return int(value) if value else None
+
+    @staticmethod
+    def _float(value, default=0.0):
+        """ Return a float value or the default for a null/invalid value. """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
+
+    def doorModel(self):
+        """
+        Return a tuple of the values that define the door model of an opener
+        device: the travel timer expired events (which depend on the presence
+        of the closed and open sensors), the built-in travel timer selection,
+        and the presence of a virtual lock.  A VirtualGarageDoor instance
+        can't be reconfigured for a change in these values; the opener device
+        must be restarted.
+        """
+        return self.ttExpEvents, self.ttBuiltIn, self.vlDevId is not None
@@ -0,0 +1,307 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                           MODULE doorSnapshot.py                            #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  doorSnapshot.py
+   TITLE:  Crash-safe warm-start snapshots of the virtual garage doors
+FUNCTION:  Saves the door status, opener direction, prior event, and open
+           door state track of each VirtualGarageDoor instance in an
+           append-only snapshot file after every accepted transition, and
+           reads the latest snapshot for each door when the plugin starts.
+   USAGE:  doorSnapshot.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A DoorSnapshot instance is created by the Plugin __init__
+           method, loaded by the startup method, and used by the
+           deviceStartComm method to restore the doors.  The
+           VirtualGarageDoor update method records the snapshots.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE doorSnapshot.py DESCRIPTION:
+
+Without a snapshot, the deviceStartComm method sets the startup door status
+from the sensor states (Table 6 in the Design wiki).  The opener direction,
+the prior event, and the door state track are lost, and doors without both
+closed and open sensors start with an assumed status.
+
+The snapshot file is a sequence of JSON lines, one per snapshot:
+
+{"devId": 12345678, "doorStatus": "opening", "openerDirection": 0, ...}
+
+The VirtualGarageDoor update method records a snapshot after every accepted
+transition.  The record method only saves the snapshot in memory and queues
+it; a writer thread appends the queued snapshots to the file and syncs each
+batch to the disk with os.fsync, so the door update lock is never held for
+file I/O and a plugin crash, reload, or host failure loses nothing that was
+written.  Compacted files are synced before they are renamed.  A line that
+was being written when the host failed is incomplete; it is skipped when the
+file is read, and the prior snapshot for the door is used.  A line with only
+a devId deletes the door's snapshot.
+
+The file is read once when the plugin starts.  The latest snapshot for each
+door is kept in memory, and the file is compacted to those snapshots by
+writing a temporary file and renaming it over the snapshot file.  The file is
+also compacted when the number of appended lines exceeds both COMPACT_LINES
+and twice the number of doors, so the cost of a compaction is spread over at
+least as many appends as it writes.
+
+Snapshot times are wall clock times (time.time()) so that they remain valid
+across restarts.  The toWallTime and toMonotonicTime functions convert them
+from and to the monotonic times used by the VirtualGarageDoor class.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import json
+import os
+
+from collections import deque
+from logging import getLogger
+from pathlib import Path
+from threading import Condition, Thread
+from time import monotonic, time
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+COMPACT_LINES = 1000  # Appended lines that trigger a compaction.
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS DoorSnapshot                             #
+#                                                                             #
+###############################################################################
+
+class DoorSnapshot:
+    """
+    The DoorSnapshot class maintains the snapshot file and the latest
+    snapshot for each door.  It has the following structure:
+
+    self._snapshots = {devId: snapshot}
+
+    where devId is the opener device id and snapshot is a dictionary created
+    by the VirtualGarageDoor snapshot method.  Snapshots and deletions are
+    queued in self._pending for the writer thread.  The file is written
+    only by the load method and the writer thread.  If the file can't be
+    read or written, a warning is logged and snapshots are kept only in
+    memory.
+    """
+
+    def __init__(self, path):
+        self._path = Path(path)
+        self._snapshots = {}
+        self._pending = deque()
+        self._file = None
+        self._lines = 0
+        self._condition = Condition()
+        self._thread = None
+        self._running = False
+
+        self.writes = 0
+
+    def load(self):
+        """
+        Read the snapshot file, keep the latest snapshot for each door,
+        compact the file, open it for appending, and start the writer thread.
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._snapshots.clear()
+            try:
+                with open(self._path, encoding='utf-8') as snapshotFile:
+                    for line in snapshotFile:
+                        try:
+                            snapshot = json.loads(line)
+                            devId = snapshot['devId']
+                        except (ValueError, TypeError, KeyError):
+                            continue  # Incomplete or invalid line.
+                        if len(snapshot) > 1:
+                            self._snapshots[devId] = snapshot
+                        else:
+                            self._snapshots.pop(devId, None)
+            except FileNotFoundError:
+                pass
+            except OSError as errorMessage:
+                L.warning('door snapshot read failed: %s', errorMessage)
+            self._compact(list(self._snapshots.values()))
+            self._running = True
+        self._thread = Thread(target=self._run, name='doorSnapshot',
+                              daemon=True)
+        self._thread.start()
+
+    def close(self, timeout=2.0):
+        """
+        Stop the writer thread after it writes the queued snapshots and close
+        the snapshot file.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def get(self, devId):
+        """ Return the latest snapshot for a door or None. """
+        return self._snapshots.get(devId)
+
+    def record(self, snapshot):
+        """
+        Save a new snapshot for a door and queue it for the writer thread.
+        The snapshot must not be changed after it is recorded.
+        """
+        with self._condition:
+            self._snapshots[snapshot['devId']] = snapshot
+            if self._running:
+                self._pending.append(snapshot)
+                self._condition.notify()
+
+    def remove(self, devId):
+        """ Delete the snapshot for a door. """
+        with self._condition:
+            if (self._snapshots.pop(devId, None) is not None
+                    and self._running):
+                self._pending.append({'devId': devId})
+                self._condition.notify()
+
+    def report(self):
+        """ Return a list of report lines with the snapshot counts. """
+        with self._condition:
+            return ['Door snapshot:',
+                    '    %-28s %9s %9s %9s'
+                    % ('snapshots', 'doors', 'writes', 'lines'),
+                    '    %-28s %9i %9i %9i'
+                    % ('', len(self._snapshots), self.writes, self._lines)]
+
+    def _run(self):
+        """
+        Writer thread.  Wait for queued snapshots, append them to the file
+        without holding the lock, and sync the file once per batch.  Compact
+        the file if it has too many lines.  Write the remaining queued
+        snapshots and return when the writer is stopped.
+        """
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+            self._append(batch)
+            with self._condition:
+                if self._lines <= max(COMPACT_LINES,
+                                      2 * len(self._snapshots)):
+                    continue
+                snapshots = list(self._snapshots.values())
+            self._compact(snapshots)
+
+    def _append(self, batch):
+        """ Append a batch of snapshot lines to the file and sync it. """
+        if not self._file:
+            return
+        try:
+            self._file.write(''.join(json.dumps(snapshot,
+                                                separators=(',', ':')) + '\n'
+                                     for snapshot in batch))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as errorMessage:
+            L.warning('door snapshot write failed: %s', errorMessage)
+            self._file = None
+            return
+        with self._condition:
+            self.writes += len(batch)
+            self._lines += len(batch)
+
+    def _compact(self, snapshots):
+        """
+        Replace the snapshot file with the latest snapshot for each door and
+        reopen it for appending.  snapshots is a list of the latest
+        snapshots; snapshots that are queued after it was taken are appended
+        to the compacted file.
+        """
+        if self._file:
+            self._file.close()
+            self._file = None
+        temporaryPath = self._path.with_name(self._path.name + '.tmp')
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporaryPath, 'w', encoding='utf-8') as snapshotFile:
+                for snapshot in snapshots:
+                    snapshotFile.write(json.dumps(snapshot,
+                                                  separators=(',', ':'))
+                                       + '\n')
+                snapshotFile.flush()
+                os.fsync(snapshotFile.fileno())
+            os.replace(temporaryPath, self._path)
+            self._file = open(self._path, 'a', encoding='utf-8')
+            with self._condition:
+                self._lines = len(snapshots)
+        except OSError as errorMessage:
+            L.warning('door snapshot write failed: %s', errorMessage)
+
+
+###############################################################################
+#                                                                             #
+#                                  FUNCTIONS                                  #
+#                                                                             #
+###############################################################################
+
+def toWallTime(monotonicTime):
+    """ Convert a monotonic time to a wall clock time. """
+    return time() - (monotonic() - monotonicTime)
+
+
+def toMonotonicTime(wallTime):
+    """ Convert a wall clock time to a monotonic time. """
+    return monotonic() - (time() - wallTime)
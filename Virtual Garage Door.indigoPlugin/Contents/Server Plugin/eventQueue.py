@@ -0,0 +1,278 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                            MODULE eventQueue.py                             #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  eventQueue.py
+   TITLE:  Per-door ordered processing of monitored device events
+FUNCTION:  Processes the monitored device events for all opener devices on a
+           pool of worker threads.  The events for each door are processed
+           strictly in order on one worker; the events for different doors
+           are processed in parallel on different workers.  Keeps queue depth
+           and wait time metrics.
+   USAGE:  eventQueue.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  An EventQueue instance is created by the Plugin __init__
+           method with the number of workers in the eventWorkers plugin
+           preference, started by the Plugin startup method, and stopped by
+           the Plugin shutdown method.  Events are put in the queue by the
+           Plugin deviceUpdated method and by the built-in travel timer.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE eventQueue.py DESCRIPTION:
+
+Prior to v1.6.0 the Plugin deviceUpdated method called the VirtualGarageDoor
+update method inline.  The transition methods make server calls (e.g.,
+indigo.device.lock and the Timers and Pesters timer actions), so one slow
+door delayed the delivery of every other device update to the plugin.
+
+With the EventQueue class, deviceUpdated only classifies a device update as
+a monitored device event and puts it in the queue.  The queue is divided into
+shards, one for each worker thread.  A door key (the opener device id) is
+always assigned to the same shard, so the events for a door are processed
+in the order that they were put in the queue.  Doors in different shards are
+processed in parallel.  Each queued event is a tuple:
+
+(putTime, key, function, args)
+
+where putTime is the perf_counter time that the event was put in the queue
+and function(*args) processes the event (normally vgd.update(event)).
+
+If the number of workers is zero, put calls the function immediately on the
+calling thread (the pre-v1.6.0 behavior).
+
+The queue keeps the current and maximum depth and the put and processed
+counts for each shard.  If performance statistics are enabled, the wait time
+of each event (from put to the start of processing) is recorded as the
+queueWait stage in the door's statistics group (see the performanceStats
+module).
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from collections import deque
+from logging import getLogger
+from threading import Condition, Thread
+from time import monotonic, perf_counter
+
+from performanceStats import PerformanceStats
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS EventShard                               #
+#                                                                             #
+###############################################################################
+
+class EventShard:
+    """
+    The queued events, worker thread, and metrics for one shard of the event
+    queue.
+    """
+
+    __slots__ = ('condition', 'events', 'busy', 'thread', 'putCount',
+                 'processedCount', 'maxDepth')
+
+    def __init__(self):
+        self.condition = Condition()
+        self.events = deque()
+        self.busy = False
+        self.thread = None
+        self.putCount = 0
+        self.processedCount = 0
+        self.maxDepth = 0
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS EventQueue                               #
+#                                                                             #
+###############################################################################
+
+class EventQueue:
+    """
+    The EventQueue class maintains the event shards and their worker threads.
+    It has the following structure:
+
+    self._shards = [EventShard, ...]
+
+    A door key is assigned to shard hash(key) % len(self._shards).
+    """
+
+    def __init__(self, workerCount=4, performanceStats=None):
+        self.workerCount = max(0, int(workerCount))
+        self._performanceStats = performanceStats or PerformanceStats()
+        self._shards = [EventShard() for _ in range(self.workerCount)]
+        self._running = False
+
+    def start(self):
+        """ Start the worker threads. """
+        if self._running:
+            return
+        self._running = True
+        for index, shard in enumerate(self._shards):
+            shard.thread = Thread(target=self._run, args=(shard,),
+                                  name='eventWorker%s' % index, daemon=True)
+            shard.thread.start()
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the worker threads and discard all queued events.  Wait up to
+        timeout seconds for each event in progress to complete.
+        """
+        self._running = False
+        pending = 0
+        for shard in self._shards:
+            with shard.condition:
+                pending += len(shard.events)
+                shard.events.clear()
+                shard.condition.notify_all()
+        if pending:
+            L.warning('event queue stopped with %s pending events', pending)
+        for shard in self._shards:
+            if shard.thread:
+                shard.thread.join(timeout)
+                shard.thread = None
+
+    def put(self, key, function, *args):
+        """
+        Put an event for the door identified by key in the queue.  Return
+        without waiting for it to be processed.  Call the function
+        immediately if there are no workers.
+        """
+        if not self._shards:
+            function(*args)
+            return
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.condition:
+            events = shard.events
+            events.append((perf_counter(), key, function, args))
+            shard.putCount += 1
+            if len(events) > shard.maxDepth:
+                shard.maxDepth = len(events)
+            shard.condition.notify()
+
+    def cancel(self, key):
+        """
+        Discard the queued events for a door.  An event that is already being
+        processed is allowed to complete.
+        """
+        if not self._shards:
+            return
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.condition:
+            events = [event for event in shard.events if event[1] != key]
+            if len(events) != len(shard.events):
+                shard.events = deque(events)
+                shard.condition.notify_all()
+
+    def waitUntilIdle(self, timeout=10.0):
+        """
+        Wait until all queued events have been processed.  Return False on
+        timeout.
+        """
+        deadline = monotonic() + timeout
+        for shard in self._shards:
+            with shard.condition:
+                while shard.events or shard.busy:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0.0:
+                        return False
+                    shard.condition.wait(remaining)
+        return True
+
+    def report(self):
+        """
+        Return a list of report lines with the current depth, maximum depth,
+        put count, and processed count for each shard.
+        """
+        lines = ['Event queue (%s workers):' % self.workerCount]
+        if not self._shards:
+            lines.append('    events are processed inline')
+            return lines
+        lines.append('    %-28s %9s %9s %9s %9s'
+                     % ('worker', 'depth', 'max', 'put', 'processed'))
+        for index, shard in enumerate(self._shards):
+            with shard.condition:
+                lines.append('    %-28s %9i %9i %9i %9i'
+                             % ('eventWorker%s' % index, len(shard.events),
+                                shard.maxDepth, shard.putCount,
+                                shard.processedCount))
+        return lines
+
+    def _run(self, shard):
+        """
+        Worker thread for one shard.  Wait for the next event and process it
+        without holding the lock.  Record the event wait time if performance
+        statistics are enabled.  Log and ignore exceptions raised by the
+        event functions.
+        """
+        condition = shard.condition
+        while True:
+            with condition:
+                shard.busy = False
+                condition.notify_all()  # Wake waitUntilIdle callers.
+                while self._running and not shard.events:
+                    condition.wait()
+                if not self._running:
+                    return
+                putTime, key, function, args = shard.events.popleft()
+                shard.busy = True
+                shard.processedCount += 1
+
+            performanceStats = self._performanceStats
+            if performanceStats.enabled:
+                performanceStats.door(key).record(
+                    'queueWait', perf_counter() - putTime)
+            try:
+                function(*args)
+            except Exception as errorMessage:
+                L.error('event processing for device id %s failed: %s',
+                        key, errorMessage)
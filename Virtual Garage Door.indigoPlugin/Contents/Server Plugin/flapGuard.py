@@ -0,0 +1,212 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                            MODULE flapGuard.py                              #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  flapGuard.py
+   TITLE:  Flapping sensor quarantine
+FUNCTION:  Tracks the state change rate of each monitored sensor device,
+           quarantines a sensor that exceeds a configured rate, and readmits
+           it after it has been quiet for a fixed time.
+   USAGE:  flapGuard.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A FlapGuard instance is created by the Plugin __init__
+           method and used by the Plugin deviceUpdated and deviceStartComm
+           methods.  The rate limit is set by the flapLimit plugin
+           preference.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE flapGuard.py DESCRIPTION:
+
+A failing reed switch or wireless binary sensor can change state hundreds of
+times a minute.  Every change is processed by the Plugin deviceUpdated
+method and the VirtualGarageDoor update method, and most of them are logged
+as invalid transitions and published to the Indigo server.
+
+The FlapGuard class keeps the times of the last limit state changes of each
+monitored sensor in a fixed-length deque.  A sensor that changes state more
+than limit times in window seconds is flapping.  The Plugin then quarantines
+it: it removes the sensor's closed, open, vibration, and latch sensor
+subscriptions from the subscriptions dictionary so that their updates are
+ignored, and it reconfigures the opener devices that monitor it in place
+without the sensor.  The door is tracked with the remaining devices as it is
+for missing devices; its status and track are retained.  Subscriptions for
+other device types (e.g., an activation relay on another channel of the same
+device) are kept.  The deviceStartComm method also excludes quarantined
+sensors, and quarantined sensors are never subscribed as sensors.  State
+changes are counted once per device update, however many openers monitor the
+sensor.
+
+While a sensor is quarantined, the Plugin records the time of each change in
+its monitored states with the touch method; other updates (e.g., battery
+level or signal strength) are not counted.  A readmission check runs on the
+Plugin's built-in travel timer thread (see the travelTimer module).  When the
+sensor has been quiet for quietTime seconds it is readmitted.  The Plugin
+reconfigures the opener devices again to resume monitoring it on the timer
+thread with its monitor lock held.  A limit of 0 disables the quarantine.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from collections import deque
+from functools import partial
+from threading import Lock
+from time import monotonic
+
+
+###############################################################################
+#                                                                             #
+#                               CLASS FlapGuard                               #
+#                                                                             #
+###############################################################################
+
+class FlapGuard:
+    """
+    The FlapGuard class tracks the state change rates of monitored sensors
+    and the quarantined sensors.  It has the following structure:
+
+    self._rates = {mDevId: deque of the last limit state change times}
+    self._quarantined = {mDevId: [lastChangeTime, devIds, mDevStateNames]}
+
+    where mDevId is the monitored device id, and devIds and mDevStateNames
+    are tuples of the opener device ids and the state names that were
+    monitored when the device was quarantined.
+    """
+
+    def __init__(self, timer, limit=0, window=60.0, quietTime=60.0):
+        self._timer = timer
+        self._rates = {}
+        self._quarantined = {}
+        self._lock = Lock()
+
+        self.limit = limit
+        self.window = window
+        self.quietTime = quietTime
+        self.quarantines = 0
+        self.readmissions = 0
+
+    def record(self, mDevId):
+        """
+        Record a state change for a monitored sensor.  Return True if the
+        sensor has changed state more than limit times in window seconds.
+        """
+        limit = self.limit
+        if not limit:
+            return False
+        now = monotonic()
+        with self._lock:
+            times = self._rates.get(mDevId)
+            if times is None or times.maxlen != limit:
+                times = self._rates[mDevId] = deque(maxlen=limit)
+            flapping = len(times) == limit and now - times[0] < self.window
+            times.append(now)
+        return flapping
+
+    def quarantine(self, mDevId, devIds, mDevStateNames, readmit):
+        """
+        Quarantine a sensor that is monitored by the opener devices in devIds.
+        Call readmit(mDevId, devIds) on the timer thread when the states in
+        mDevStateNames have been quiet for quietTime seconds.
+        """
+        with self._lock:
+            if mDevId in self._quarantined:
+                return
+            self._quarantined[mDevId] = [monotonic(), devIds, mDevStateNames]
+            self._rates.pop(mDevId, None)
+            self.quarantines += 1
+        self._timer.restart(('quarantine', mDevId), self.quietTime,
+                            partial(self._check, mDevId, readmit))
+
+    def touch(self, oldDev, newDev):
+        """
+        Record the time of a device update for a quarantined sensor if any of
+        its monitored states has changed.
+        """
+        entry = self._quarantined.get(newDev.id)
+        if entry:
+            oldStates, newStates = oldDev.states, newDev.states
+            for mDevStateName in entry[2]:
+                if oldStates.get(mDevStateName) != newStates.get(
+                        mDevStateName):
+                    entry[0] = monotonic()
+                    break
+
+    def isQuarantined(self, mDevId):
+        """ Return True if the sensor is quarantined. """
+        return mDevId in self._quarantined
+
+    def report(self):
+        """ Return a list of report lines with the quarantine counts. """
+        with self._lock:
+            return ['Flap guard:',
+                    '    %-28s %9s %9s %10s %9s'
+                    % ('sensors', 'limit', 'flapped', 'readmitted',
+                       'active'),
+                    '    %-28s %9i %9i %10i %9i'
+                    % ('', self.limit, self.quarantines, self.readmissions,
+                       len(self._quarantined))]
+
+    def _check(self, mDevId, readmit):
+        """
+        Readmission check on the timer thread.  Readmit the sensor if it has
+        been quiet for quietTime seconds; otherwise, check again when it
+        could be.
+        """
+        with self._lock:
+            entry = self._quarantined.get(mDevId)
+            if not entry:
+                return
+            quiet = monotonic() - entry[0]
+            if quiet < self.quietTime:
+                self._timer.restart(('quarantine', mDevId),
+                                    self.quietTime - quiet,
+                                    partial(self._check, mDevId, readmit))
+                return
+            del self._quarantined[mDevId]
+            self.readmissions += 1
+        readmit(mDevId, entry[1])
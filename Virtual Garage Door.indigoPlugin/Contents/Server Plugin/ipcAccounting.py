@@ -0,0 +1,330 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                          MODULE ipcAccounting.py                            #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  ipcAccounting.py
+   TITLE:  Indigo server call (IPC) accounting by plugin entry point
+FUNCTION:  Optionally counts and times the Indigo API calls that are round
+           trips to the Indigo server and attributes them to the plugin
+           entry point (Indigo callback method) that made them.  Reports the
+           calls per invocation for each entry point.
+   USAGE:  ipcAccounting.py is included in the Virtual Garage
+           Door.indigoPlugin bundle.  An IpcAccounting instance is created by
+           the Plugin __init__ method and enabled by the accountServerCalls
+           plugin preference.  The report is logged by the Print Server Call
+           Accounting plugin menu item.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE ipcAccounting.py DESCRIPTION:
+
+The accounting layer is installed only while it is enabled, so it costs
+nothing when it is disabled.  When it is enabled, the install method:
+
+(1) Replaces the indigo.devices, indigo.device, indigo.actionGroup, and
+indigo.server module attributes with ApiProxy objects that count and time
+each method call, item lookup, membership test, and iteration.  The plugin
+modules reference these attributes at call time (e.g., indigo.devices[devId])
+so the proxies see every call.
+
+(2) Wraps the server methods of the indigo.Device class (e.g.,
+updateStatesOnServer and replacePluginPropsOnServer) and the executeAction
+method of the indigo.PluginInfo class.  These are called on device and
+plugin objects that the plugin holds (e.g., the opener device in a state
+mirror or the Timers and Pesters plugin object), so they can't be proxied.
+
+(3) Wraps the plugin entry point methods (the Indigo callback methods listed
+by the Plugin IPC_ENTRY_POINTS constant) with instance attributes that
+count invocations and record the entry point for the duration of the call.
+
+Calls are attributed to the innermost entry point on the calling thread.
+Calls made on other threads (e.g., the event queue workers, the actuation
+scheduler, and the built-in travel timer) are attributed to the thread
+name.  Local attribute reads on
+device objects (states, pluginProps) are not server calls and are not
+counted.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import indigo
+
+from functools import wraps
+from logging import getLogger
+from threading import current_thread, local, Lock
+from time import perf_counter
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+# indigo module attributes that are replaced by ApiProxy objects.
+
+API_OBJECTS = ('devices', 'device', 'actionGroup', 'server')
+
+# Server methods of indigo classes that are wrapped: {className: methodNames}.
+
+API_METHODS = {'Device': ('updateStateOnServer', 'updateStatesOnServer',
+                          'updateStateImageOnServer',
+                          'replacePluginPropsOnServer', 'replaceOnServer',
+                          'refreshFromServer'),
+               'PluginInfo': ('executeAction',)}
+
+
+###############################################################################
+#                                                                             #
+#                               CLASS ApiProxy                                #
+#                                                                             #
+###############################################################################
+
+class ApiProxy:
+    """
+    Proxy for an indigo module API object (e.g., indigo.devices).  Method
+    calls, item lookups, membership tests, and iterations are counted and
+    timed by the IpcAccounting instance under the names 'name.method',
+    'name[]', 'name in', and 'name iter'.  Other attributes are returned
+    unchanged.
+    """
+
+    def __init__(self, target, name, accounting):
+        self._target = target
+        self._name = name
+        self._accounting = accounting
+
+    def __getattr__(self, attrName):
+        value = getattr(self._target, attrName)
+        if callable(value):
+            return self._accounting.counted('%s.%s' % (self._name, attrName),
+                                            value)
+        return value
+
+    def __getitem__(self, key):
+        startTime = perf_counter()
+        try:
+            return self._target[key]
+        finally:
+            self._accounting.record(self._name + '[]',
+                                    perf_counter() - startTime)
+
+    def __contains__(self, key):
+        startTime = perf_counter()
+        try:
+            return key in self._target
+        finally:
+            self._accounting.record(self._name + ' in',
+                                    perf_counter() - startTime)
+
+    def __iter__(self):
+        startTime = perf_counter()
+        try:
+            items = list(self._target)
+        finally:
+            self._accounting.record(self._name + ' iter',
+                                    perf_counter() - startTime)
+        return iter(items)
+
+    def __len__(self):
+        return len(self._target)
+
+
+###############################################################################
+#                                                                             #
+#                             CLASS IpcAccounting                             #
+#                                                                             #
+###############################################################################
+
+class IpcAccounting:
+    """
+    Server call counts and times by entry point.  It has the following
+    structure:
+
+    self._entryPoints = {entryPoint: [invocations, {callName: [count,
+                                                               seconds]}]}
+    self._saved = {(owner, attrName): original value}
+
+    where entryPoint is a Plugin method name or a thread name.  The per
+    thread entry point stack is kept in thread-local storage.
+    """
+
+    def __init__(self, plugin, entryPointNames):
+        self._plugin = plugin
+        self._entryPointNames = entryPointNames
+        self._entryPoints = {}
+        self._saved = {}
+        self._local = local()
+        self._lock = Lock()
+
+    @property
+    def enabled(self):
+        return bool(self._saved)
+
+    def enable(self, enabled):
+        """ Install or uninstall the accounting layer. """
+        if enabled and not self._saved:
+            self._install()
+            L.info('server call accounting enabled')
+        elif not enabled and self._saved:
+            self._uninstall()
+            L.info('server call accounting disabled')
+
+    def counted(self, callName, function):
+        """ Return a wrapper that counts and times calls to a function. """
+        @wraps(function)
+        def countedFunction(*args, **kwargs):
+            startTime = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(callName, perf_counter() - startTime)
+        return countedFunction
+
+    def record(self, callName, seconds):
+        """ Attribute one server call to the current entry point. """
+        stack = getattr(self._local, 'stack', None)
+        entryPoint = stack[-1] if stack else current_thread().name
+        with self._lock:
+            entry = self._entryPoints.get(entryPoint)
+            if entry is None:
+                entry = self._entryPoints[entryPoint] = [0, {}]
+            calls = entry[1].get(callName)
+            if calls is None:
+                calls = entry[1][callName] = [0, 0.0]
+            calls[0] += 1
+            calls[1] += seconds
+
+    def report(self):
+        """
+        Return a list of report lines with the invocations, server calls,
+        calls per invocation, and server time per invocation for each entry
+        point followed by the count and mean time for each call name.
+        """
+        lines = ['Server call accounting (%s)'
+                 % ('enabled' if self.enabled else 'disabled')]
+        with self._lock:
+            entryPoints = sorted(
+                (entryPoint, invocations, dict(calls))
+                for entryPoint, (invocations, calls)
+                in self._entryPoints.items())
+        if not entryPoints:
+            lines.append('    no server calls')
+            return lines
+        lines.append('    %-32s %9s %9s %9s %9s'
+                     % ('entry point / call', 'invoked', 'calls',
+                        'calls/inv', 'ms/inv'))
+        for entryPoint, invocations, calls in entryPoints:
+            callCount = sum(count for count, seconds in calls.values())
+            callTime = sum(seconds for count, seconds in calls.values())
+            divisor = invocations or 1  # Thread entry points have none.
+            lines.append('    %-32s %9s %9i %9.2f %9.3f'
+                         % (entryPoint, invocations or '-', callCount,
+                            callCount / divisor, callTime / divisor * 1e3))
+            for callName, (count, seconds) in sorted(calls.items()):
+                lines.append('      %-30s %9s %9i %9.2f %9.3f'
+                             % (callName, '', count, count / divisor,
+                                seconds / divisor * 1e3))
+        return lines
+
+    def _enter(self, entryPoint):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(entryPoint)
+        with self._lock:
+            entry = self._entryPoints.get(entryPoint)
+            if entry is None:
+                entry = self._entryPoints[entryPoint] = [0, {}]
+            entry[0] += 1
+
+    def _exit(self):
+        self._local.stack.pop()
+
+    def _entryPoint(self, entryPoint, method):
+        """ Return a wrapper that records an entry point invocation. """
+        @wraps(method)
+        def entryPointMethod(*args, **kwargs):
+            self._enter(entryPoint)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._exit()
+        return entryPointMethod
+
+    def _install(self):
+        """
+        Replace the indigo API objects with proxies, wrap the indigo class
+        server methods, and wrap the plugin entry point methods.
+        """
+        for name in API_OBJECTS:
+            target = getattr(indigo, name)
+            self._saved[(indigo, name)] = target
+            setattr(indigo, name, ApiProxy(target, name, self))
+
+        for className, methodNames in API_METHODS.items():
+            cls = getattr(indigo, className, None)
+            for methodName in methodNames:
+                method = getattr(cls, methodName, None)
+                if method is None:
+                    continue
+                self._saved[(cls, methodName)] = method
+                setattr(cls, methodName,
+                        self.counted('%s.%s' % (className, methodName),
+                                     method))
+
+        plugin = self._plugin
+        for entryPoint in self._entryPointNames:
+            method = getattr(plugin, entryPoint)
+            self._saved[(plugin, entryPoint)] = None  # Instance attribute.
+            setattr(plugin, entryPoint, self._entryPoint(entryPoint, method))
+
+    def _uninstall(self):
+        """ Restore the saved indigo API objects and methods. """
+        for (owner, attrName), value in self._saved.items():
+            if value is None:
+                delattr(owner, attrName)
+            else:
+                setattr(owner, attrName, value)
+        self._saved.clear()
@@ -0,0 +1,169 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                            MODULE menuIndex.py                              #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  menuIndex.py
+   TITLE:  Cached device name index for ConfigUI selection menus
+FUNCTION:  Maintains a sorted list of device names for each device selection
+           menu type so that ConfigUI menus are generated without iterating
+           the Indigo devices dictionary.
+   USAGE:  menuIndex.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A MenuIndex instance is created by the Plugin __init__
+           method, built by the Plugin startup method, updated by the Plugin
+           deviceCreated, deviceDeleted, and deviceUpdated methods, and used
+           by the Plugin getMenuList method.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE menuIndex.py DESCRIPTION:
+
+Prior to v1.6.0 the Plugin getMenuList method iterated the entire Indigo
+devices dictionary and tested each device type id for membership in a tuple
+every time a ConfigUI menu was drawn.  The opener device ConfigUI has nine
+device selection menus, so opening the dialog on a server with thousands of
+devices took several seconds.
+
+The MenuIndex class converts the device type id tuples to frozensets and
+builds a sorted list of device names for each menu type in a single pass over
+the devices dictionary.  The lists are then maintained incrementally using
+bisect as devices are created, deleted, renamed, or retyped.  Menus are
+generated directly from the sorted lists.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from bisect import bisect_left, insort
+from logging import getLogger
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                               CLASS MenuIndex                               #
+#                                                                             #
+###############################################################################
+
+class MenuIndex:
+    """
+    The MenuIndex class holds a sorted device name list for each menu type
+    and the indexed name and device type id for each device.  It has the
+    following structure:
+
+    self._typeIds = {menuType: frozenset(deviceTypeIds)}
+    self._names = {menuType: [sorted device names]}
+    self._devices = {devId: (name, deviceTypeId)}
+
+    A device is included in the name list of every menu type whose device
+    type ids include the device type id.  Devices with no matching menu type
+    are not indexed.
+    """
+
+    def __init__(self, deviceTypeIds):
+        """
+        Convert the device type id tuples in the deviceTypeIds dictionary
+        (keyed by menu type) to frozensets and create empty name lists.
+        """
+        self._typeIds = {menuType: frozenset(typeIds)
+                         for menuType, typeIds in deviceTypeIds.items()}
+        self._names = {menuType: [] for menuType in self._typeIds}
+        self._devices = {}
+        self.built = False
+
+    def build(self, devices):
+        """
+        Rebuild the index from an iterable of device objects (normally the
+        Indigo devices dictionary) in a single pass.
+        """
+        names = {menuType: [] for menuType in self._typeIds}
+        self._devices = {}
+        for dev in devices:
+            menuTypes = self._menuTypes(dev.deviceTypeId)
+            if menuTypes:
+                self._devices[dev.id] = (dev.name, dev.deviceTypeId)
+                for menuType in menuTypes:
+                    names[menuType].append(dev.name)
+        for nameList in names.values():
+            nameList.sort()
+        self._names = names
+        self.built = True
+        L.debug('menu index built with %s devices', len(self._devices))
+
+    def add(self, dev):
+        """ Add a new device to the name lists of its menu types. """
+        menuTypes = self._menuTypes(dev.deviceTypeId)
+        if menuTypes:
+            self._devices[dev.id] = (dev.name, dev.deviceTypeId)
+            for menuType in menuTypes:
+                insort(self._names[menuType], dev.name)
+
+    def remove(self, devId):
+        """ Remove a device from the name lists of its menu types. """
+        entry = self._devices.pop(devId, None)
+        if entry:
+            name, deviceTypeId = entry
+            for menuType in self._menuTypes(deviceTypeId):
+                nameList = self._names[menuType]
+                index = bisect_left(nameList, name)
+                if index < len(nameList) and nameList[index] == name:
+                    del nameList[index]
+
+    def update(self, dev):
+        """ Reindex a device whose name or device type id has changed. """
+        self.remove(dev.id)
+        self.add(dev)
+
+    def names(self, menuType):
+        """ Return the sorted device names for a menu type. """
+        return self._names[menuType]
+
+    def _menuTypes(self, deviceTypeId):
+        """ Return the menu types that include the device type id. """
+        return [menuType for menuType, typeIds in self._typeIds.items()
+                if deviceTypeId in typeIds]
@@ -0,0 +1,280 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                        MODULE performanceStats.py                           #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  performanceStats.py
+   TITLE:  Hot-path counters and latency histograms
+FUNCTION:  Collects per-stage call counts and fixed-bucket latency histograms
+           for the Plugin deviceUpdated method and for each opener device's
+           VirtualGarageDoor update, transition, and state publishing
+           methods.  Renders the statistics per door and in aggregate.
+   USAGE:  performanceStats.py is included in the Virtual Garage
+           Door.indigoPlugin bundle.  A PerformanceStats instance is created
+           by the Plugin __init__ method and enabled by the
+           collectPerformanceStats plugin preference.  The statistics are
+           logged by the Print Performance Statistics plugin menu item.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE performanceStats.py DESCRIPTION:
+
+The statistics are organized in StatsGroup instances: one for the plugin
+(the deviceUpdated stage) and one for each opener device (the queueWait,
+update, _updateOpenerStatesOnServer, and transition method stages).  Each
+stage has a StageStats instance with a call count, total and maximum times,
+and a histogram with the fixed bucket bounds in LATENCY_BOUNDS.  Groups also
+hold named event counters (e.g., ignored or rejected events).
+
+Stages and counters are created when they are first recorded.  After that,
+recording a time is a dictionary lookup, a bisect of the bucket bounds, and
+in-place integer and float updates; no containers are allocated per event.
+Callers check the enabled attribute before reading the clock, so the cost
+when statistics are disabled is a single attribute test per stage.
+
+Percentiles are estimated from the histograms and reported as the upper
+bound of the bucket that contains them.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from bisect import bisect_right
+
+# Histogram bucket upper bounds in seconds (1 us to 1 s).  Times greater than
+# the last bound are counted in an overflow bucket.
+
+LATENCY_BOUNDS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4,
+                  1e-3, 2e-3, 5e-3, 1e-2, 2e-2, 5e-2, 1e-1, 2e-1, 5e-1, 1.0)
+
+# Report order for the outer stages.  Other stages (transition methods) follow
+# in name order.
+
+STAGE_ORDER = ('deviceUpdated', 'queueWait', 'update',
+               '_updateOpenerStatesOnServer')
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS StageStats                               #
+#                                                                             #
+###############################################################################
+
+class StageStats:
+    """
+    Call count, total and maximum times, and latency histogram for one stage.
+    buckets[i] counts the times t with LATENCY_BOUNDS[i - 1] < t <=
+    LATENCY_BOUNDS[i]; the last bucket counts the overflow.
+    """
+
+    __slots__ = ('count', 'total', 'maximum', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.buckets = [0] * (len(LATENCY_BOUNDS) + 1)
+
+    def record(self, seconds):
+        """ Record one stage execution time. """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self.buckets[bisect_right(LATENCY_BOUNDS, seconds)] += 1
+
+    def merge(self, other):
+        """ Add the statistics of another StageStats instance. """
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+
+    def percentile(self, fraction):
+        """
+        Return the upper bound of the histogram bucket that contains the
+        fraction percentile.  Return the maximum time for the overflow bucket.
+        """
+        target = fraction * self.count
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            cumulative += count
+            if count and cumulative >= target:
+                if index < len(LATENCY_BOUNDS):
+                    return LATENCY_BOUNDS[index]
+                break
+        return self.maximum
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS StatsGroup                               #
+#                                                                             #
+###############################################################################
+
+class StatsGroup:
+    """
+    Stage statistics and event counters for the plugin or one opener device.
+    It has the following structure:
+
+    self.stages = {stageName: StageStats}
+    self.counters = {counterName: count}
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+
+    def record(self, stageName, seconds):
+        """ Record one execution time for a stage. """
+        stageStats = self.stages.get(stageName)
+        if stageStats is None:
+            stageStats = self.stages[stageName] = StageStats()
+        stageStats.record(seconds)
+
+    def count(self, counterName):
+        """ Increment an event counter. """
+        self.counters[counterName] = self.counters.get(counterName, 0) + 1
+
+    def merge(self, other):
+        """ Add the statistics and counters of another group. """
+        for stageName, stageStats in other.stages.items():
+            if stageName not in self.stages:
+                self.stages[stageName] = StageStats()
+            self.stages[stageName].merge(stageStats)
+        for counterName, count in other.counters.items():
+            self.counters[counterName] = (self.counters.get(counterName, 0)
+                                          + count)
+
+    def render(self, title):
+        """
+        Return a list of report lines for the group: a title line, one line
+        per stage with the count, mean, p50, p99, and maximum times in
+        microseconds, and a line with the counters.
+        """
+        lines = ['%s:' % title]
+        if not self.stages and not self.counters:
+            lines.append('    no statistics')
+            return lines
+        if self.stages:
+            lines.append('    %-28s %9s %9s %9s %9s %9s'
+                         % ('stage (us)', 'count', 'mean', 'p50<=', 'p99<=',
+                            'max'))
+        for stageName in sorted(self.stages, key=self._stageKey):
+            stageStats = self.stages[stageName]
+            count = stageStats.count
+            lines.append('    %-28s %9i %9.1f %9.1f %9.1f %9.1f'
+                         % (stageName, count,
+                            stageStats.total / count * 1e6 if count else 0.0,
+                            stageStats.percentile(0.50) * 1e6,
+                            stageStats.percentile(0.99) * 1e6,
+                            stageStats.maximum * 1e6))
+        if self.counters:
+            lines.append('    counters: ' + ', '.join(
+                '%s %s' % item for item in sorted(self.counters.items())))
+        return lines
+
+    @staticmethod
+    def _stageKey(stageName):
+        """ Sort key for the report order of a stage. """
+        if stageName in STAGE_ORDER:
+            return STAGE_ORDER.index(stageName), ''
+        return len(STAGE_ORDER), stageName
+
+
+###############################################################################
+#                                                                             #
+#                           CLASS PerformanceStats                            #
+#                                                                             #
+###############################################################################
+
+class PerformanceStats:
+    """
+    Plugin-wide performance statistics.  It has the following structure:
+
+    self.enabled = True if statistics are collected
+    self.plugin = StatsGroup for the Plugin methods
+    self.doors = {devId: StatsGroup for the opener device}
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = bool(enabled)
+        self.plugin = StatsGroup()
+        self.doors = {}
+
+    def door(self, devId):
+        """
+        Return the statistics group for an opener device.  Create it if
+        necessary.  The group is retained when the device is restarted.
+        """
+        group = self.doors.get(devId)
+        if group is None:
+            group = self.doors[devId] = StatsGroup()
+        return group
+
+    def removeDoor(self, devId):
+        """ Discard the statistics group for a deleted opener device. """
+        self.doors.pop(devId, None)
+
+    def report(self, names):
+        """
+        Return a list of report lines for the plugin, each opener device in
+        name order, and all opener devices in aggregate.  names is a
+        dictionary of opener device names keyed by device id.
+        """
+        lines = ['Performance statistics (collection %s)'
+                 % ('enabled' if self.enabled else 'disabled')]
+        lines.extend(self.plugin.render('Plugin'))
+        aggregate = StatsGroup()
+        for devId, group in sorted(
+                self.doors.items(),
+                key=lambda item: names.get(item[0], str(item[0]))):
+            lines.extend(group.render('"%s"' % names.get(devId, devId)))
+            aggregate.merge(group)
+        lines.extend(aggregate.render('All openers (%s)' % len(self.doors)))
+        return lines
@@ -16,8 +16,8 @@ FUNCTION:  plugin.py defines the Plugin class, with standard methods that
    USAGE:  plugin.py is included in the Virtual Garage Door.indigoPlugin bundle
            and its methods are called by the Indigo server.
   AUTHOR:  papamac
- VERSION:  1.5.1
-    DATE:  August 31, 2025
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
 
 UNLICENSE:
 
@@ -347,6 +347,135 @@ v1.5.0    8/4/2025  (1) Replace the opener device STOPPED and REVERSING states
                     checkbox field in the lock device ConfigUI.
 v1.5.1   8/31/2025  Fix bug in monitored device validation for the device name
                     and state name.
+v1.6.0  10/16/2026  (1) Add a reverse index (subscriptions dictionary) that maps
+                    monitored device ids to the opener devices that monitor
+                    them.  Use it in the deviceUpdated method to reject
+                    unrelated device updates with a single dictionary lookup
+                    and to dispatch monitored device events directly to the
+                    subscribing VirtualGarageDoor instances.
+                    (2) Parse the opener and virtual lock device pluginProps
+                    once in deviceStartComm into DeviceConfig objects (new
+                    deviceConfig.py module) with typed values.  Use the parsed
+                    configurations in VirtualGarageDoor instances and in the
+                    action paths instead of re-reading and re-parsing
+                    pluginProps.  Fix the EasyDAQ activation relay channel
+                    lookup that referenced the obsolete 'arState' prop.
+                    (3) Publish the changed virtual lock device states in a
+                    single updateStatesOnServer call using StateMirror
+                    instances (new stateMirror.py module) and skip unchanged
+                    states and state images.
+                    (4) Pass the startup virtual lock state to the
+                    VirtualGarageDoor instance and use its in-memory lock
+                    state for the startup consistency check.  Add the missing
+                    device name argument to the startup "LOCKED, but not
+                    CLOSED" warning.
+                    (5) Replace the blocking sleeps in the open, close, lock,
+                    and unlock actions with an actuation scheduler (new
+                    actuationScheduler.py module).  The actions schedule
+                    per-door sequences of relay, action group, delay, and
+                    physical lock steps and return immediately.  Multiple
+                    doors are actuated concurrently while the steps for each
+                    door are executed in order.  Start the scheduler in a new
+                    startup method and stop it in a new shutdown method.
+                    (6) Replace the 100 x 1 ms polling of physical lock
+                    devices with a scheduler wait that is signalled by the
+                    deviceUpdated method when a ps or ml device reaches its
+                    target state.  Add a configurable physical lock timeout
+                    (plTimeout) to the plugin preferences.
+                    (7) Add a built-in travel timer (new travelTimer.py module)
+                    as a 'BUILT-IN' option in the travel timer menu.  The
+                    built-in timer delivers tt-exp events directly to the
+                    VirtualGarageDoor instance with millisecond resolution.
+                    Timer devices remain available as a fallback.
+                    (8) Generate the ConfigUI device selection menus from a
+                    cached menu index (new menuIndex.py module) with a sorted
+                    device name list for each menu type.  Build the index in
+                    the startup method and maintain it incrementally in new
+                    deviceCreated and deviceDeleted methods and in the
+                    deviceUpdated method for device name changes.
+                    (9) Replace the nested loops in the validateDeviceConfigUi
+                    device/state uniqueness check with an ownership dictionary
+                    lookup.  Name the opener device that already owns the
+                    device/state pair in the error message.
+                    (10) Add optional hot-path performance statistics (new
+                    performanceStats.py module) with per-stage counters and
+                    fixed-bucket latency histograms for the deviceUpdated
+                    method and the VirtualGarageDoor update, transition, and
+                    state publishing methods.  Enable them with a new
+                    collectPerformanceStats plugin preference and log them
+                    per door and in aggregate with a new Print Performance
+                    Statistics plugin menu item (new Part VII).
+                    (11) Add optional server call (IPC) accounting (new
+                    ipcAccounting.py module) that counts and times the Indigo
+                    API calls made by each plugin entry point.  Enable it
+                    with a new accountServerCalls plugin preference and log
+                    the calls per invocation with a new Print Server Call
+                    Accounting plugin menu item.
+                    (12) Process monitored device events on a pool of event
+                    worker threads (new eventQueue.py module) instead of
+                    inline in the deviceUpdated method.  deviceUpdated only
+                    classifies a device update and queues the event.  Events
+                    for each door are processed strictly in order; events for
+                    different doors are processed in parallel.  Set the
+                    number of workers with a new eventWorkers plugin
+                    preference (0 processes events inline).  Log the queue
+                    depths with the performance statistics and record the
+                    event wait times per door.
+                    (13) Execute the server commands issued by the
+                    VirtualGarageDoor transition methods on a command
+                    dispatcher thread (new commandDispatcher.py module) with
+                    per-door ordering.  Coalesce superseded commands for the
+                    same target (e.g., a restartTimer followed by a
+                    stopTimer).  Log the submitted, executed, coalesced,
+                    dropped, and failed command counts with the performance
+                    statistics.
+                    (14) Debounce the closed, open, and latch sensors with
+                    per-device settle, minimum on, and minimum off times (new
+                    debouncer.py module) before their events are queued.
+                    Validate the new ConfigUI time fields and copy the latch
+                    sensor times to the virtual lock props.  The 1-second
+                    duplicate event check in the VirtualGarageDoor update
+                    method is skipped for debounced devices.
+                    (15) Quarantine closed, open, vibration, and latch sensors
+                    that change state more than a configured number of times
+                    a minute (new flapGuard.py module and flapLimit plugin
+                    preference).  Remove a quarantined sensor from the
+                    subscriptions dictionary and reconfigure its opener
+                    devices without it so that the door is tracked with the
+                    remaining devices.  Readmit the sensor and reconfigure
+                    the opener devices again when it has been quiet for a
+                    minute.
+                    (16) Add an optional per-door event reorder buffer (new
+                    reorderBuffer.py module and reorderWindow plugin
+                    preference) in front of the event queue.  Events that
+                    arrive within the window are sorted by the lastChanged
+                    times of their source devices and passed to the
+                    VirtualGarageDoor update method with their change times.
+                    Log the window and reorder counts with the performance
+                    statistics.
+                    (17) Restore each door from a crash-safe warm-start
+                    snapshot (new doorSnapshot.py module) in deviceStartComm
+                    if the snapshot agrees with the startup sensor states.
+                    Determine the startup door state from the sensor states
+                    (Table 6) and log its warnings only if it does not.
+                    (18) Reconfigure started devices in place when their
+                    pluginProps or names change.  Restart a device only if
+                    its door model changes.  Rebuild the monitored devices
+                    dictionary entry for an opener only if a monitored device
+                    is added, removed, or changed.  Move the configuration
+                    parsing and monitored device selection from
+                    deviceStartComm to new _parseConfig and _monitorDevices
+                    methods.
+                    (19) Add a door link index and cached device handles (new
+                    deviceCache.py module) that are refreshed by
+                    deviceUpdated.  Evaluate the open, close, lock, and
+                    unlock action preconditions from the cached devices and
+                    the in-memory door state without server reads.
+                    (20) Add an activation relay driver registry (new
+                    actuatorDrivers.py module) keyed by device type id.
+                    Resolve the driver, plugin, and channel for each opener
+                    once in _monitorDevices and use the resolved press steps
+                    in _activationRelaySteps.
 """
 ###############################################################################
 #                                                                             #
@@ -355,14 +484,31 @@ v1.5.1   8/31/2025  Fix bug in monitored device validation for the device name
 ###############################################################################
 
 __author__ = 'papamac'
-__version__ = '1.5.1'
-__date__ = 'August 31, 2025'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
 
 import indigo
 
+from functools import partial
 from logging import getLogger, NOTSET
-from time import sleep
-
+from threading import RLock
+from time import perf_counter, time
+
+from actuationScheduler import ActuationScheduler
+from actuatorDrivers import DriverRegistry, EasyDaqDriver
+from commandDispatcher import CommandDispatcher
+from debouncer import Debouncer
+from deviceCache import DeviceCache
+from deviceConfig import DeviceConfig
+from doorSnapshot import DoorSnapshot
+from eventQueue import EventQueue
+from flapGuard import FlapGuard
+from ipcAccounting import IpcAccounting
+from menuIndex import MenuIndex
+from performanceStats import PerformanceStats
+from reorderBuffer import ReorderBuffer
+from stateMirror import StateMirror
+from travelTimer import TravelTimer
 from virtualGarageDoor import VirtualGarageDoor
 
 L = getLogger('Plugin')  # Standard Plugin logger.
@@ -378,14 +524,15 @@ class Plugin(indigo.PluginBase):
     """
     The Plugin class is a collection of standard Indigo plugin and supporting
     methods that are needed to manage/operate multiple door lock/opener
-    devices.  It is segmented into six major parts for readability:
+    devices.  It is segmented into seven major parts for readability:
 
     I   CLASS CONSTANTS,
     II  UTILITY METHODS,
     III STANDARD INDIGO INITIALIZATION, STARTUP, AND RUN/STOP METHODS,
     IV  CONFIG UI VALIDATION METHODS,
-    V   CONFIG UI CALLBACK METHODS, and
-    VI  ACTION CALLBACK METHODS
+    V   CONFIG UI CALLBACK METHODS,
+    VI  ACTION CALLBACK METHODS, and
+    VII MENU ITEM CALLBACK METHODS
 
     A word on class Plugin device references...
 
@@ -417,6 +564,15 @@ class Plugin(indigo.PluginBase):
     # Miscellaneous:
 
     AR_CLOSURE_TIME = 0.8  # Activation relay momentary closure time (seconds).
+    PL_TIMEOUT = 10.0      # Default physical lock timeout (seconds).
+    LOCK_SEQUENCES = ('locking', 'unlocking')  # Exclusive action sequences.
+    EVENT_WORKERS = 4      # Default number of event worker threads.
+    MAX_EVENT_WORKERS = 16
+    FLAP_LIMIT = 60        # Default sensor state changes per flap window.
+    MAX_FLAP_LIMIT = 1000
+    FLAP_WINDOW = 60.0     # Flapping sensor rate window (seconds).
+    FLAP_QUIET_TIME = 60.0  # Quiet time to readmit a flapping sensor.
+    MAX_REORDER_WINDOW = 1000  # Maximum event reorder window (ms).
     ON, OFF = (True, False)
 
     # Door state/status definitions:
@@ -456,6 +612,11 @@ class Plugin(indigo.PluginBase):
     UNLOCKED, LOCKED = (False, True)
     LOCK_STATUS = ('unlocked', 'locked')
 
+    # Virtual lock device state keys that are published by the
+    # _updateVirtualLockStatesOnServer method.
+
+    VIRTUAL_LOCK_STATE_KEYS = ('onOffState', 'lockStatus')
+
     # Timer and virtual lock constants.
 
     TIMER_PLUGIN_ID = 'com.perceptiveautomation.indigoplugin.timersandpesters'
@@ -476,6 +637,11 @@ class Plugin(indigo.PluginBase):
         'ps',  # 8. power switch
         'ml')  # 9. mechanical lock
 
+    # Monitored sensor device type ids that can be quarantined for flapping
+    # in the deviceUpdated method (see the flapGuard module).
+
+    FLAP_GUARDED_DEVICE_TYPE_IDs = ('cs', 'os', 'vs', 'ls')
+
     # Relay, sensor, and switch device type id tuples used to generate device
     # selection menus in the getMenuList method (Part V).
 
@@ -530,6 +696,20 @@ class Plugin(indigo.PluginBase):
                        'lock':        ('lock',) + switchDeviceTypeIds,
                        'opener':      ('opener',)}
 
+    # Plugin entry points (methods called by the Indigo plugin host) that are
+    # accounted for by the server call accounting (see the ipcAccounting
+    # module).
+
+    IPC_ENTRY_POINTS = (
+        'deviceStartComm', 'deviceStopComm', 'deviceCreated', 'deviceDeleted',
+        'deviceUpdated', 'validatePrefsConfigUi', 'validateDeviceConfigUi',
+        'getMenuList', 'arSelected', 'csSelected', 'osSelected',
+        'vsSelected', 'ttSelected', 'vlSelected', 'lsSelected', 'psSelected',
+        'mlSelected', 'oaSelected', 'caSelected', 'laSelected', 'uaSelected',
+        'openGarageDoor', 'closeGarageDoor', 'lockGarageDoor',
+        'unlockGarageDoor', 'actionControlDevice', 'actionControlUniversal',
+        'printPerformanceStatistics', 'printServerCallAccounting')
+
     ###########################################################################
     #                                                                         #
     #                               CLASS Plugin                              #
@@ -544,41 +724,79 @@ class Plugin(indigo.PluginBase):
     #                                                                         #
     #                             UTILITY METHODS                             #
     #                                                                         #
-    #  def _getOpenerDevice(vlDev)                                            #
-    #  def _getVirtualLockDevice(opDev)                                       #
+    #  def _getConfig(self, dev)                                              #
+    #  def _getDevice(self, devId)                                            #
+    #  def _getDoorState(self, opDev)                                         #
+    #  def _getOpenerDevice(self, vlDev)                                      #
+    #  def _getVirtualLockDevice(self, opDev)                                 #
     #  def _getLatchSensorState(self, opDev)                                  #
     #  def _getVirtualLockState(self, opDev)                                  #
     #  def _updateVirtualLockStatesOnServer(self, vlDev, newLockState)        #
+    #  def _addMonitoredDevice(self, devId, mDevId, mDevStateName,            #
+    #                          mDevTypeId, mDevInvert)                        #
+    #  def _removeMonitoredDevices(self, devId)                               #
+    #  def _parseConfig(self, dev)                                            #
+    #  def _monitorDevices(self, dev, config)                                 #
+    #  def _snapshotAgrees(self, snapshot, config, mDevStates, plState)       #
     #                                                                         #
     ###########################################################################
 
-    @staticmethod
-    def _getOpenerDevice(vlDev):
+    def _getConfig(self, dev):
+        """
+        Return the parsed DeviceConfig object for an opener or virtual lock
+        device.  Use the object saved by the deviceStartComm method if the
+        device is started; otherwise, parse the device pluginProps.
+        """
+        config = self._deviceConfigs.get(dev.id)
+        return config if config else DeviceConfig(dev.pluginProps)
+
+    def _getDevice(self, devId):
+        """
+        Return the device object for a device id.  Use the cached object if
+        the device is linked to a started opener device (see the deviceCache
+        module); otherwise, get it from the devices dictionary.  Return None
+        if the device id is null or not in the devices dictionary.
+        """
+        if not devId:
+            return None
+        dev = self._deviceCache.get(devId)
+        return dev if dev else indigo.devices.get(devId)
+
+    def _getDoorState(self, opDev):
+        """
+        Return the integer door state of an opener device.  Use the in-memory
+        door state of the virtual garage door if the opener is started;
+        otherwise, use the opener device doorState.
+        """
+        vgd = self._virtualGarageDoors.get(opDev.id)
+        return vgd.doorState if vgd else opDev.states['doorState']
+
+    def _getOpenerDevice(self, vlDev):
         """
         Return the opener device object associated with a lock device.  Use
-        the opener device id link in the lock device pluginProps to find the
-        opener device in the devices dictionary.  If the opener device id is
-        null, or a valid opener device id is not in the devices dictionary,
-        return None.
+        the link index of the device cache or the opener device id link in the
+        lock device configuration to find the opener device.  If the opener
+        device id is null, or a valid opener device id is not in the devices
+        dictionary, return None.
         """
         L.threaddebug(' _getOpenerDevice called "%s"', vlDev.name)
 
-        opDevId = vlDev.pluginProps['opDevId']  # Get link to opener dev.
-        return indigo.devices.get(int(opDevId)) if opDevId else None
+        opDevId = (self._deviceCache.linked(vlDev.id, 'op')
+                   or self._getConfig(vlDev).opDevId)  # Get link to opener.
+        return self._getDevice(opDevId)
 
-    @staticmethod
-    def _getVirtualLockDevice(opDev):
+    def _getVirtualLockDevice(self, opDev):
         """
         Return the virtual lock (vl) device object associated with an opener
-        device.  Use the vl device id link in the opener device pluginProps to
-        find the vl device in the devices dictionary.  If the vl device id is
-        null, or a valid vl device id is not in the devices dictionary, return
-        None.
+        device.  Use the vl device id link in the opener device configuration
+        to find the cached or current vl device object.  If the vl device id
+        is null, or a valid vl device id is not in the devices dictionary,
+        return None.
         """
         L.threaddebug('_getVirtualLockDevice called "%s"', opDev.name)
 
-        vlDevId = opDev.pluginProps['vlDevId']  # Get link to vl device.
-        return indigo.devices.get(int(vlDevId)) if vlDevId else None
+        vlDevId = self._getConfig(opDev).vlDevId  # Get link to vl device.
+        return self._getDevice(vlDevId)
 
     def _getLatchSensorState(self, dev):
         """
@@ -588,13 +806,11 @@ class Plugin(indigo.PluginBase):
         """
         L.threaddebug('_getLatchSensorState called "%s"', dev.name)
 
-        lsDevId = dev.pluginProps['lsDevId']
-        lsDev = indigo.devices.get(int(lsDevId)) if lsDevId else None
+        config = self._getConfig(dev)
+        lsDev = self._getDevice(config.lsDevId)
         lsState = self.ON  # Default to ON if there is no ls.
         if lsDev:  # ls exists; get the normalized state.
-            lsStateName = dev.pluginProps['lsStateName']
-            lsInvert = dev.pluginProps['lsInvert']
-            lsState = lsDev.states[lsStateName] ^ lsInvert
+            lsState = lsDev.states[config.lsStateName] ^ config.lsInvert
         return lsState
 
     def _getVirtualLockState(self, opDev):
@@ -620,24 +836,210 @@ class Plugin(indigo.PluginBase):
         Also, set the state image on the Indigo Home window based on the value
         of the lock state (onOffState).  Select a green lock image if the
         lock state is LOCKED (on) and a red lock image if it is UNLOCKED (off).
+        Skip states and the state image if they are unchanged.
         """
         L.threaddebug('_updateVirtualLockStatesOnServer called "%s"',
                       vlDev.name)
 
-        # Compute, update, and optionally log the new lock device states.
+        # Compute the new lock device states and the state image.
 
         lockStatus = self.LOCK_STATUS[newLockState]
-        vlDev.updateStateOnServer('onOffState', newLockState,
-                                  uiValue=lockStatus)
-        vlDev.updateStateOnServer('lockStatus', lockStatus)
-        if vlDev.pluginProps['logLockStateChanges']:
+        image = (indigo.kStateImageSel.Locked if newLockState
+                 else indigo.kStateImageSel.Unlocked)
+
+        # Publish the changed states and state image in a single batch using
+        # the state mirror saved by deviceStartComm.  Use a temporary mirror
+        # if the device is not started.  Optionally log the new lock state.
+
+        stateMirror = self._stateMirrors.get(vlDev.id)
+        if not stateMirror:
+            stateMirror = StateMirror(vlDev, self.VIRTUAL_LOCK_STATE_KEYS)
+        stateMirror.publish((('onOffState', newLockState, lockStatus),
+                             ('lockStatus', lockStatus, None)), image)
+        if self._getConfig(vlDev).logLockStateChanges:
             L.info('"%s" update to %s', vlDev.name, lockStatus.upper())
 
-        # Compute and update the state image.
+    def _addMonitoredDevice(self, devId, mDevId, mDevStateName, mDevTypeId,
+                            mDevInvert):
+        """
+        Add a monitored device/state to the monitored devices dictionary for
+        an opener device and add a matching subscription to the reverse
+        subscriptions dictionary.  Subscription lists are replaced rather than
+        modified in place so that deviceUpdated never iterates over a list
+        that is being changed.  Record the opener device as the owner of the
+        device/state pair unless it is already owned by another opener.  Don't
+        subscribe a flap guarded device type to a device that is quarantined
+        for flapping (see the flapGuard module).
+        """
+        with self._monitorLock:
+            if not self._monitoredDevices[devId].get(mDevId):
+                self._monitoredDevices[devId][mDevId] = {}
+            self._monitoredDevices[devId][mDevId][mDevStateName] = mDevTypeId
+            self._owners.setdefault((mDevId, mDevStateName),
+                                    (devId, mDevTypeId))
+            if (mDevTypeId in self.FLAP_GUARDED_DEVICE_TYPE_IDs
+                    and self._flapGuard.isQuarantined(mDevId)):
+                return
+
+            subscription = (devId, mDevStateName, mDevTypeId,
+                            bool(mDevInvert))
+            self._subscriptions[mDevId] = (self._subscriptions.get(mDevId, ())
+                                           + (subscription,))
+
+    def _removeMonitoredDevices(self, devId):
+        """
+        Remove all monitored devices for an opener device from the monitored
+        devices dictionary and the reverse subscriptions and owners
+        dictionaries.  Leave an empty monitored devices dictionary entry for
+        the opener.  Delete subscription entries that no longer have any
+        subscribers.
+        """
+        with self._monitorLock:
+            for mDevId, mDevStates in self._monitoredDevices.get(devId,
+                                                                 {}).items():
+                for mDevStateName in mDevStates:
+                    owner = self._owners.get((mDevId, mDevStateName))
+                    if owner and owner[0] == devId:
+                        del self._owners[(mDevId, mDevStateName)]
+                subscriptions = tuple(subscription for subscription
+                                      in self._subscriptions.get(mDevId, ())
+                                      if subscription[0] != devId)
+                if subscriptions:
+                    self._subscriptions[mDevId] = subscriptions
+                else:
+                    self._subscriptions.pop(mDevId, None)
+            self._monitoredDevices[devId] = {}
 
-        image = (indigo.kStateImageSel.Locked if newLockState
-                 else indigo.kStateImageSel.Unlocked)
-        vlDev.updateStateImageOnServer(image)
+    def _parseConfig(self, dev):
+        """
+        Parse the pluginProps of an opener or virtual lock device and return
+        the DeviceConfig object.  For an opener device, deselect any flap
+        guarded monitored devices that are quarantined so that the door is
+        tracked with the remaining devices (see the flapGuard module).
+        """
+        pluginProps = dev.pluginProps
+        config = DeviceConfig(pluginProps)
+        if dev.deviceTypeId == 'opener':
+            quarantined = [mDevTypeId for mDevTypeId, mDevId, _, _
+                           in config.monitoredDevices
+                           if mDevTypeId in self.FLAP_GUARDED_DEVICE_TYPE_IDs
+                           and self._flapGuard.isQuarantined(mDevId)]
+            if quarantined:
+                pluginProps = dict(pluginProps)
+                for mDevTypeId in quarantined:
+                    pluginProps[mDevTypeId + 'DevId'] = ''
+                    L.warning('"%s" %s device is quarantined for flapping; it '
+                              'will not be monitored', dev.name, mDevTypeId)
+                config = DeviceConfig(pluginProps)
+        return config
+
+    def _monitorDevices(self, dev, config):
+        """
+        Replace the monitored devices dictionary entry, the device cache
+        links, and the activation relay driver for an opener device with the
+        monitored devices that are selected in its configuration.  Exclude
+        devices that are missing, disabled, or without the selected state and
+        log a warning for each.  Return a dictionary of the normalized states
+        of the monitored devices keyed by monitored device type id.
+        """
+        devId = dev.id
+        self._removeMonitoredDevices(devId)
+
+        mDevCount = 0
+        mDevSelected = ''
+        mDevStates = {}  # Current states of monitored devices.
+        mDevs = {}  # Monitored device objects.
+        for (mDevTypeId, mDevId, mDevStateName,
+             mDevInvert) in config.monitoredDevices:
+
+            # Check the monitored device id and state name.  If there are any
+            # errors, log a warning message and exclude the monitored device
+            # from the monitored devices dictionary.
+
+            mDev = indigo.devices.get(mDevId)
+            if not mDev:
+                L.warning('"%s" mDevId %s is not in the devices dictionary; '
+                          '%s device will not be monitored',
+                          dev.name, mDevId, mDevTypeId)
+                continue
+
+            if not mDev.enabled:
+                L.warning('"%s" monitored device "%s" is not enabled; %s '
+                          'device will not be monitored',
+                          dev.name, mDev.name, mDevTypeId)
+                continue
+
+            if mDevStateName not in mDev.states:
+                L.warning('"%s" "%s" state %s is not in the states dict; %s '
+                          'device will not be monitored',
+                          dev.name, mDev.name, mDevStateName, mDevTypeId)
+                continue
+
+            # Add a new entry in the monitored devices dictionary and its
+            # reverse subscriptions dictionary.
+
+            self._addMonitoredDevice(devId, mDevId, mDevStateName,
+                                     mDevTypeId, mDevInvert)
+
+            # Get the normalized state of monitored device and add it to the
+            # states dictionary.  Increment the monitored device count.  Add
+            # the device type and state to the selected devices string.
+
+            mDevState = mDev.states[mDevStateName] ^ mDevInvert
+            mDevStates[mDevTypeId] = mDevState
+            mDevs[mDevTypeId] = mDev
+            mDevCount += 1
+            mDevSelected += mDevTypeId + ('-off ', '-on ')[mDevState]
+
+        if config.ttBuiltIn:  # Built-in travel timer is selected.
+            mDevSelected += 'tt-built-in '
+        L.info('"%s" %s devices selected: %s',
+               dev.name, mDevCount, mDevSelected)
+        L.debug(self._monitoredDevices[devId])
+
+        # Link the opener device to the monitored devices and cache their
+        # device objects (see the deviceCache module).
+
+        self._deviceCache.link(dev, mDevs)
+
+        # Resolve the activation relay driver (see the actuatorDrivers
+        # module).
+
+        driver = self._driverRegistry.resolve(mDevs.get('ar'), config,
+                                              self.AR_CLOSURE_TIME)
+        self._actuatorDrivers[devId] = driver
+        if driver:
+            L.debug('"%s" %s activation relay driver', dev.name, driver.name)
+        return mDevStates
+
+    def _snapshotAgrees(self, snapshot, config, mDevStates, plState):
+        """
+        Return True if a door's warm-start snapshot (see the doorSnapshot
+        module) agrees with the startup states of its monitored devices.  The
+        snapshot disagrees if the closed sensor or the open sensor contradicts
+        the snapshot door state, if a physical lock device is LOCKED and the
+        door is not CLOSED or OBSTRUCTED, or if the door is moving and its
+        external travel timer has expired since the snapshot was recorded.
+        """
+        doorStatus = snapshot['doorStatus'].partition('-')[0]
+        if doorStatus not in self.DOOR_STATUS:
+            return False
+        doorState = self.DOOR_STATUS.index(doorStatus)
+
+        csState = mDevStates.get('cs')
+        if csState is not None and csState != (doorState == self.CLOSED):
+            return False
+        osState = mDevStates.get('os')
+        if osState is not None and osState != (doorState == self.OPEN):
+            return False
+        if plState == self.LOCKED and doorState not in (self.CLOSED,
+                                                        self.OBSTRUCTED):
+            return False
+        if (doorState in (self.OPENING, self.CLOSING) and config.ttDevId
+                and not config.ttBuiltIn
+                and time() - snapshot['priorEventTime'] >= config.tTime):
+            return False
+        return True
 
     ###########################################################################
     #                                                                         #
@@ -655,21 +1057,34 @@ class Plugin(indigo.PluginBase):
     #                                                                         #
     #  def __init__(self, pluginId, pluginDisplayName,                        #
     #               pluginVersion, pluginPrefs)                               #
-    #  def didDeviceCommPropertyChange(oldDev, newDev)                        #
+    #  def startup(self)                                                      #
+    #  def shutdown(self)                                                     #
+    #  def didDeviceCommPropertyChange(self, oldDev, newDev)                  #
+    #  def _reconfigure(self, dev, config)                                    #
     #  def deviceStartComm(self, dev)                                         #
     #  def deviceStopComm(self, dev)                                          #
+    #  def deviceCreated(self, dev)                                           #
+    #  def deviceDeleted(self, dev)                                           #
     #  def deviceUpdated(self, oldDev, newDev)                                #
+    #  def _deviceUpdated(self, oldDev, newDev)                               #
+    #  def _queueDebouncedEvent(self, devId, mDevEvent)                       #
+    #  def _quarantine(self, mDev)                                            #
+    #  def _readmit(self, mDevId, devIds)                                     #
+    #  def _remonitorOpener(self, devId)                                      #
     #                                                                         #
     ###########################################################################
 
     def __init__(self, pluginId, pluginDisplayName,
                  pluginVersion, pluginPrefs):
         """
-        Define the two local dictionaries needed by plugin methods: the
-        monitored devices dictionary and the virtual garage doors dictionary.
-        Set these to empty dictionaries to be initialized later by the
-        deviceStartComm method.  Define the field type instance attribute to
-        facilitate communication between ConfigUI callback methods.  Set the
+        Define the six local dictionaries needed by plugin methods: the
+        monitored devices dictionary, its reverse subscriptions and owners
+        dictionaries, the device configurations dictionary, the state mirrors
+        dictionary, and the virtual garage doors dictionary.  Set these to
+        empty dictionaries to be initialized later by the deviceStartComm
+        method.  Create the actuation scheduler, the built-in travel timer,
+        the device menu index, the performance statistics, the event queue,
+        the command dispatcher, and the server call accounting.  Set the
         logging level and subscribe to device changes.
         """
         indigo.PluginBase.__init__(self, pluginId, pluginDisplayName,
@@ -700,6 +1115,68 @@ class Plugin(indigo.PluginBase):
 
         self._monitoredDevices = {}
 
+        # The subscriptions dictionary is a reverse index of the monitored
+        # devices dictionary.  It is keyed by monitored device id so that the
+        # deviceUpdated method can reject updates for unrelated devices with a
+        # single lookup.  It has the following structure:
+        #
+        # self._subscriptions = {mDevId: ((devId, mDevStateName, mDevTypeId,
+        #                                  mDevInvert), ...)}
+        # where:
+        #   mDevId, devId, mDevStateName, and mDevTypeId are the same as in the
+        #                 monitored devices dictionary, and
+        #   mDevInvert    is True if the monitored device on/off state is
+        #                 inverted in the opener device pluginProps.
+
+        self._subscriptions = {}
+
+        # The owners dictionary maps each monitored device/state pair to the
+        # opener device that monitors it.  It is used by the
+        # validateDeviceConfigUi method to ensure that a device/state pair is
+        # used only once among all opener devices.  It has the following
+        # structure:
+        #
+        # self._owners = {(mDevId, mDevStateName): (devId, mDevTypeId)}
+        #
+        # All three dictionaries are maintained only by the
+        # _addMonitoredDevice and _removeMonitoredDevices methods.  They are
+        # changed with the monitor lock held because quarantined sensors are
+        # readmitted on the built-in travel timer thread (see the _readmit
+        # method).  The deviceUpdated method reads the subscriptions
+        # dictionary without the lock; its entries are replaced, never
+        # modified.
+
+        self._owners = {}
+        self._monitorLock = RLock()
+
+        # The device configurations dictionary saves a DeviceConfig instance
+        #             object for each started opener and virtual lock device.
+        #             It has the following structure:
+        #
+        # self._deviceConfigs = {devId: config}
+        # where:
+        #   devId    is the device id of the opener or virtual lock device, and
+        #   config   is an instance object of the DeviceConfig class in the
+        #            deviceConfig module.  It is replaced when the device
+        #            is restarted or reconfigured after a pluginProps change
+        #            (see didDeviceCommPropertyChange).
+
+        self._deviceConfigs = {}
+
+        # The state mirrors dictionary saves a StateMirror instance object for
+        #             each started virtual lock device.  The opener device
+        #             state mirrors are saved in the VirtualGarageDoor
+        #             instance objects.  It has the following structure:
+        #
+        # self._stateMirrors = {vlDevId: stateMirror}
+        # where:
+        #   vlDevId      is the device id of the virtual lock device, and
+        #   stateMirror  is an instance object of the StateMirror class in the
+        #                stateMirror module.  It holds the last published
+        #                virtual lock device states.
+
+        self._stateMirrors = {}
+
         # The virtual garage doors dictionary saves a VirtualGarageDoor
         #             instance object for each plugin opener device.  It has
         #             the following structure:
@@ -712,6 +1189,126 @@ class Plugin(indigo.PluginBase):
 
         self._virtualGarageDoors = {}
 
+        # The actuation scheduler executes the timed steps of the open, close,
+        # lock, and unlock actions on its own thread so that the action
+        # methods return immediately (see the actuationScheduler module).
+        # The 'ar-off' step is a release step; it is executed even if the
+        # door's steps are cancelled so that the activation relay is never
+        # left on.
+
+        self._scheduler = ActuationScheduler(releaseStepNames=('ar-off',))
+
+        # The built-in travel timer runs the travel timers for opener devices
+        # that select 'BUILT-IN' in the ttName field (see the travelTimer
+        # module).
+
+        self._travelTimer = TravelTimer()
+
+        # The debouncer filters the state changes of closed, open, and latch
+        # sensors that have debounce times in the opener device ConfigUI (see
+        # the debouncer module).  Its hold times run on the built-in travel
+        # timer thread.
+
+        self._debouncer = Debouncer(self._travelTimer)
+
+        # The flap guard quarantines closed, open, vibration, and latch
+        # sensors that change state more than flapLimit times a minute (see
+        # the flapGuard module).  Its readmission checks run on the built-in
+        # travel timer thread.
+
+        try:
+            flapLimit = int(pluginPrefs.get('flapLimit', self.FLAP_LIMIT))
+        except ValueError:
+            flapLimit = self.FLAP_LIMIT
+        self._flapGuard = FlapGuard(
+            self._travelTimer, min(max(flapLimit, 0), self.MAX_FLAP_LIMIT),
+            self.FLAP_WINDOW, self.FLAP_QUIET_TIME)
+
+        # The device cache links each started opener device to its monitored
+        # devices and caches their device objects so that the action methods
+        # read them without server calls (see the deviceCache module).
+
+        self._deviceCache = DeviceCache()
+
+        # The driver registry selects an activation relay driver by device
+        # type id (see the actuatorDrivers module).  EasyDAQ relays use
+        # EasyDAQ plugin actions; all other relays use the default Indigo
+        # relay driver.  The driver for each started opener device is
+        # resolved once by the _monitorDevices method and saved in the
+        # actuator drivers dictionary:
+        #
+        # self._actuatorDrivers = {devId: driver}
+
+        self._driverRegistry = DriverRegistry()
+        self._driverRegistry.register(
+            self.easyDaqComboTypeIds + self.easyDaqRelayTypeIds,
+            EasyDaqDriver)
+        self._actuatorDrivers = {}
+
+        # The door snapshot saves the state of each VirtualGarageDoor
+        # instance after every accepted transition so that the doors can be
+        # restored when the plugin restarts (see the doorSnapshot module).
+        # The snapshot file is kept with the plugin preferences file.  It is
+        # read and its writer thread is started in the startup method.
+
+        self._doorSnapshot = DoorSnapshot(
+            '%s/Preferences/Plugins/%s.snapshot'
+            % (indigo.server.getInstallFolderPath(), pluginId))
+
+        # The menu index holds sorted device name lists for the ConfigUI
+        # device selection menus (see the menuIndex module).  It is built in
+        # the startup method and used by the getMenuList method.
+
+        self._menuIndex = MenuIndex(self.DEVICE_TYPE_IDs)
+
+        # The performance statistics hold the hot-path counters and latency
+        # histograms (see the performanceStats module).  They are collected
+        # only if the collectPerformanceStats preference is checked.
+
+        self._performanceStats = PerformanceStats(
+            pluginPrefs.get('collectPerformanceStats', False))
+
+        # The event queue processes monitored device events on a pool of
+        # worker threads with strict ordering for each door (see the
+        # eventQueue module).  The number of workers is set by the
+        # eventWorkers preference when the plugin starts.
+
+        try:
+            eventWorkers = int(pluginPrefs.get('eventWorkers',
+                                               self.EVENT_WORKERS))
+        except ValueError:
+            eventWorkers = self.EVENT_WORKERS
+        self._eventQueue = EventQueue(
+            min(max(eventWorkers, 0), self.MAX_EVENT_WORKERS),
+            self._performanceStats)
+
+        # The reorder buffer optionally holds the events for each door for a
+        # short window and puts them in the event queue in the order that
+        # the source devices changed state (see the reorderBuffer module).
+        # The window is set by the reorderWindow preference in milliseconds;
+        # 0 disables it.
+
+        try:
+            reorderWindow = int(pluginPrefs.get('reorderWindow', 0))
+        except ValueError:
+            reorderWindow = 0
+        self._reorderBuffer = ReorderBuffer(
+            self._eventQueue, self._travelTimer,
+            min(max(reorderWindow, 0), self.MAX_REORDER_WINDOW) / 1000)
+
+        # The command dispatcher executes the server commands issued by the
+        # VirtualGarageDoor transition methods on its own thread and
+        # coalesces superseded commands (see the commandDispatcher module).
+
+        self._commandDispatcher = CommandDispatcher()
+
+        # The server call accounting counts the Indigo API calls made by each
+        # plugin entry point (see the ipcAccounting module).  It is enabled
+        # at the end of this method if the accountServerCalls preference is
+        # checked.
+
+        self._ipcAccounting = IpcAccounting(self, self.IPC_ENTRY_POINTS)
+
         # Set logging level and subscribe to device state changes.
 
         self.indigo_log_handler.setLevel(NOTSET)  # Eliminate handler level.
@@ -720,123 +1317,165 @@ class Plugin(indigo.PluginBase):
         L.threaddebug('__init__ called')
         L.debug(pluginPrefs)
         indigo.devices.subscribeToChanges()
-
-    @staticmethod
-    def didDeviceCommPropertyChange(oldDev, newDev):
+        self._ipcAccounting.enable(pluginPrefs.get('accountServerCalls',
+                                                   False))
+
+    def startup(self):
+        """
+        Start the event queue, command dispatcher, actuation scheduler, and
+        travel timer threads, build the device menu index, and load the door
+        snapshots.
+        """
+        L.threaddebug('startup called')
+        self._doorSnapshot.load()
+        self._eventQueue.start()
+        self._commandDispatcher.start()
+        self._scheduler.start()
+        self._travelTimer.start()
+        self._menuIndex.build(indigo.devices)
+
+    def shutdown(self):
+        """
+        Stop the event queue, command dispatcher, actuation scheduler, and
+        travel timer threads.  Queued events, pending commands and action
+        steps, and active travel timers are discarded; pending activation
+        relay release steps are executed.  Stop the door snapshot writer
+        thread after it writes the queued snapshots.  Uninstall the server
+        call accounting if it is enabled.
+        """
+        L.threaddebug('shutdown called')
+        self._eventQueue.stop()
+        self._commandDispatcher.stop()
+        self._scheduler.stop()
+        self._travelTimer.stop()
+        self._doorSnapshot.close()
+        self._ipcAccounting.enable(False)
+
+    def didDeviceCommPropertyChange(self, oldDev, newDev):
         """
         By default, changing a device's plugin properties causes the Indigo
-        server to stop the device and then restart it.  This method forces a
-        stop/restart when either the pluginProps or the device name changes.
-        Stopping/restarting on a name change avoids complications in the
-        virtualGarageDoor.py VirtualGarageDoor class which uses the device name
-        at the time of initialization.
-        """
-        devChanged = (oldDev.pluginProps != newDev.pluginProps
-                      or oldDev.name != newDev.name)
-        return devChanged
+        server to stop the device and then restart it.  A restart discards the
+        VirtualGarageDoor instance and its door state track, re-reads all
+        monitored devices, and re-runs the startup door state inference.
+
+        Force a stop/restart only if the device is not started or if the
+        door model (see the DeviceConfig doorModel method) has changed.
+        Otherwise, apply a pluginProps or name change to the started device
+        in place with the _reconfigure method and return False.
+        """
+        newProps = newDev.pluginProps
+        if oldDev.pluginProps == newProps and oldDev.name == newDev.name:
+            return False
+
+        oldConfig = self._deviceConfigs.get(newDev.id)
+        if oldConfig is None:  # Device is not started.
+            return True
+        config = self._parseConfig(newDev)
+        if config.doorModel() != oldConfig.doorModel():
+            return True
+        self._reconfigure(newDev, config)
+        return False
+
+    def _reconfigure(self, dev, config):
+        """
+        Apply a pluginProps or name change that does not change the door model
+        to a started opener or virtual lock device.  Save the new DeviceConfig
+        object and pass the new device object to the state mirror or virtual
+        garage door so that the device name is current.  For an opener
+        device, rebuild its monitored devices dictionary entry only if a
+        monitored device was added, removed, or changed, and discard its
+        debounce filters when it is.  Also used by the _remonitorOpener method
+        to remove or restore a quarantined monitored device.
+        """
+        L.threaddebug('_reconfigure called "%s"', dev.name)
+
+        with self._monitorLock:
+            devId = dev.id
+            oldConfig = self._deviceConfigs[devId]
+            self._deviceConfigs[devId] = config
+            self._deviceCache.refresh(dev)
+
+            if dev.deviceTypeId == 'lock':
+                stateMirror = self._stateMirrors.get(devId)
+                if stateMirror:
+                    stateMirror.rebind(dev)
+                return
+
+            if config.monitoredDevices != oldConfig.monitoredDevices:
+                self._debouncer.cancel(devId)
+                self._monitorDevices(dev, config)
+            vgd = self._virtualGarageDoors.get(devId)
+            if vgd:
+                vgd.reconfigure(dev, config)
 
     def deviceStartComm(self, dev):
         """
+        For each opener or virtual lock device, parse the device pluginProps
+        and save the resulting DeviceConfig object in the device
+        configurations dictionary.
+
         For each opener device, create a new monitored devices dictionary entry
-        and a new virtual garage door instance.  Check the monitored device
+        and a new virtual garage door instance.  Exclude monitored devices
+        that are quarantined for flapping.  Check the monitored device
         properties and determine their startup states.  Reset the vibration
-        sensor, if selected and turned on.  Set the startup opener and virtual
-        lock states based on the startup monitored device states.  Check for
+        sensor, if selected and turned on.  Restore the door from its
+        warm-start snapshot if the snapshot agrees with the startup monitored
+        device states; otherwise, set the startup opener and virtual lock
+        states based on the startup monitored device states.  Check for
         inconsistency between the startup door state and the virtual lock
         state.
 
-        No startup processing is needed for a virtual lock device.  The opener
-        device pluginProps dictionary includes all virtual lock props.  The
-        virtual lock device startup processing is performed as an integral part
-        of the opener device startup.
+        For each virtual lock device, also create a state mirror and save it
+        in the state mirrors dictionary.  No other startup processing is
+        needed for a virtual lock device.  The opener device pluginProps
+        dictionary includes all virtual lock props.  The virtual lock device
+        startup processing is performed as an integral part of the opener
+        device startup.
         """
         L.threaddebug('deviceStartComm called "%s"', dev.name)
 
-        if dev.deviceTypeId == 'opener':  # Start opener/virtual lock devices.
-
-            # Create a new monitored devices dictionary entry for the opener.
-
-            devId = dev.id
-            self._monitoredDevices[devId] = {}
-
-            # Add all monitored devices that are selected in the opener device
-            # ConfigUI to the monitored devices dictionary.  Save the startup
-            # states of the devices for use in setting the startup door and
-            # virtual lock device states.
+        # Parse and save the device configuration.
 
-            mDevCount = 0
-            mDevSelected = ''
-            mDevStates = {}  # Startup states of monitored devices.
-            for mDevTypeId in self.MONITORED_DEVICE_TYPE_IDs:
-                mDevId = dev.pluginProps[mDevTypeId + 'DevId']
-                if mDevId:  # Monitored device is selected in the ConfigUI.
-                    mDevId = int(mDevId)
+        config = self._parseConfig(dev)
+        self._deviceConfigs[dev.id] = config
 
-                    # Check the monitored device id and state name.  If there
-                    # are any errors, log a warning message and exclude the
-                    # monitored device from the monitored devices dictionary.
+        # Create a state mirror for a virtual lock device.
 
-                    mDev = indigo.devices.get(mDevId)
-                    if not mDev:
-                        L.warning('"%s" mDevId %s is not in the devices '
-                                  'dictionary; %s device will not be '
-                                  'monitored', dev.name, mDevId, mDevTypeId)
-                        continue
+        if dev.deviceTypeId == 'lock':
+            self._stateMirrors[dev.id] = StateMirror(
+                dev, self.VIRTUAL_LOCK_STATE_KEYS)
 
-                    if not mDev.enabled:
-                        L.warning('"%s" monitored device "%s" is not enabled; '
-                                  '%s device will not be monitored',
-                                  dev.name, mDev.name, mDevTypeId)
-                        continue
-
-                    mDevStateName = dev.pluginProps[mDevTypeId + 'StateName']
-                    if mDevStateName not in mDev.states:
-                        L.warning('"%s" "%s" state %s is not in the states '
-                                  'dict; %s device will not be monitored',
-                                  dev.name, mDev.name, mDevStateName,
-                                  mDevTypeId)
-                        continue
-
-                    # Add a new entry in the monitored devices dictionary.
-
-                    if not self._monitoredDevices[devId].get(mDevId):
-                        self._monitoredDevices[devId][mDevId] = {}
-                    self._monitoredDevices[devId][mDevId][mDevStateName] = mDevTypeId
+        if dev.deviceTypeId == 'opener':  # Start opener/virtual lock devices.
 
-                    # Get the normalized state of monitored device and add it
-                    # to the startup states dictionary.  Increment the
-                    # monitored device count.  Add the device type and state
-                    # to the selected devices string.
+            # Create a new monitored devices dictionary entry for the opener
+            # and add all monitored devices that are selected in the opener
+            # device ConfigUI to it.  Save the startup states of the devices
+            # for use in setting the startup door and virtual lock device
+            # states.
 
-                    mDevInvert = dev.pluginProps.get(mDevTypeId + 'Invert',
-                                                     False)
-                    mDevState = mDev.states[mDevStateName] ^ mDevInvert
-                    mDevStates[mDevTypeId] = mDevState
-                    mDevCount += 1
-                    mDevSelected += mDevTypeId + ('-off ', '-on ')[mDevState]
+            devId = dev.id
+            mDevStates = self._monitorDevices(dev, config)
 
-                    # Reset the vibration sensor, if selected.
+            # Reset the vibration sensor, if selected and turned on.
 
-                    if mDevTypeId == 'vs':
-                        if mDevState:  # The vibration sensor is on.
-                            indigo.device.turnOff(mDevId)  # Reset it.
-
-            L.info('"%s" %s devices selected: %s',
-                   dev.name, mDevCount, mDevSelected)
-            L.debug(self._monitoredDevices[devId])
+            if mDevStates.get('vs'):
+                indigo.device.turnOff(config.vsDevId)
 
             # Determine the startup door state based on the current closed
             # sensor (cs) and open sensor (os) states (see Table 6 in the
             # Design wiki).  Make prudent assumptions and warn the user when
             # the sensor data does not completely determine the startup state.
+            # Save the warnings; they are logged only if the door is not
+            # restored from its snapshot (see below).
 
             csState = mDevStates.get('cs')                 # None if no cs.
             osState = mDevStates.get('os')                 # None of no os.
-            
+            warnings = []
+
             startupDoorState = self.CLOSED                 # Default to CLOSED.
             if csState and osState:                        # CLOSED and OPEN.
-                L.warning('"%s" closed and open sensors are both on; check '
-                          'sensors; assume that the door is CLOSED', dev.name)
+                warnings.append('closed and open sensors are both on; check '
+                                'sensors; assume that the door is CLOSED')
             elif csState and not osState:                  # Door is CLOSED.
                 pass  # startupDoorState = self.CLOSED
             elif not csState and osState:                  # Door is OPEN.
@@ -845,15 +1484,15 @@ class Plugin(indigo.PluginBase):
                   and osState == self.OFF):                # and not OPEN.
                 startupDoorState = self.OBSTRUCTED
             elif csState is None and osState is None:      # No sensors.
-                L.warning('"%s" no closed sensor or open sensor; cannot '
-                          'determine state; assume that the door is CLOSED',
-                          dev.name)
+                warnings.append('no closed sensor or open sensor; cannot '
+                                'determine state; assume that the door is '
+                                'CLOSED')
             elif csState is None and osState == self.OFF:  # Door is not OPEN.
-                L.warning('"%s" no closed sensor; open sensor reports not-'
-                          'OPEN; assume that the door is CLOSED', dev.name)
+                warnings.append('no closed sensor; open sensor reports not-'
+                                'OPEN; assume that the door is CLOSED')
             elif csState == self.OFF and osState is None:  # Door is not CLOSED
-                L.warning('"%s" no open sensor; closed sensor reports not-'
-                          'CLOSED; assume that the door is OPEN', dev.name)
+                warnings.append('no open sensor; closed sensor reports not-'
+                                'CLOSED; assume that the door is OPEN')
                 startupDoorState = self.OPEN
 
             # Update the startup door state, if necessary, based on the states
@@ -870,11 +1509,26 @@ class Plugin(indigo.PluginBase):
             plState = not lsState or not psState or mlState  # aggregate pl.
 
             if startupDoorState != self.CLOSED and plState == self.LOCKED:
-                L.warning('"%s" door is not CLOSED and one or more physical '
-                          'lock devices are LOCKED; startup door state set to '
-                          'OBSTRUCTED', dev.name)
+                warnings.append('door is not CLOSED and one or more physical '
+                                'lock devices are LOCKED; startup door state '
+                                'set to OBSTRUCTED')
                 startupDoorState = self.OBSTRUCTED
 
+            # Use the door state from the warm-start snapshot instead if it
+            # agrees with the startup monitored device states (see the
+            # doorSnapshot module); otherwise, log the saved warnings.
+
+            snapshot = self._doorSnapshot.get(devId)
+            if snapshot and self._snapshotAgrees(snapshot, config, mDevStates,
+                                                 plState):
+                startupDoorState = self.DOOR_STATUS.index(
+                    snapshot['doorStatus'].partition('-')[0])
+                L.debug('"%s" restored from snapshot', dev.name)
+            else:
+                snapshot = None
+                for warning in warnings:
+                    L.warning('"%s" %s', dev.name, warning)
+
             # Set startup door status from the startup door state and the
             # current lock state if any.
 
@@ -883,11 +1537,22 @@ class Plugin(indigo.PluginBase):
             if startupDoorState == self.CLOSED and vlState:
                 startupDoorStatus += '-lk'
 
-            # Instantiate a VirtualGarageDoor object for the device and save
-            # the object in the virtual garage doors dictionary.  This
-            # completes the startup processing for the opener device.
-
-            vgd = VirtualGarageDoor(dev, startupDoorStatus)
+            # Instantiate a VirtualGarageDoor object for the device, restore
+            # it from the snapshot if any, or record a new snapshot of its
+            # startup state.  Save the object in the virtual garage doors
+            # dictionary.  This completes the startup processing for the
+            # opener device.
+
+            vgd = VirtualGarageDoor(dev, config, startupDoorStatus,
+                                    bool(vlState), self._travelTimer,
+                                    self._performanceStats,
+                                    self._reorderBuffer,
+                                    self._commandDispatcher,
+                                    self._doorSnapshot)
+            if snapshot:
+                vgd.restore(snapshot)
+            else:
+                self._doorSnapshot.record(vgd.snapshot())
             self._virtualGarageDoors[devId] = vgd
 
             # The virtual lock normally retains its current state (the existing
@@ -900,72 +1565,255 @@ class Plugin(indigo.PluginBase):
 
             if (vlState == self.UNLOCKED and plState == self.LOCKED
                     and startupDoorState == self.CLOSED):
-                vlDevId = dev.pluginProps['vlDevId']
-                indigo.device.lock(int(vlDevId))
+                indigo.device.lock(config.vlDevId)
 
             # Warn the user if the startup door and lock states are
             # inconsistent.
 
             if (startupDoorState != self.CLOSED
-                    and self._getVirtualLockState(dev)):  # Door is LOCKED.
+                    and vgd.lockState):  # Door is LOCKED.
                 L.warning('"%s" door is LOCKED, but not CLOSED; close the '
-                          'door manually, or unlock it')
+                          'door manually, or unlock it', dev.name)
 
     def deviceStopComm(self, dev):
         """
         Retire door opener devices by deleting the entries in the monitored
-        devices dictionary and the virtual garage doors dictionary, if present.
-        Virtual lock devices do not require any special action.
+        devices dictionary, the subscriptions dictionary, and the virtual
+        garage doors dictionary, if present, and cancel any queued events,
+        pending commands and actuation steps, debounce filters, reorder
+        buffer events, built-in travel timer, device cache links, and
+        activation relay driver for the door.  For both opener and virtual
+        lock devices, delete the device configurations dictionary entry.  For
+        virtual lock devices, delete the state mirrors dictionary entry.
         """
         L.threaddebug('deviceStopComm called "%s"', dev.name)
 
         if dev.deviceTypeId == 'opener':
-            if dev.id in self._monitoredDevices:
-                del self._monitoredDevices[dev.id]
-            if dev.id in self._virtualGarageDoors:
-                del self._virtualGarageDoors[dev.id]
+            self._scheduler.cancel(dev.id)  # Release the activation relay.
+            self._eventQueue.cancel(dev.id)
+            self._commandDispatcher.cancel(dev.id)
+            self._debouncer.cancel(dev.id)
+            self._reorderBuffer.cancel(dev.id)
+            self._travelTimer.cancel(dev.id)
+            self._deviceCache.unlink(dev.id)
+            self._actuatorDrivers.pop(dev.id, None)
+            with self._monitorLock:
+                if dev.id in self._monitoredDevices:
+                    self._removeMonitoredDevices(dev.id)
+                    del self._monitoredDevices[dev.id]
+                if dev.id in self._virtualGarageDoors:
+                    del self._virtualGarageDoors[dev.id]
+
+        self._deviceConfigs.pop(dev.id, None)
+        self._stateMirrors.pop(dev.id, None)
+
+    def deviceCreated(self, dev):
+        """ Add a new device to the device menu index. """
+        indigo.PluginBase.deviceCreated(self, dev)
+        self._menuIndex.add(dev)
+
+    def deviceDeleted(self, dev):
+        """
+        Remove a deleted device from the device menu index and discard its
+        performance statistics and door snapshot, if any.
+        """
+        indigo.PluginBase.deviceDeleted(self, dev)
+        self._menuIndex.remove(dev.id)
+        self._performanceStats.removeDoor(dev.id)
+        self._doorSnapshot.remove(dev.id)
 
     def deviceUpdated(self, oldDev, newDev):
         """
-        Detect monitored device state changes (events) and update the virtual
-        garage door using the events.
+        Reindex a device in the device menu index if its name or device type
+        id has changed.
+
+        Detect monitored device state changes (events) and put the events in
+        the event queue to update the virtual garage doors.  Use the
+        subscriptions dictionary to ignore updates for devices that are not
+        monitored and to find the opener devices that subscribe to a
+        monitored device.  The virtual garage door updates are performed by
+        the event queue workers so that a slow door does not delay the
+        delivery of other device updates.  Refresh the cached device objects
+        of monitored devices and of opener devices, which are cached but not
+        subscribed (see the deviceCache module).  State changes of debounced
+        sensors are passed through the debouncer, which queues the net events
+        when the states have settled.
+
+        If performance statistics are enabled, record the execution time of
+        the update processing in the _deviceUpdated method.
         """
         indigo.PluginBase.deviceUpdated(self, oldDev, newDev)
-        for devId in self._monitoredDevices:
-            if oldDev.id in self._monitoredDevices[devId]:
-                dev = indigo.devices[devId]
-                mDevId = oldDev.id
-                for mDevStateName in self._monitoredDevices[devId][mDevId]:
-
-                    # Get the onOffStates for both the old (unchanged) device
-                    # object and the new (updated) device object.  Invert the
-                    # states if specified in the pluginProps.  Ignore the
-                    # device object update if the mdevState is unchanged.
-
-                    mDevTypeId = (self._monitoredDevices
-                                  [devId][mDevId][mDevStateName])
-                    invert = dev.pluginProps.get(mDevTypeId + 'Invert', False)
-                    oldState = oldDev.states[mDevStateName] ^ invert
-                    newState = newDev.states[mDevStateName] ^ invert
-                    if oldState == newState:  # No change, ignore it.
-                        continue
+        if self._performanceStats.enabled:
+            startTime = perf_counter()
+            self._deviceUpdated(oldDev, newDev)
+            self._performanceStats.plugin.record('deviceUpdated',
+                                                 perf_counter() - startTime)
+        else:
+            self._deviceUpdated(oldDev, newDev)
 
-                    # Create a monitored device event name and log it for
-                    # debug.
+    def _deviceUpdated(self, oldDev, newDev):
+        """ Perform the deviceUpdated method processing. """
+        if (oldDev.name != newDev.name
+                or oldDev.deviceTypeId != newDev.deviceTypeId):
+            self._menuIndex.update(newDev)
 
-                    mDevEvent = mDevTypeId + ('-off', '-on')[newState]
-                    L.debug('"%s" event %s', dev.name, mDevEvent)
+        if self._flapGuard.isQuarantined(newDev.id):
+            self._flapGuard.touch(oldDev, newDev)
 
-                    # Check for expired timer.
+        # Refresh the cached device object for any linked device, including
+        # the opener devices, which are cached but not subscribed.
 
-                    if mDevEvent == 'tt-off':  # Timer is inactive.
-                        if newDev.states['timeLeftSeconds'] == '0':
-                            mDevEvent = 'tt-exp'  # Timer has expired.
+        self._deviceCache.refresh(newDev)
 
-                    # Update the virtual garage door in response to the new
-                    # monitored device event.
+        subscriptions = self._subscriptions.get(newDev.id)
+        if not subscriptions:  # Not a monitored device; ignore it.
+            if self._performanceStats.enabled:
+                self._performanceStats.plugin.count('unrelated')
+            return
 
-                    self._virtualGarageDoors[devId].update(mDevEvent)
+        # Count a state change of a flap guarded sensor once per device
+        # update.  If the sensor is flapping, skip its flap guarded
+        # subscriptions and quarantine it after the other subscriptions are
+        # processed.
+
+        flapping = False
+        for _, mDevStateName, mDevTypeId, _ in subscriptions:
+            if (mDevTypeId in self.FLAP_GUARDED_DEVICE_TYPE_IDs
+                    and oldDev.states[mDevStateName]
+                    != newDev.states[mDevStateName]):
+                flapping = self._flapGuard.record(newDev.id)
+                break
+
+        for devId, mDevStateName, mDevTypeId, invert in subscriptions:
+
+            # Skip subscriptions for opener devices that are being started or
+            # stopped.
+
+            vgd = self._virtualGarageDoors.get(devId)
+            if not vgd:
+                continue
+
+            # Get the onOffStates for both the old (unchanged) device object
+            # and the new (updated) device object.  Invert the states if
+            # specified in the pluginProps.  Ignore the device object update if
+            # the mDevState is unchanged.
+
+            oldState = oldDev.states[mDevStateName] ^ invert
+            newState = newDev.states[mDevStateName] ^ invert
+            if oldState == newState:  # No change, ignore it.
+                continue
+
+            if flapping and mDevTypeId in self.FLAP_GUARDED_DEVICE_TYPE_IDs:
+                continue
+
+            # Signal a physical lock wait in the actuation scheduler when a
+            # power switch or mechanical lock reaches a new state.
+
+            if mDevTypeId in ('ps', 'ml'):
+                self._scheduler.signal((newDev.id, mDevStateName, newState))
+
+            # Pass the state change to the debouncer if the monitored device
+            # has debounce times.  The debouncer queues the net event later.
+
+            debounceTimes = self._deviceConfigs[devId].debounceTimes.get(
+                mDevTypeId)
+            if debounceTimes:
+                self._debouncer.filter(devId, mDevTypeId, oldState, newState,
+                                       debounceTimes,
+                                       partial(self._queueDebouncedEvent,
+                                               devId))
+                continue
+
+            # Create a monitored device event name and log it for debug.
+
+            mDevEvent = mDevTypeId + ('-off', '-on')[newState]
+            L.debug('"%s" event %s', vgd.name, mDevEvent)
+
+            # Check for expired timer.
+
+            if mDevEvent == 'tt-off':  # Timer is inactive.
+                if newDev.states['timeLeftSeconds'] == '0':
+                    mDevEvent = 'tt-exp'  # Timer has expired.
+
+            # Queue the new monitored device event for the virtual garage door
+            # through the reorder buffer with the device change time.
+
+            self._reorderBuffer.put(devId, vgd.update, mDevEvent,
+                                    newDev.lastChanged)
+
+        if flapping:
+            self._quarantine(newDev)
+
+    def _queueDebouncedEvent(self, devId, mDevEvent):
+        """
+        Queue a net event from the debouncer for the virtual garage door if
+        the opener device is still running.  Called on the timer thread.
+        """
+        vgd = self._virtualGarageDoors.get(devId)
+        if vgd:
+            L.debug('"%s" debounced event %s', vgd.name, mDevEvent)
+            self._reorderBuffer.put(devId, vgd.update, mDevEvent)
+
+    def _quarantine(self, mDev):
+        """
+        Quarantine a flapping monitored device.  Remove its flap guarded
+        subscriptions so that their updates are ignored and reconfigure the
+        opener devices that monitor it in place so that they track with the
+        remaining devices.  Subscriptions for other device types (e.g., an
+        activation relay on another channel of the same device) are kept.
+        Called by deviceUpdated.
+        """
+        L.warning('"%s" changed state more than %s times in %.0f seconds; '
+                  'quarantined until it is quiet for %.0f seconds', mDev.name,
+                  self._flapGuard.limit, self._flapGuard.window,
+                  self._flapGuard.quietTime)
+        with self._monitorLock:
+            subscriptions = ()
+            remaining = ()
+            for subscription in self._subscriptions.get(mDev.id, ()):
+                if subscription[2] in self.FLAP_GUARDED_DEVICE_TYPE_IDs:
+                    subscriptions += (subscription,)
+                else:
+                    remaining += (subscription,)
+            if remaining:
+                self._subscriptions[mDev.id] = remaining
+            else:
+                self._subscriptions.pop(mDev.id, None)
+            devIds = tuple(sorted({subscription[0]
+                                   for subscription in subscriptions}))
+            mDevStateNames = tuple({subscription[1]
+                                    for subscription in subscriptions})
+            self._flapGuard.quarantine(mDev.id, devIds, mDevStateNames,
+                                       self._readmit)
+            for devId in devIds:
+                self._remonitorOpener(devId)
+
+    def _readmit(self, mDevId, devIds):
+        """
+        Readmit a quarantined monitored device that has been quiet.
+        Reconfigure the opener devices that monitored it in place to resume
+        monitoring it.  Called on the built-in travel timer thread; the
+        monitor lock serializes the changes with the Indigo server callbacks.
+        """
+        mDev = indigo.devices.get(mDevId)
+        L.info('"%s" is quiet; readmitted from quarantine',
+               mDev.name if mDev else mDevId)
+        with self._monitorLock:
+            for devId in devIds:
+                self._remonitorOpener(devId)
+
+    def _remonitorOpener(self, devId):
+        """
+        Reparse the configuration of a running opener device to add or
+        remove quarantined monitored devices and apply it in place with the
+        _reconfigure method.  The door status and track are retained; the
+        travel timer expired event qualifiers change with the monitored
+        devices.
+        """
+        with self._monitorLock:
+            dev = indigo.devices.get(devId)
+            if dev and devId in self._virtualGarageDoors:
+                self._reconfigure(dev, self._parseConfig(dev))
 
     ###########################################################################
     #                                                                         #
@@ -981,20 +1829,75 @@ class Plugin(indigo.PluginBase):
     #                                                                         #
     #                      CONFIG UI VALIDATION METHODS                       #
     #                                                                         #
-    #  def validatePrefsConfigUi(valuesDict)                                  #
+    #  def validatePrefsConfigUi(self, valuesDict)                            #
     #  def validateDeviceConfigUi(self, valuesDict, typeId, devId)            #
     #                                                                         #
     ###########################################################################
 
-    @staticmethod
-    def validatePrefsConfigUi(valuesDict):
+    def validatePrefsConfigUi(self, valuesDict):
         """
-        Set the logging level if the user requests a change after startup.
+        Validate the physical lock timeout, the number of event workers, the
+        flapping sensor limit, and the event reorder window.  A change in the
+        number of event workers takes effect when the plugin is restarted;
+        changes in the flapping limit and the reorder window take effect
+        immediately.  Set the logging level and enable
+        or disable performance statistics collection and server call
+        accounting if the user requests a change after startup.
         """
         L.threaddebug('validatePrefsConfigUi called')
+        errorsDict = indigo.Dict()
+
+        plTimeout = -1  # Force an error if the try fails.
+        try:
+            plTimeout = float(valuesDict.get('plTimeout', '10.0'))
+        except ValueError:
+            pass
+        if not 0.1 <= plTimeout <= 60.0:
+            errorsDict['plTimeout'] = ('Physical lock timeout must be a '
+                                       'number between 0.1 and 60.0 seconds')
+
+        eventWorkers = -1  # Force an error if the try fails.
+        try:
+            eventWorkers = int(valuesDict.get('eventWorkers',
+                                              str(self.EVENT_WORKERS)))
+        except ValueError:
+            pass
+        if not 0 <= eventWorkers <= self.MAX_EVENT_WORKERS:
+            errorsDict['eventWorkers'] = ('Event workers must be an integer '
+                                          'between 0 and %s'
+                                          % self.MAX_EVENT_WORKERS)
+
+        flapLimit = -1  # Force an error if the try fails.
+        try:
+            flapLimit = int(valuesDict.get('flapLimit', str(self.FLAP_LIMIT)))
+        except ValueError:
+            pass
+        if not 0 <= flapLimit <= self.MAX_FLAP_LIMIT:
+            errorsDict['flapLimit'] = ('Flapping limit must be an integer '
+                                       'between 0 and %s'
+                                       % self.MAX_FLAP_LIMIT)
+        else:
+            self._flapGuard.limit = flapLimit
+
+        reorderWindow = -1  # Force an error if the try fails.
+        try:
+            reorderWindow = int(valuesDict.get('reorderWindow', '0'))
+        except ValueError:
+            pass
+        if not 0 <= reorderWindow <= self.MAX_REORDER_WINDOW:
+            errorsDict['reorderWindow'] = ('Reorder window must be an integer '
+                                           'between 0 and %s milliseconds'
+                                           % self.MAX_REORDER_WINDOW)
+        else:
+            self._reorderBuffer.window = reorderWindow / 1000
+
         level = valuesDict['loggingLevel']
         L.setLevel('THREADDEBUG' if level == 'THREAD' else level)
-        return True
+        self._performanceStats.enabled = bool(
+            valuesDict.get('collectPerformanceStats', False))
+        self._ipcAccounting.enable(valuesDict.get('accountServerCalls',
+                                                  False))
+        return not bool(errorsDict), valuesDict, errorsDict
 
     def validateDeviceConfigUi(self, valuesDict, typeId, devId):
         """
@@ -1007,7 +1910,8 @@ class Plugin(indigo.PluginBase):
         create a new device if the selected device name is not in the Indigo
         devices dictionary.  This occurs when the user selects 'AUTOMATIC' in
         the ConfigUI and the getMenuList method creates a new device name, but
-        does not create the new device.  Link the virtual lock device
+        does not create the new device.  No timer device is needed if the user
+        selects the 'BUILT-IN' travel timer.  Link the virtual lock device
         bidirectionally with the opener device and validate the locking/
         unlocking delay times.
 
@@ -1016,9 +1920,13 @@ class Plugin(indigo.PluginBase):
         its on/off state name to ensure that the device exists and its on/off
         state name is in the device's states dictionary. Also check to ensure
         that a particular device name/state name combination is not reused in
-        any other monitored device ConfigUI for all opener devices.  Add
-        monitored device id's to the values dictionary for use by other
-        methods.  Validate the opening and closing delay times.
+        any other monitored device ConfigUI for all opener devices.  The
+        check reads the owners dictionary but does not change it; the
+        monitored device dictionaries of a running opener are updated only
+        when the saved configuration is applied by the _reconfigure or
+        deviceStartComm methods.  Add monitored device id's to the values
+        dictionary for use by other methods.  Validate the opening and closing
+        delay times.
 
         For a virtual lock device, if an opener device is selected, link the
         virtual lock device bidirectionally with the opener device.  If no
@@ -1052,6 +1960,9 @@ class Plugin(indigo.PluginBase):
                     'lsDevId':             valuesDict['lsDevId'],
                     'lsStateName':         valuesDict['lsStateName'],
                     'lsInvert':            valuesDict['lsInvert'],
+                    'lsDebounce':          valuesDict['lsDebounce'],
+                    'lsMinOn':             valuesDict['lsMinOn'],
+                    'lsMinOff':            valuesDict['lsMinOff'],
                     'psName':              valuesDict['psName'],
                     'psDevId':             valuesDict['psDevId'],
                     'psStateName':         valuesDict['psStateName'],
@@ -1082,6 +1993,45 @@ class Plugin(indigo.PluginBase):
                        'seconds' % (action.capitalize(), maxDT))
                 errorsDict[delayFieldId] = err
 
+        def _validateDebounceTimes(mDevTypeId, maxDT=5.0):
+            """
+            Validate the debounce settle, minimum on, and minimum off times for
+            a debounced monitored device (see the debouncer module).  Add an
+            error message to the errors dictionary for each time that is less
+            than 0.0 or greater than maxDT.  Return True if all are valid.
+            """
+            valid = True
+            for suffix in ('Debounce', 'MinOn', 'MinOff'):
+                fieldId = mDevTypeId + suffix
+                seconds = -1  # Force an error if the try fails.
+                try:
+                    seconds = float(valuesDict.get(fieldId, 0.0))
+                except ValueError:
+                    pass
+                if not 0 <= seconds <= maxDT:
+                    errorsDict[fieldId] = ('Time must be a number between 0.0 '
+                                           'and %.1f seconds' % maxDT)
+                    valid = False
+            return valid
+
+        def _validateTravelTime():
+            """
+            Validate the travel time entry for an external or built-in travel
+            timer.  Return the travel time if it is valid.  Otherwise, add an
+            error message to the errors dictionary and return None.
+            """
+            tTime = 0  # Force an error if try fails.
+            try:
+                tTime = float(valuesDict['tTime'])
+            except ValueError:
+                pass
+            if not 8 <= tTime <= 20:  # Invalid entry; set error.
+                error = ('Travel time must be a number between 8 and 20 '
+                         'seconds')
+                errorsDict['tTime'] = error
+                return None
+            return tTime
+
         # validateDeviceConfigUi initial debug.
 
         dev = indigo.devices[devId]
@@ -1097,7 +2047,9 @@ class Plugin(indigo.PluginBase):
 
             valuesDict['ttDevId'] = ''  # Set default to no timer device.
             ttName = valuesDict['ttName']
-            if ttName:  # Existing timer device or automatic device.
+            if ttName == DeviceConfig.BUILT_IN_TIMER:  # Built-in timer.
+                _validateTravelTime()
+            elif ttName:  # Existing timer device or automatic device.
                 ttDev = indigo.devices.get(ttName)
                 if not ttDev:  # No existing device; create new auto device.
                     description = ('Automatically generated timer device for '
@@ -1148,10 +2100,12 @@ class Plugin(indigo.PluginBase):
             # Optional configuration of timer and virtual lock devices is
             # complete; begin validation of monitored devices.
 
-            # Clear self._monitoredDevices for this opener to prevent previous
-            # device configurations from generating ConfigUI errors.
+            # Device/state pairs that are selected in this ConfigUI.  Pairs
+            # owned by this opener in the owners dictionary are ignored so
+            # that the previous device configuration does not generate ConfigUI
+            # errors.
 
-            self._monitoredDevices[devId] = {}
+            selected = {}  # {(mDevId, mDevStateName): mDevTypeId}
 
             # For each monitored device that is selected in the opener device
             # ConfigUI:
@@ -1161,12 +2115,14 @@ class Plugin(indigo.PluginBase):
             # (3) Validate the state name.
             # (4) Ensure that selected device name/state pair is unique among
             #     all monitored device types for all opener devices.
-            # (5) Validate unique fields for vs and tt devices.
+            # (5) Validate unique fields for vs, tt, and debounced devices.
             # (6) Set the device id field in the values dictionary.
 
             for mDevTypeId in self.MONITORED_DEVICE_TYPE_IDs:
                 valuesDict[mDevTypeId + 'DevId'] = ''
                 mDevName = valuesDict[mDevTypeId + 'Name']
+                if mDevName == DeviceConfig.BUILT_IN_TIMER:
+                    continue  # Built-in timer is not a monitored device.
                 if mDevName:  # Monitored device is selected in the ConfigUI.
 
                     # Validate the device name.
@@ -1195,14 +2151,23 @@ class Plugin(indigo.PluginBase):
                     # this opener device or others.
 
                     mDevId = mDev.id
-                    for devId_ in self._monitoredDevices:
-                        for mDevId_ in self._monitoredDevices[devId_]:
-                            for mDevStateName_ in self._monitoredDevices[devId_][mDevId_]:
-                                if mDevId == mDevId_ and mDevStateName == mDevStateName_:
-                                    error = 'Device/state name already in use'
-                                    errorsDict[mDevTypeId + 'Name'] = error
-                                    errorsDict[mDevTypeId + 'StateName'] = error
-                                    continue
+                    pair = (mDevId, mDevStateName)
+                    owner = self._owners.get(pair)
+                    if pair in selected:
+                        error = ('Device/state name already in use by the %s '
+                                 'device' % selected[pair])
+                    elif owner and owner[0] != devId:
+                        ownerDevId, ownerTypeId = owner
+                        ownerDev = indigo.devices.get(ownerDevId)
+                        ownerName = ownerDev.name if ownerDev else ownerDevId
+                        error = ('Device/state name already in use by "%s" '
+                                 '(%s device)' % (ownerName, ownerTypeId))
+                    else:
+                        error = None
+                    if error:
+                        errorsDict[mDevTypeId + 'Name'] = error
+                        errorsDict[mDevTypeId + 'StateName'] = error
+                        continue
 
                     # Validate the vs reset delay time.
 
@@ -1218,19 +2183,18 @@ class Plugin(indigo.PluginBase):
                             errorsDict['vsResetDelay'] = error
                             continue
 
+                    # Validate the debounce times.
+
+                    if mDevTypeId in DeviceConfig.DEBOUNCED_DEVICE_TYPE_IDs:
+                        if not _validateDebounceTimes(mDevTypeId):
+                            continue
+
                     # Validate the travel time entry and update the timer start
                     # value.
 
                     if mDevTypeId == 'tt':
-                        tTime = 0  # Force an error if try fails.
-                        try:
-                            tTime = float(valuesDict['tTime'])
-                        except ValueError:
-                            pass
-                        if not 8 <= tTime <= 20:  # Invalid entry; set error.
-                            error = ('Travel time must be a number between 8 '
-                                     'and 20 seconds')
-                            errorsDict['tTime'] = error
+                        tTime = _validateTravelTime()
+                        if tTime is None:  # Invalid entry.
                             continue
                         else:  # Good travel time; set the timer start value.
                             self.TIMER.executeAction('setTimerStartValue',
@@ -1242,15 +2206,10 @@ class Plugin(indigo.PluginBase):
 
                     valuesDict[mDevTypeId + 'DevId'] = str(mDevId)
 
-                    # Add keys/values to self._monitoredDevices to mark this
-                    # device/state combination as used.  Note that these
-                    # additions are overwritten (with the same data) when the
-                    # opener device is started.
+                    # Mark this device/state combination as used in this
+                    # ConfigUI.
 
-                    if not self._monitoredDevices[devId].get(mDevId):
-                        self._monitoredDevices[devId][mDevId] = {}
-                    self._monitoredDevices[devId][mDevId][mDevStateName] = mDevTypeId
-                    L.debug(self._monitoredDevices[devId])
+                    selected[pair] = mDevTypeId
 
             # Validate action delay times.
 
@@ -1331,8 +2290,9 @@ class Plugin(indigo.PluginBase):
         After decoding the filter_ argument, create a list of action group/
         device names for the menu list.  For the 'action' menu type, select all
         action groups from the Indigo action groups dictionary.  For all other
-        menu types, select devices from the Indigo devices dictionary that 
-        have a device type id in the DEVICE_TYPE_IDs[menuType] tuple.
+        menu types, get the sorted names of the devices that have a device
+        type id in the DEVICE_TYPE_IDs[menuType] tuple from the device menu
+        index.
 
         Choose up to two user options to be added at the bottom of the menu
         list following the selected action group/device names.  For the opener
@@ -1341,7 +2301,9 @@ class Plugin(indigo.PluginBase):
         'NO SELECTION' option to let the user deselect the prior selection.
         Also, for the travel timer group (id 'tt') and the virtual lock group
         (id 'vl'), add an 'AUTOMATIC' option to let the user automatically
-        create a new device.
+        create a new device.  For the travel timer group, add a 'BUILT-IN'
+        option to use the plugin's built-in travel timer instead of a timer
+        device.
 
         Return a menu list consisting of a sorted list of action group/device
         names followed by any user options.
@@ -1351,21 +2313,23 @@ class Plugin(indigo.PluginBase):
                       dev.name, filter_)
 
         groupId, menuType = filter_.split(':')  # Decode the filter_ argument.
-        names = []  # Action group or device names.
 
         if menuType == 'action':  # Select action groups.
-            for actionGroup in indigo.actionGroups.iter('self'):
-                names.append(actionGroup.name)
+            names = sorted(actionGroup.name for actionGroup
+                           in indigo.actionGroups.iter('self'))
 
-        else:  # Select devices.
-            for dev_ in indigo.devices:
-                if dev_.deviceTypeId in self.DEVICE_TYPE_IDs[menuType]:
-                    names.append(dev_.name)
+        else:  # Select devices from the menu index.
+            if not self._menuIndex.built:
+                self._menuIndex.build(indigo.devices)
+            names = self._menuIndex.names(menuType)
 
         # Generate and return menu list with 'AUTOMATIC' and 'NO SELECTION'
         # options.
 
-        menuList = [(name, name) for name in sorted(names)]
+        menuList = [(name, name) for name in names]
+
+        if groupId == 'tt':  # Add the 'BUILT-IN' timer option.
+            menuList.append((DeviceConfig.BUILT_IN_TIMER, 'BUILT-IN'))
 
         if groupId in ('tt', 'vl'):  # Add the 'AUTOMATIC' option.
 
@@ -1627,13 +2591,17 @@ class Plugin(indigo.PluginBase):
     #                                                                         #
     #                     Internal Action Support Methods                     #
     #                                                                         #
-    #  def _toggleActivationRelay(self, opDev)                                #
-    #  def _executeOptionalActions(dev, action='opening')                     #
+    #  def _getDoorKey(self, dev)                                             #
+    #  def _activationRelaySteps(self, opDev)                                 #
+    #  def _optionalActionSteps(self, dev, action='opening')                  #
     #  def _openGarageDoor(self, opDev)                                       #
     #  def _closeGarageDoor(self, opDev)                                      #
-    #  def _turnOnOffPhysicalLockDevice(vlDev, plAction)                      #
+    #  def _physicalLockSteps(self, vlDev, plAction)                          #
+    #  def _getPhysicalLockTimeout(self)                                      #
+    #  def _togglePhysicalLockDevice(self, waitKey)                           #
+    #  def _warnPhysicalLockTimeout(vlDev, plAction, plTimeout)               #
     #  def _lockGarageDoor(self, vlDev)                                       #
-    #  def _unlockGarageDoor(self, vlDev)                                     #
+    #  def _unlockGarageDoor(self, vlDev, thenSteps=())                       #
     #                                                                         #
     #                         Plugin Callback Methods                         #
     #                                                                         #
@@ -1649,55 +2617,62 @@ class Plugin(indigo.PluginBase):
     #                                                                         #
     ###########################################################################
 
-    def _toggleActivationRelay(self, opDev):
-        """
-        Turn on the activation relay for a period equal to the global
-        AR_CLOSURE_TIME.  Use special plugin actions for EasyDAQ relay devices;
-        otherwise use the standard Indigo device turnOn method.
-        """
-        L.threaddebug('_toggleActivationRelay called "%s"', opDev.name)
-
-        arDevId = opDev.pluginProps['arDevId']
-        if arDevId:
-            arDevId = int(arDevId)
-            arDev = indigo.devices[arDevId]
-            if arDev.deviceTypeId.startswith('easyDaq'):  # EasyDAQ relay.
-                plugin = indigo.server.getPlugin(arDev.pluginId)
-                props = dict(channelSel=int(opDev.pluginProps['arState'][8:9]))
-                plugin.executeAction('turnOnOutput', deviceId=arDevId,
-                                     props=props)
-                sleep(self.AR_CLOSURE_TIME)
-                plugin.executeAction('turnOffOutput', deviceId=arDevId,
-                                     props=props)
-            else:  # Indigo relay device.
-                indigo.device.turnOn(arDevId)
-                sleep(self.AR_CLOSURE_TIME)
-                indigo.device.turnOff(arDevId)
+    def _getDoorKey(self, dev):
+        """
+        Return the actuation scheduler door key for an opener or lock device.
+        The key is the opener device id so that opening, closing, locking, and
+        unlocking sequences for the same door are executed in order.
+        """
+        if dev.deviceTypeId == 'lock':
+            return self._getConfig(dev).opDevId or dev.id
+        return dev.id
+
+    def _activationRelaySteps(self, opDev):
+        """
+        Return the steps to turn on the activation relay for a period equal to
+        the global AR_CLOSURE_TIME.  Use the driver that was resolved for the
+        activation relay device when the opener device was started (see the
+        actuatorDrivers module); resolve one now if the opener is not
+        started.  Return no steps and log a warning if there is no activation
+        relay.
+        """
+        L.threaddebug('_activationRelaySteps called "%s"', opDev.name)
+
+        driver = self._actuatorDrivers.get(opDev.id)
+        if not driver:  # Opener device is not started.
+            config = self._getConfig(opDev)
+            driver = self._driverRegistry.resolve(
+                self._getDevice(config.arDevId), config, self.AR_CLOSURE_TIME)
+        if driver:
+            return driver.steps()
         else:
             L.warning('"%s" no activation relay specified; door action '
                       'ignored', opDev.name)
+            return []
 
-    @staticmethod
-    def _executeOptionalActions(dev, action='opening'):
+    def _optionalActionSteps(self, dev, action='opening'):
         """
         dev can be an opener or lock device.  action must be 'opening',
         'closing', 'locking', or 'unlocking'.
 
-        Optionally execute an action group and delay based on opener or lock
-        device pluginProps entries.  Do nothing if the action group or delay
-        keys are not in the pluginProps dictionary.  This ensures backward
-        compatibility with opener or lock devices created by older plugin
-        versions.
+        Return the steps to optionally execute an action group and delay based
+        on the opener or lock device configuration.  Return no steps if the
+        action group or delay keys were not in the pluginProps dictionary when
+        the configuration was parsed.  This ensures backward compatibility
+        with opener or lock devices created by older plugin versions.
         """
-        L.threaddebug('_executeOptionalActions called "%s"', dev.name)
+        L.threaddebug('_optionalActionSteps called "%s"', dev.name)
 
-        actionGroupName = dev.pluginProps.get(action[0] + 'aName')
+        steps = []
+        actionGroupName, delayTime = self._getConfig(dev).actions[action]
         if actionGroupName:
-            indigo.actionGroup.execute(actionGroupName)
+            steps.append((0.0, action + ' action group',
+                          partial(indigo.actionGroup.execute,
+                                  actionGroupName)))
 
-        delayTime = dev.pluginProps.get(action[0] + 'aDelay')
         if delayTime:
-            sleep(float(delayTime))
+            steps.append((delayTime, action + ' delay', None))
+        return steps
 
     def _openGarageDoor(self, opDev):
         """
@@ -1708,30 +2683,37 @@ class Plugin(indigo.PluginBase):
         """
         L.threaddebug('_openGarageDoor called "%s"', opDev.name)
 
-        vlState = self._getVirtualLockState(opDev)
+        vlDev = self._getVirtualLockDevice(opDev)
+        vlState = vlDev.onState if vlDev else self.UNLOCKED
 
         if not self._getLatchSensorState(opDev):  # Abort if the ls is OFF.
             L.warning('"%s" attempt to open the garage door when the latch '
                       'sensor is OFF; action ignored', opDev.name)
 
         elif (vlState  # Abort if LOCKED w/no unlock before opening (ubo).
-                and not opDev.pluginProps.get('unlockBeforeOpening')):
+                and not self._getConfig(opDev).unlockBeforeOpening):
             L.warning('"%s" attempt to open the garage door when it is '
                       'LOCKED; action ignored', opDev.name)
 
-        elif opDev.states['doorState'] not in (self.CLOSED, self.CLOSING):
+        elif self._getDoorState(opDev) not in (self.CLOSED, self.CLOSING):
             L.warning('"%s" attempt to open the garage door when it is '
                       'not CLOSED or CLOSING; action ignored', opDev.name)
 
-        else:  # If LOCKED, unlock the door then open it.
+        else:  # Execute optional opening actions and toggle the door OPEN.
+            openingSteps = (self._optionalActionSteps(opDev)
+                            + self._activationRelaySteps(opDev))
+
             if vlState:  # Door is locked, but ubo was requested.
-                vlDev = self._getVirtualLockDevice(opDev)
-                self._unlockGarageDoor(vlDev)
 
-            # Execute optional opening actions and toggle the door OPEN.
+                # Open within the unlocking sequence so that the door is not
+                # opened if the unlock is refused or aborted.
 
-            self._executeOptionalActions(opDev)
-            self._toggleActivationRelay(opDev)
+                if not self._unlockGarageDoor(vlDev, openingSteps):
+                    L.warning('"%s" unlock before opening failed; open '
+                              'action ignored', opDev.name)
+            else:
+                self._scheduler.schedule(opDev.id, opDev.name, 'opening',
+                                         openingSteps)
 
     def _closeGarageDoor(self, opDev):
         """
@@ -1749,72 +2731,87 @@ class Plugin(indigo.PluginBase):
             L.warning('"%s" attempt to close the garage door when it is '
                       'LOCKED; action ignored', opDev.name)
 
-        elif opDev.states['doorState'] not in (self.OPEN, self.OPENING,
+        elif self._getDoorState(opDev) not in (self.OPEN, self.OPENING,
                                                self.OBSTRUCTED):
             L.warning('"%s" attempt to close the garage door when it is '
                       'not OPEN, OPENING, or OBSTRUCTED; action ignored',
                       opDev.name)
 
-        else:  # Execute optional closing actions and toggle the door CLOSED.
-            self._executeOptionalActions(opDev, action='closing')
-            self._toggleActivationRelay(opDev)
-
-    def _turnOnOffPhysicalLockDevice(self, vlDev, plAction):
-        """
-        Turn on or turn off a physical lock (pl) device and wait for completion
-        of the operation.  The physical lock device may be a power switch (ps)
-        or a mechanical lock (ml) and is specified by the pl device type ('ps'
-        or 'ml').  The plAction argument is a string containing the pl device
-        type, a dash, and an on/off action (e.g., 'ps-on' or 'ml-off').
-
-        Decode the plAction into a pl device type and a target state (either
-        self.ON or self.OFF).  Check to see if the pl device is available and
-        return if it is not.
-
-        Get the pl device state and compare it to the target state.  Return if
-        the device is already in the target state.  If it is not toggle the
-        device to get to the target state.
-
-        Wait for the toggle action to complete by sleeping and then checking
-        the state again.  Log a warning message if the device is not in the
-        target state after 100 milliseconds.
-        """
-        L.threaddebug('_turnOnOffPhysicalLockDevice called "%s" %s',
+        else:  # Schedule optional closing actions and toggle the door CLOSED.
+            self._scheduler.schedule(
+                opDev.id, opDev.name, 'closing',
+                self._optionalActionSteps(opDev, action='closing')
+                + self._activationRelaySteps(opDev))
+
+    def _physicalLockSteps(self, vlDev, plAction):
+        """
+        Return the steps to turn on or turn off a physical lock (pl) device
+        and wait for completion of the operation.  The physical lock device
+        may be a power switch (ps) or a mechanical lock (ml) and is specified
+        by the pl device type ('ps' or 'ml').  The plAction argument is a
+        string containing the pl device type, a dash, and an on/off action
+        (e.g., 'ps-on' or 'ml-off').  Return no steps if the pl device is not
+        selected.
+
+        The toggle step is followed by a scheduler wait step whose wait key is
+        the tuple (plDevId, plStateName, targetState).  The wait is signalled
+        by the deviceUpdated method when the pl device reaches the target
+        state.  If it is not signalled within the physical lock timeout
+        (plTimeout in the plugin preferences), the _warnPhysicalLockTimeout
+        method logs a warning and the sequence continues.
+        """
+        L.threaddebug('_physicalLockSteps called "%s" %s',
                       vlDev.name, plAction)
 
         plDevType = plAction[:2]
         targetState = self.ON if plAction[3:] == 'on' else self.OFF
 
-        plDevId = vlDev.pluginProps[plDevType + 'DevId']
-        if plDevId:  # pl device is available.
-            plDevId = int(plDevId)
+        config = self._getConfig(vlDev)
+        plDevId = getattr(config, plDevType + 'DevId')
+        if not plDevId:  # pl device is not selected.
+            return []
 
-            # Get the current state for the pl device.
+        plStateName = getattr(config, plDevType + 'StateName')
+        waitKey = (plDevId, plStateName, targetState)
+        plTimeout = self._getPhysicalLockTimeout()
+        return [(0.0, plAction,
+                 partial(self._togglePhysicalLockDevice, waitKey)),
+                (plTimeout, plAction + ' wait',
+                 partial(self._warnPhysicalLockTimeout, vlDev, plAction,
+                         plTimeout), waitKey)]
 
-            plDev = indigo.devices[plDevId]
-            plStateName = vlDev.pluginProps[plDevType + 'StateName']
-            plState = plDev.states[plStateName]
-
-            # Toggle the pl device if it is not in the targetState.
-
-            if plState != targetState:
-                indigo.device.toggle(plDevId)
+    def _getPhysicalLockTimeout(self):
+        """
+        Return the physical lock timeout in seconds from the plugin
+        preferences.  Use the default for preferences saved by older plugin
+        versions.
+        """
+        try:
+            return float(self.pluginPrefs.get('plTimeout',
+                                              self.PL_TIMEOUT))
+        except ValueError:
+            return self.PL_TIMEOUT
 
-                # Wait for toggle completion.
+    def _togglePhysicalLockDevice(self, waitKey):
+        """
+        Get the pl device state and compare it to the target state in the
+        wait key.  Toggle the device if it is not in the target state;
+        otherwise, signal the wait immediately.
+        """
+        plDevId, plStateName, targetState = waitKey
+        if self._getDevice(plDevId).states[plStateName] != targetState:
+            indigo.device.toggle(plDevId)
+        else:  # Already in the target state.
+            self._scheduler.signal(waitKey)
 
-                maxDelay = 100  # Max number of delays.
-                sleepTime = 0.001  # Delay increment in seconds.
-                for _ in range(maxDelay):
-                    sleep(sleepTime)
-                    plDev = indigo.devices[plDevId]
-                    plState = plDev.states[plStateName]
-                    if plState == targetState:  # Toggle completed.
-                        break
-                else:
-                    L.warning('"%s" %s device failed to turn %s after %s '
-                              'milliseconds', vlDev.name, plDevType,
-                              ('off', 'on')[targetState],
-                              1000 * maxDelay * sleepTime)
+    @staticmethod
+    def _warnPhysicalLockTimeout(vlDev, plAction, plTimeout):
+        """
+        Log a warning message if the pl device did not reach the target state
+        before the physical lock timeout.
+        """
+        L.warning('"%s" %s device failed to turn %s after %s seconds',
+                  vlDev.name, plAction[:2], plAction[3:], plTimeout)
 
     def _lockGarageDoor(self, vlDev):
         """
@@ -1824,12 +2821,15 @@ class Plugin(indigo.PluginBase):
 
         Optionally execute locking actions to (1) execute a user-specified
         locking action group and/or delay, (2) turn off the garage door opener
-        power, and (3) turn on (lock) a garage door mechanical lock.  Log a
-        warning message and return if any of the optional actions fails to
-        execute.
+        power, and (3) turn on (lock) a garage door mechanical lock.  Schedule
+        these steps with the actuation scheduler and return immediately.
 
-        If there are no exceptions, set the virtual lock device states on the
-        server to LOCKED.
+        If none of the steps fails, set the virtual lock device states on the
+        server to LOCKED as the final step.  If a step fails, the scheduler
+        logs a warning message and aborts the remaining steps.  The virtual
+        lock device states are not changed until the final step, so refuse
+        the request if a locking or unlocking sequence is already active or
+        queued for the door.
         """
         L.threaddebug('_lockGarageDoor called "%s"', vlDev.name)
 
@@ -1839,58 +2839,68 @@ class Plugin(indigo.PluginBase):
                 L.warning('"%s" lock device is not linked to an opener '
                           'device; lock action ignored', vlDev.name)
 
-            elif opDev.states['doorState'] != self.CLOSED:  # Abort
+            elif self._getDoorState(opDev) != self.CLOSED:  # Abort
                 L.warning('"%s" attempt to lock the garage door when it is '
                           'not closed; action ignored', vlDev.name)
 
-            else:  # Lock it.
-                try:  # Execute optional actions.
-                    self._executeOptionalActions(vlDev, action='locking')
-                    self._turnOnOffPhysicalLockDevice(vlDev, 'ps-off')
-                    self._turnOnOffPhysicalLockDevice(vlDev, 'ml-on')
-
-                except Exception as warningMessage:
-                    L.warning('"%s" optional locking action failed: %s',
-                              vlDev.name, warningMessage)
-
-                else:  # Update virtual lock device states.
-                    self._updateVirtualLockStatesOnServer(vlDev, self.LOCKED)
-
-    def _unlockGarageDoor(self, vlDev):
+            else:  # Schedule optional actions and lock it.
+                steps = (self._optionalActionSteps(vlDev, action='locking')
+                         + self._physicalLockSteps(vlDev, 'ps-off')
+                         + self._physicalLockSteps(vlDev, 'ml-on'))
+                steps.append((0.0, 'vl-on',
+                              partial(self._updateVirtualLockStatesOnServer,
+                                      vlDev, self.LOCKED)))
+                if not self._scheduler.schedule(
+                        self._getDoorKey(vlDev), vlDev.name, 'locking', steps,
+                        exclusive=self.LOCK_SEQUENCES):
+                    L.warning('"%s" lock or unlock action in progress; lock '
+                              'action ignored', vlDev.name)
+
+    def _unlockGarageDoor(self, vlDev, thenSteps=()):
         """
         Execute optional unlocking actions and unlock the garage door if it is
         LOCKED and the latch sensor (ls) is ON or nonexistent.
 
         Optionally execute unlocking actions to (1) turn off (unlock) a garage
         door mechanical lock, (2) turn on the garage door opener power, and (3)
-        execute a user-specified unlocking action group and/or delay.  Log a
-        warning message and return if any of the optional actions fails to
-        execute.
+        execute a user-specified unlocking action group and/or delay.  Schedule
+        these steps with the actuation scheduler and return immediately.
+
+        If none of the steps fails, set the virtual lock device states on the
+        server to UNLOCKED as the final step.  If a step fails, the scheduler
+        logs a warning message and aborts the remaining steps.  Refuse the
+        request if a locking or unlocking sequence is already active or queued
+        for the door.
 
-        If there are no exceptions, set the virtual lock device states on the
-        server to UNLOCKED.
+        thenSteps are steps to be executed after the door is unlocked (e.g.,
+        the opening steps for unlock before opening).  They are part of the
+        unlocking sequence, so they are aborted if an unlocking step fails.
+        Return True if the unlocking sequence was scheduled.
         """
         L.threaddebug('_unlockGarageDoor called "%s"', vlDev.name)
 
+        scheduled = False
         if vlDev.onState:  # Unlock only if the door is LOCKED.
 
             if not self._getLatchSensorState(vlDev):  # Abort if the ls is OFF.
                 L.warning('"%s" attempt to unlock the garage door when the '
                           'latch sensor is OFF; action ignored', vlDev.name)
 
-            else:  # ls is ON or nonexistent; unlock it.
-
-                try:   # Execute optional actions.
-                    self._turnOnOffPhysicalLockDevice(vlDev, 'ml-off')
-                    self._turnOnOffPhysicalLockDevice(vlDev, 'ps-on')
-                    self._executeOptionalActions(vlDev, action='unlocking')
-
-                except Exception as warningMessage:
-                    L.warning('"%s" optional unlocking action failed: %s',
-                              vlDev.name, warningMessage)
-
-                else:  # Update lock device states.
-                    self._updateVirtualLockStatesOnServer(vlDev, self.UNLOCKED)
+            else:  # ls is ON or nonexistent; schedule the unlock steps.
+                steps = (self._physicalLockSteps(vlDev, 'ml-off')
+                         + self._physicalLockSteps(vlDev, 'ps-on')
+                         + self._optionalActionSteps(vlDev,
+                                                     action='unlocking'))
+                steps.append((0.0, 'vl-off',
+                              partial(self._updateVirtualLockStatesOnServer,
+                                      vlDev, self.UNLOCKED)))
+                scheduled = self._scheduler.schedule(
+                    self._getDoorKey(vlDev), vlDev.name, 'unlocking',
+                    steps + list(thenSteps), exclusive=self.LOCK_SEQUENCES)
+                if not scheduled:
+                    L.warning('"%s" lock or unlock action in progress; '
+                              'unlock action ignored', vlDev.name)
+        return scheduled
 
     def openGarageDoor(self, pluginAction):
         """
@@ -1898,7 +2908,7 @@ class Plugin(indigo.PluginBase):
         open method.  Log a warning message if the pluginAction device is not
         an opener.
         """
-        dev = indigo.devices[pluginAction.deviceId]
+        dev = self._getDevice(pluginAction.deviceId)
         L.threaddebug('openGarageDoor called "%s"', dev.name)
 
         if dev.deviceTypeId == 'opener':  # dev is an opener device; open it.
@@ -1913,7 +2923,7 @@ class Plugin(indigo.PluginBase):
         close method.  Log a warning message if the pluginAction device is not
         an opener.
         """
-        dev = indigo.devices[pluginAction.deviceId]
+        dev = self._getDevice(pluginAction.deviceId)
         L.threaddebug('closeGarageDoor called "%s"', dev.name)
 
         if dev.deviceTypeId == 'opener':  # dev is an opener device; close it.
@@ -1929,7 +2939,7 @@ class Plugin(indigo.PluginBase):
         lock device from the argument.  If an opener device is provided, use
         the lock device obtained from the _getVirtualLockDevice method.
         """
-        dev = indigo.devices[pluginAction.deviceId]
+        dev = self._getDevice(pluginAction.deviceId)
         L.threaddebug('lockGarageDoor called "%s"', dev.name)
 
         if dev.deviceTypeId == 'lock':  # dev is a lock device; lock it.
@@ -1950,7 +2960,7 @@ class Plugin(indigo.PluginBase):
         lock device from the argument.  If an opener device is provided, use
         the lock device obtained from the _getVirtualLockDevice method.
         """
-        dev = indigo.devices[pluginAction.deviceId]
+        dev = self._getDevice(pluginAction.deviceId)
         L.threaddebug('unlockGarageDoor called "%s"', dev.name)
 
         if dev.deviceTypeId == 'lock':  # dev is a lock device; unlock it.
@@ -2005,3 +3015,59 @@ class Plugin(indigo.PluginBase):
                 L.info('"%s" is %s', dev.name, dev.states['doorStatus'].upper())
             elif dev.deviceTypeId == 'lock':
                 L.info('"%s" is %s', dev.name, dev.states['lockStatus'].upper())
+
+    ###########################################################################
+    #                                                                         #
+    #                               CLASS Plugin                              #
+    #                                   PART                                  #
+    #                                                                         #
+    #                         III     III   III   III                         #
+    #                          I       I     I     I                          #
+    #                           I     I      I     I                          #
+    #                            I   I       I     I                          #
+    #                             I I        I     I                          #
+    #                             III       III   III                         #
+    #                                                                         #
+    #                        MENU ITEM CALLBACK METHODS                       #
+    #                                                                         #
+    #  def printPerformanceStatistics(self)                                   #
+    #  def printServerCallAccounting(self)                                    #
+    #                                                                         #
+    ###########################################################################
+
+    def printPerformanceStatistics(self):
+        """
+        Log the performance statistics for the Plugin deviceUpdated method and
+        for each opener device and all opener devices in aggregate (see the
+        performanceStats module).  Statistics are collected only when the
+        collectPerformanceStats plugin preference is checked.  Also log the
+        event queue depths, the command dispatcher counts, the debouncer
+        counts, the flap guard counts, the reorder buffer counts, the door
+        snapshot counts, and the device cache counts (see the eventQueue,
+        commandDispatcher, debouncer, flapGuard, reorderBuffer, doorSnapshot,
+        and deviceCache modules).
+        """
+        L.threaddebug('printPerformanceStatistics called')
+        names = {devId: indigo.devices[devId].name
+                 for devId in self._performanceStats.doors
+                 if devId in indigo.devices}
+        for line in self._performanceStats.report(names):
+            L.info(line)
+        for line in (self._eventQueue.report()
+                     + self._commandDispatcher.report()
+                     + self._debouncer.report()
+                     + self._flapGuard.report()
+                     + self._reorderBuffer.report()
+                     + self._doorSnapshot.report()
+                     + self._deviceCache.report()):
+            L.info(line)
+
+    def printServerCallAccounting(self):
+        """
+        Log the Indigo server calls per invocation for each plugin entry point
+        (see the ipcAccounting module).  Calls are accounted for only when the
+        accountServerCalls plugin preference is checked.
+        """
+        L.threaddebug('printServerCallAccounting called')
+        for line in self._ipcAccounting.report():
+            L.info(line)
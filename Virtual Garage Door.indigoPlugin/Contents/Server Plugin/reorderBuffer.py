@@ -0,0 +1,209 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                          MODULE reorderBuffer.py                            #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  reorderBuffer.py
+   TITLE:  Per-door event reorder buffer
+FUNCTION:  Optionally holds the monitored device events for each door for a
+           short reorder window, sorts them by the time that the source
+           device changed state, and puts them in the event queue in that
+           order.
+   USAGE:  reorderBuffer.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A ReorderBuffer instance is created by the Plugin __init__
+           method in front of the event queue.  The window is set by the
+           reorderWindow plugin preference.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE reorderBuffer.py DESCRIPTION:
+
+The Indigo server can deliver device updates from different interfaces
+(e.g., a Z-Wave closed sensor, an EasyDAQ activation relay, and a Timers and
+Pesters timer) in a different order than the devices changed state.  The
+VirtualGarageDoor update method then sees an event sequence that is not in
+the transitions table and rejects an event, and the door state track shows
+the arrival times rather than the change times.
+
+When the window is nonzero, the first event for a door starts a one-shot
+timer for the window on the Plugin's built-in travel timer thread (see the
+travelTimer module).  Events that arrive for the door before the timer
+expires are held with it.  When the timer expires, the held events are
+sorted by their change times (ties in arrival order) and put in the event
+queue.  Each event is passed to the update method with its change time so
+that the door state track shows the true timing.
+
+The change time of a monitored device event is the lastChanged time of the
+source device converted from the wall clock to the monotonic clock.  Its age
+is limited to the window so that a stale lastChanged time can't move an event
+ahead of events that have already left the buffer.  Events without a source
+device (e.g., built-in travel timer expirations and debounced events) use
+their arrival time.  A window of 0 disables the buffer; events are put in the
+event queue immediately with no change time.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from datetime import datetime
+from functools import partial
+from threading import Condition
+from time import monotonic
+
+
+###############################################################################
+#                                                                             #
+#                             CLASS ReorderBuffer                             #
+#                                                                             #
+###############################################################################
+
+class ReorderBuffer:
+    """
+    The ReorderBuffer class holds the events for each door during the reorder
+    window.  It has the following structure:
+
+    self._buffers = {key: [(eventTime, sequence, function, event), ...]}
+
+    where key is the opener device id, eventTime is the monotonic change
+    time, and sequence is the arrival sequence number.
+    """
+
+    def __init__(self, eventQueue, timer, window=0.0):
+        self._eventQueue = eventQueue
+        self._timer = timer
+        self._buffers = {}
+        self._sequence = 0
+        self._flushing = 0
+        self._condition = Condition()
+
+        self.window = window
+        self.buffered = 0
+        self.flushes = 0
+        self.reordered = 0
+        self.maxDepth = 0
+
+    def put(self, key, function, event, lastChanged=None):
+        """
+        Put an event for the door identified by key in the buffer.
+        lastChanged is the datetime that the source device changed state; use
+        the arrival time if it is None.  Put the event in the event queue
+        immediately if the window is 0.
+        """
+        window = self.window
+        if not window:
+            self._eventQueue.put(key, function, event)
+            return
+        eventTime = monotonic()
+        if lastChanged is not None:
+            age = (datetime.now() - lastChanged).total_seconds()
+            eventTime -= min(max(age, 0.0), window)
+        with self._condition:
+            self._sequence += 1
+            self.buffered += 1
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = []
+                self._timer.restart(('reorder', key), window,
+                                    partial(self._flush, key))
+            buffer.append((eventTime, self._sequence, function, event))
+            if len(buffer) > self.maxDepth:
+                self.maxDepth = len(buffer)
+
+    def cancel(self, key):
+        """ Discard the held events for a door. """
+        with self._condition:
+            if self._buffers.pop(key, None) is not None:
+                self._timer.cancel(('reorder', key))
+                self._condition.notify_all()
+
+    def waitUntilIdle(self, timeout=10.0):
+        """
+        Wait until all held events have been put in the event queue.  Return
+        False on timeout.
+        """
+        deadline = monotonic() + timeout
+        with self._condition:
+            while self._buffers or self._flushing:
+                remaining = deadline - monotonic()
+                if remaining <= 0.0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def report(self):
+        """ Return a list of report lines with the buffer counts. """
+        with self._condition:
+            return ['Reorder buffer:',
+                    '    %-28s %9s %9s %9s %9s %9s'
+                    % ('events', 'window ms', 'buffered', 'flushes',
+                       'reordered', 'max depth'),
+                    '    %-28s %9.0f %9i %9i %9i %9i'
+                    % ('', self.window * 1e3, self.buffered, self.flushes,
+                       self.reordered, self.maxDepth)]
+
+    def _flush(self, key):
+        """
+        Reorder window expiration callback on the timer thread.  Sort the
+        held events for the door and put them in the event queue with their
+        change times.
+        """
+        with self._condition:
+            buffer = self._buffers.pop(key, None)
+            if not buffer:
+                return
+            ordered = sorted(buffer)
+            self.flushes += 1
+            self.reordered += sum(1 for arrived, sent in zip(buffer, ordered)
+                                  if arrived is not sent)
+            self._flushing += 1
+        try:
+            for eventTime, sequence, function, event in ordered:
+                self._eventQueue.put(key, function, event, eventTime)
+        finally:
+            with self._condition:
+                self._flushing -= 1
+                self._condition.notify_all()
@@ -0,0 +1,160 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                            MODULE stateMirror.py                            #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  stateMirror.py
+   TITLE:  Batched publication of plugin device states
+FUNCTION:  Publishes the changed states of an opener or virtual lock device to
+           the Indigo server in a single updateStatesOnServer call.
+   USAGE:  stateMirror.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A StateMirror instance is created for each started opener
+           device by the VirtualGarageDoor class and for each started virtual
+           lock device by the Plugin deviceStartComm method.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE stateMirror.py DESCRIPTION:
+
+Each updateStateOnServer and updateStateImageOnServer call is a separate
+round trip to the Indigo server, and each state update fires its own trigger
+and HomeKitLink Siri (HKLS) notification.  The StateMirror class keeps a local
+copy of the state values and the state image last published for a device.
+Its publish method sends only the changed states in one updateStatesOnServer
+call and updates the state image only if it has changed.
+
+The plugin is the only writer of the opener and virtual lock device states, so
+the local copy stays consistent with the server copy.  It is seeded from the
+device states when the device is started.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from logging import getLogger
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS StateMirror                              #
+#                                                                             #
+###############################################################################
+
+class StateMirror:
+    """
+    The StateMirror class holds the last published state values, uiValues,
+    and state image for a single opener or virtual lock device.  It also
+    counts the server calls made and the server calls saved as compared with
+    publishing each state and the state image in a separate call.
+    """
+
+    def __init__(self, dev, keys):
+        """
+        Seed the published states from the current device states for the
+        state keys that are managed by the plugin.  The uiValues and the
+        state image are not available from the device object, so they are
+        published the first time the publish method is called.
+        """
+        self._dev = dev
+        self._published = {key: (dev.states.get(key), None) for key in keys}
+        self._image = None
+
+        self.publications = 0
+        self.serverCalls = 0
+        self.serverCallsSaved = 0
+
+    def rebind(self, dev):
+        """
+        Publish with a new device object for the same device (e.g., after the
+        device is renamed).  The published states are retained.
+        """
+        self._dev = dev
+
+    def published(self, key):
+        """ Return the last published value for a state key. """
+        return self._published[key][0]
+
+    def publish(self, states, image):
+        """
+        Publish the changed states and the state image on the Indigo server.
+        states is a tuple of (key, value, uiValue) tuples where uiValue is None
+        if the state has no uiValue.  Send all changed states in one
+        updateStatesOnServer call.  Skip states whose value and uiValue are
+        unchanged from the last published values.  Update the state image only
+        if it has changed.  Return the number of server calls made.
+        """
+        keyValueList = []
+        for key, value, uiValue in states:
+            if self._published.get(key) != (value, uiValue):
+                self._published[key] = (value, uiValue)
+                keyValue = {'key': key, 'value': value}
+                if uiValue is not None:
+                    keyValue['uiValue'] = uiValue
+                keyValueList.append(keyValue)
+
+        serverCalls = 0
+        if keyValueList:
+            self._dev.updateStatesOnServer(keyValueList)
+            serverCalls += 1
+        if image != self._image:
+            self._image = image
+            self._dev.updateStateImageOnServer(image)
+            serverCalls += 1
+
+        # Count the server calls saved relative to one call per state plus one
+        # call for the state image.
+
+        serverCallsSaved = len(states) + 1 - serverCalls
+        self.publications += 1
+        self.serverCalls += serverCalls
+        self.serverCallsSaved += serverCallsSaved
+        L.debug('"%s" published %s changed states in %s server calls; %s '
+                'calls saved (%s total)', self._dev.name, len(keyValueList),
+                serverCalls, serverCallsSaved, self.serverCallsSaved)
+        return serverCalls
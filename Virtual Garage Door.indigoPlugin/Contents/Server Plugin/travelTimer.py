@@ -0,0 +1,193 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                            MODULE travelTimer.py                            #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  travelTimer.py
+   TITLE:  Built-in travel timers for opener devices
+FUNCTION:  Runs the travel timers for all opener devices that use the built-in
+           timer on a single timer thread and calls an expiration callback
+           when a timer expires.
+   USAGE:  travelTimer.py is included in the Virtual Garage Door.indigoPlugin
+           bundle.  A TravelTimer instance is created by the Plugin __init__
+           method, started by the Plugin startup method, and stopped by the
+           Plugin shutdown method.  It is used by VirtualGarageDoor instances
+           whose opener device ConfigUI selects the 'BUILT-IN' travel timer.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE travelTimer.py DESCRIPTION:
+
+An external travel timer device (Timers and Pesters plugin) costs a cross-
+plugin call to restart or stop the timer for each door movement, and the
+timer expiration is detected indirectly in the Plugin deviceUpdated method
+with a resolution of one second.  The TravelTimer class provides a built-in
+alternative.  It keeps a heap of (expirationTime, generation, key) entries
+that is serviced by a single daemon thread using the monotonic clock.  When a
+timer expires, the thread calls the callback that was provided when the
+timer was restarted.  For opener devices, the callback delivers a tt-exp
+event directly to the VirtualGarageDoor update method.
+
+Restarting or stopping a timer increments its generation number.  Heap entries
+with an old generation number are stale and are discarded when they reach the
+top of the heap.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+from heapq import heappop, heappush
+from logging import getLogger
+from threading import Condition, Thread
+from time import monotonic
+
+L = getLogger('Plugin')  # Standard Plugin logger.
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS TravelTimer                              #
+#                                                                             #
+###############################################################################
+
+class TravelTimer:
+    """
+    The TravelTimer class runs one-shot timers keyed by opener device id or,
+    for the debouncer hold times, by (devId, mDevTypeId) tuples.  It has the
+    following structure:
+
+    self._timers = {key: (generation, callback)}
+    self._heap = [(expirationTime, generation, key), ...]
+
+    A timer is active if its key is in the timers dictionary.  Only the heap
+    entry with the current generation number for the key is live.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._heap = []
+        self._timers = {}
+        self._generation = 0
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """ Start the timer thread. """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = Thread(target=self._run, name='travelTimer',
+                              daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """ Stop the timer thread and discard all active timers. """
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._timers.clear()
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def restart(self, key, travelTime, callback):
+        """
+        Start or restart the timer for key.  Call the callback with no
+        arguments when travelTime seconds have elapsed unless the timer is
+        restarted or cancelled first.
+        """
+        with self._condition:
+            self._generation += 1
+            self._timers[key] = (self._generation, callback)
+            heappush(self._heap, (monotonic() + travelTime, self._generation,
+                                  key))
+            self._condition.notify()
+
+    def cancel(self, key):
+        """ Stop the timer for key if it is active. """
+        with self._condition:
+            self._timers.pop(key, None)
+
+    def isActive(self, key):
+        """ Return True if the timer for key is active. """
+        return key in self._timers
+
+    def _run(self):
+        """
+        Timer thread.  Wait for the earliest live timer to expire and call its
+        callback without holding the lock.  Discard stale heap entries.  Log
+        and ignore exceptions raised by the callbacks.
+        """
+        while True:
+            with self._condition:
+                callback = None
+                while self._running and not callback:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    expirationTime, generation, key = self._heap[0]
+                    timer = self._timers.get(key)
+                    if not timer or timer[0] != generation:
+                        heappop(self._heap)  # Stale entry.
+                        continue
+                    wait = expirationTime - monotonic()
+                    if wait > 0.0:
+                        self._condition.wait(wait)
+                        continue
+                    heappop(self._heap)
+                    del self._timers[key]
+                    callback = timer[1]
+                if not self._running:
+                    return
+
+            try:
+                callback()
+            except Exception as errorMessage:
+                L.error('travel timer callback for device id %s failed: %s',
+                        key, errorMessage)
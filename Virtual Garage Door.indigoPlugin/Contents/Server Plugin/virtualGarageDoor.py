@@ -15,8 +15,8 @@ FUNCTION:  Receives and checks monitored device events from plugin.py.
            Uses the events to update door states and tracks.
    USAGE:  virtualGarageDoor.py is included in a standard Indigo plugin bundle.
   AUTHOR:  papamac
- VERSION:  1.5.0
-    DATE:  August 4, 2025
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
 
 
 UNLICENSE:
@@ -138,6 +138,69 @@ v1.5.0    8/4/2025  (1) Replace the opener device STOPPED and REVERSING states
                     value of the door status instead of the door state.
                     (7) Optionally log door state changes and door state tracks
                     based on new checkbox fields in the opener device ConfigUI.
+v1.6.0  10/16/2026  (1) Add a name property for use in Plugin log messages.
+                    (2) Compile the DOOR_STATE_TRANSITIONS dictionary once at
+                    module load into a dense TRANSITIONS table indexed by
+                    integer status and event codes.  Convert the transition
+                    functions nested in the update method to transition
+                    methods (new Part IV) and store them in the table cells so
+                    that update is a flat lookup-and-call.
+                    (3) Use the parsed DeviceConfig object passed by the Plugin
+                    deviceStartComm method instead of reading and parsing the
+                    opener device pluginProps on every event.  Use the
+                    precomputed travel timer expired events (ttExpEvents) to
+                    qualify tt-exp events.
+                    (4) Publish the changed opener device states in a single
+                    updateStatesOnServer call using a StateMirror instance
+                    (new stateMirror.py module).  Skip unchanged states and an
+                    unchanged state image.
+                    (5) Keep the door status, opener direction, prior event,
+                    and virtual lock state in instance attributes that are the
+                    source of truth for the door and expose them as read-only
+                    properties.  Treat the opener device states on the server
+                    as a write-only mirror; never read dev.states in update.
+                    (6) Replace the unbounded door state track string with a
+                    fixed-capacity ring buffer of (eventTime, eventCode,
+                    newStatusCode) records using monotonic event times.
+                    Render the track text only when it is logged or queried
+                    (new doorStateTrack property).
+                    (7) Optionally use the built-in travel timer (new
+                    travelTimer.py module) to deliver tt-exp events directly
+                    to the update method.  Serialize update calls from the
+                    Plugin and timer threads with a lock.
+                    (8) Optionally record the execution times of the update,
+                    _updateOpenerStatesOnServer, and transition methods and
+                    count ignored and rejected events in a per-door
+                    statistics group (new performanceStats.py module).
+                    (9) Put built-in travel timer tt-exp events in the
+                    Plugin's event queue (new eventQueue.py module) so that
+                    they are processed in order with the other events for the
+                    door.
+                    (10) Submit the travel timer device actions and the
+                    vibration sensor, virtual lock, and mechanical lock
+                    commands issued by the transition methods to the
+                    Plugin's command dispatcher (new commandDispatcher.py
+                    module).  The commands are executed off the event
+                    processing path, and superseded commands (e.g., a
+                    restartTimer followed by a stopTimer) are coalesced.
+                    (11) Limit the 1-second duplicate event check in the
+                    update method to events from monitored devices that are
+                    not debounced.  Sensor bounce is filtered before the
+                    events are queued by the Plugin's debouncer (new
+                    debouncer.py module).
+                    (12) Accept an optional monotonic event time in the update
+                    method for events that are put in order by the Plugin's
+                    reorder buffer (new reorderBuffer.py module).  Use it in
+                    the door state track instead of the processing time.
+                    (13) Record a warm-start snapshot of the door status,
+                    opener direction, prior event, and door state track after
+                    every accepted transition (new doorSnapshot.py module).
+                    Add a restore
+                    method to resume a door from its snapshot when the Plugin
+                    restarts.
+                    (14) Add a reconfigure method to replace the opener device
+                    object and the DeviceConfig object of a running door
+                    without a restart.
 """
 ###############################################################################
 #                                                                             #
@@ -146,13 +209,20 @@ v1.5.0    8/4/2025  (1) Replace the opener device STOPPED and REVERSING states
 ###############################################################################
 
 __author__ = 'papamac'
-__version__ = '1.5.0'
-__date__ = 'August 4, 2025'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
 
 import indigo
 
-from datetime import datetime
+from collections import deque
+from functools import partial
 from logging import getLogger
+from threading import RLock
+from time import monotonic, perf_counter
+
+from doorSnapshot import toMonotonicTime, toWallTime
+from performanceStats import PerformanceStats
+from stateMirror import StateMirror
 
 L = getLogger('Plugin')  # Standard Plugin logger.
 
@@ -171,15 +241,16 @@ class VirtualGarageDoor:
     virtual door state tracks and updates all door states in real time on the
     Indigo server.  It has four primary instance methods as follows:
 
-    __init__(self, plugin, dev, doorStatus)
+    __init__(self, dev, config, startupDoorStatus, startupLockState)
         Initializes instance attributes including the door state track.  Sets
-        the initial door states on the Indigo server using the doorStatus
-        argument.  It is called by the Plugin deviceStartComm method for each
-        new instance (one for each opener device).
+        the initial door states on the Indigo server using the
+        startupDoorStatus argument.  It is called by the Plugin
+        deviceStartComm method for each new instance (one for each opener
+        device).
 
-    _updateOpenerStatesOnServer(self, dev, doorStatus)
+    _updateOpenerStatesOnServer(self)
         Updates the door state, the door status, the on/off state, and the
-        state image on the Indigo server.
+        state image on the Indigo server in a single batch.
 
     _timerAction(self, action)
         Executes the requested action for the travel timer associated with the
@@ -187,17 +258,19 @@ class VirtualGarageDoor:
 
     update(self, event)
         Updates the door states and the door state track in response to a new
-        event.  It is called by the Plugin deviceUpdated method.  update
-        implements a state machine model of the garage door using the
-        DOOR_STATE_TRANSITIONS class data structure that includes a new door
-        status and transition functions for each transition.
+        event.  It is called for events queued by the Plugin deviceUpdated
+        method.  update implements a state machine model of the garage door
+        using the TRANSITIONS table compiled from the DOOR_STATE_TRANSITIONS
+        class data structure that includes a new door status and transition
+        methods for each transition.
 
-    The VirtualGarageDoor class is segmented into three major parts for
+    The VirtualGarageDoor class is segmented into four major parts for
     readability:
 
     I   CLASS CONSTANTS,
     II  INITIALIZATION AND SUPPORT METHODS,
-    III UPDATE METHOD
+    III UPDATE METHOD,
+    IV  TRANSITION METHODS
     """
 
     ###########################################################################
@@ -264,13 +337,11 @@ class VirtualGarageDoor:
     # garage door.  It is keyed by a current door status and an event that
     # defines an allowed transition to a new door status.  Its value is a tuple
     # containing the new door status and an embedded tuple of transition
-    # function names.  Transition functions are defined and called in the
-    # update method.  Usage is as follows:
-
-    # newDoorStatus = DOOR_STATE_TRANSITIONS[doorStatus][event][0]
-    # transitionFunctions = DOOR_STATE_TRANSITIONS[doorStatus][event][1]
-    # for transitionFunction in transitionFunctions:
-    #     locals()[transitionFunction]()
+    # method names.  Transition methods are defined in Part IV.  The
+    # dictionary is the human-readable source for the state machine; it is
+    # compiled once at class load by the _compileTransitions class method into
+    # the integer-indexed TRANSITIONS table (see below) that is used by the
+    # update method.
 
     # The transition entries in the DOOR_STATE_TRANSITIONS data structure
     # define the door state tracking logic for the plugin (see the Design wiki,
@@ -378,9 +449,54 @@ class VirtualGarageDoor:
              'ps-on':          ('closed-lk', ()),                                # tracking only
              'ml-off':         ('closed-lk', ())}}                               # tracking only
 
+    # Opener device state keys that are published by the
+    # _updateOpenerStatesOnServer method.
+
+    OPENER_STATE_KEYS = ('doorState', 'doorStatus', 'onOffState')
+
+    # Virtual lock states keyed by virtual lock events.
+
+    LOCK_EVENTS = {'vl-on': True, 'vl-off': False}
+
+    # Maximum number of transition records saved in the door state track
+    # ring buffer.  Older records are dropped if the track is not logged
+    # before the capacity is reached (e.g., tracking-only events while the
+    # door is LOCKED).
+
+    TRACK_CAPACITY = 64
+
     # Monitored device events that can't affect the door state.
 
-    IGNORED_EVENTS = ('ar-off', 'vs-off', 'tt-on', 'tt-off')
+    IGNORED_EVENTS = frozenset(('ar-off', 'vs-off', 'tt-on', 'tt-off'))
+
+    # Interval in seconds for the duplicate event check.  Repeated events
+    # from monitored devices that are not debounced are discarded within
+    # this interval.
+
+    DUPLICATE_EVENT_INTERVAL = 1.0
+
+    # Compiled door state transitions:
+
+    # The following class attributes are set by the _compileTransitions class
+    # method when the module is loaded.  DOOR_STATUSES is a tuple of the door
+    # status values in DOOR_STATE_TRANSITIONS order; the index of a door
+    # status in the tuple is its integer status code.  EVENTS is a tuple of
+    # all events that appear in DOOR_STATE_TRANSITIONS; the index of an event
+    # in the tuple is its integer event code.  DOOR_STATUS_CODES and
+    # EVENT_CODES are the inverse dictionaries.  TRANSITIONS is a dense tuple
+    # of tuples indexed by status code and event code.  Each cell is either
+    # None (transition not allowed) or a tuple containing the new status code
+    # and a tuple of transition method functions.  Usage is as follows:
+
+    # newStatusCode, transitionMethods = TRANSITIONS[statusCode][eventCode]
+    # for transitionMethod in transitionMethods:
+    #     transitionMethod(self)
+
+    DOOR_STATUSES = ()
+    DOOR_STATUS_CODES = {}
+    EVENTS = ()
+    EVENT_CODES = {}
+    TRANSITIONS = ()
 
     # Timer constants:
 
@@ -401,41 +517,221 @@ class VirtualGarageDoor:
     #                                                                         #
     #                   INITIALIZATION AND SUPPORT METHODS                    #
     #                                                                         #
-    #  def __init__(self, plugin, dev, doorStatus)                            #
-    #  def _updateOpenerStatesOnServer(self, doorStatus)                      #
+    #  def __init__(self, dev, config, startupDoorStatus)                     #
+    #  def name(self)                                                         #
+    #  def doorStatus(self)                                                   #
+    #  def doorState(self)                                                    #
+    #  def openerDirection(self)                                              #
+    #  def priorEvent(self)                                                   #
+    #  def lockState(self)                                                    #
+    #  def doorStateTrack(self)                                               #
+    #  def snapshot(self)                                                     #
+    #  def restore(self, snapshot)                                            #
+    #  def reconfigure(self, dev, config)                                     #
+    #  def _updateOpenerStatesOnServer(self)                                  #
+    #  def _renderDoorStateTrack(self)                                        #
+    #  def _dispatch(self, slot, description, function)                       #
     #  def _timerAction(self, action)                                         #
+    #  def _travelTimerExpired(self)                                          #
+    #  def _compileTransitions(cls)                                           #
     #                                                                         #
     ###########################################################################
 
-    def __init__(self, dev, startupDoorStatus):
+    def __init__(self, dev, config, startupDoorStatus, startupLockState=False,
+                 travelTimer=None, performanceStats=None, eventQueue=None,
+                 commandDispatcher=None, doorSnapshot=None):
         """
         Initialize local instance attributes including the starting door state
-        track.  Set the initial door states on the Indigo server.
+        track.  Set the initial door states on the Indigo server.  The config
+        argument is the parsed DeviceConfig object for the opener device.  The
+        startupLockState argument is the startup state of the linked virtual
+        lock device (True if LOCKED).  The travelTimer argument is the
+        Plugin's TravelTimer instance (see the travelTimer module); it is
+        used only if the opener device selects the built-in travel timer.
+        The performanceStats argument is the Plugin's PerformanceStats
+        instance (see the performanceStats module).  The door's execution
+        times and event counts are recorded in it when it is enabled.  The
+        eventQueue argument is the Plugin's ReorderBuffer instance in front
+        of its event queue (see the reorderBuffer and eventQueue modules).
+        Built-in travel timer events are put in it.  The
+        commandDispatcher argument is the Plugin's CommandDispatcher instance
+        (see the commandDispatcher module).  The server commands issued by
+        the transition methods are submitted to it.  The doorSnapshot
+        argument is the Plugin's DoorSnapshot instance (see the doorSnapshot
+        module).  A snapshot of the door is recorded in it after every
+        accepted transition.
+
+        The door status, opener direction, prior event, and lock state
+        attributes are the source of truth for the door.  They are read only
+        by the update method and the properties defined below.  The opener
+        device states on the Indigo server are a write-only mirror of these
+        attributes; they are never read back.
 
         The door state track is a time sequence of transitions as the door
-        moves through its operational cycle. Each transition is a string of the
-        form:
+        moves through its operational cycle.  Transitions are saved as compact
+        (eventTime, eventCode, newStatusCode) records in a fixed-capacity ring
+        buffer (see TRACK_CAPACITY in Part I).  The track text is rendered by
+        the _renderDoorStateTrack method only when it is logged or queried.
+        Each transition is rendered as a string of the form:
 
-        ' -> timeSinceLastEvent event -> newDoorStatus',
+        ' -> timeSincePriorTransition event -> newDoorStatus',
 
         and tracks look like:
 
-        'initialStatus -> timeSinceLastEvent event1 -> newDoorStatus1 -> timeSinceEvent1 event2 -> newDoorStatus2...'
+        'initialStatus -> dt1 event1 -> newDoorStatus1 -> dt2 event2 -> ...'
         """
 
         # Initialize local instance attributes.
 
         self._dev = dev
+        self._config = config
+        self._travelTimer = travelTimer if config.ttBuiltIn else None
+        self._eventQueue = eventQueue
+        self._commandDispatcher = commandDispatcher
+        self._doorSnapshot = doorSnapshot
+        self._updateLock = RLock()  # Serialize update calls (see update).
+        self._performanceStats = performanceStats or PerformanceStats()
+        self._doorStats = self._performanceStats.door(dev.id)
+        self._statusCode = self.DOOR_STATUS_CODES[startupDoorStatus]
+        self._doorStatus = startupDoorStatus
         self._openerDirection = 0  # 0 --> opening, 1 --> closing.
         self._priorEvent = None
-        self._priorEventTime = datetime.now()
+        self._priorEventTime = monotonic()
+        self._lockState = bool(startupLockState)
+
+        # Transition context for the transition methods (see Part IV).
+
+        self._priorDoorStatus = startupDoorStatus
+        self._event = ''
 
-        # Set the startup opener states and initialize the door state track.
+        # Create the state mirror for the opener device states (see the
+        # stateMirror module).  Set the startup opener states and initialize
+        # the door state track.
 
-        self._updateOpenerStatesOnServer(startupDoorStatus)
-        self._doorStateTrack = startupDoorStatus.upper()
+        self._stateMirror = StateMirror(dev, self.OPENER_STATE_KEYS)
+        self._updateOpenerStatesOnServer()
+        self._track = deque(maxlen=self.TRACK_CAPACITY)
+        self._trackStatusCode = self._statusCode
+        self._trackStartTime = self._priorEventTime
+        self._trackDropped = 0
+
+    @property
+    def name(self):
+        """
+        Return the opener device name for use in Plugin log messages.  The
+        name is current because the reconfigure method is called on a name
+        change.
+        """
+        return self._dev.name
+
+    @property
+    def doorStatus(self):
+        """ Return the current door status. """
+        return self._doorStatus
+
+    @property
+    def doorState(self):
+        """ Return the current integer door state. """
+        return self.DOOR_STATES[self._doorStatus]
+
+    @property
+    def openerDirection(self):
+        """ Return the opener direction (0 --> opening, 1 --> closing). """
+        return self._openerDirection
+
+    @property
+    def priorEvent(self):
+        """ Return the last event that was not ignored. """
+        return self._priorEvent
+
+    @property
+    def lockState(self):
+        """ Return the virtual lock state (True if LOCKED). """
+        return self._lockState
+
+    @property
+    def doorStateTrack(self):
+        """ Return the rendered text of the current door state track. """
+        return self._renderDoorStateTrack()
+
+    def snapshot(self):
+        """
+        Return a warm-start snapshot of the door as a JSON-serializable
+        dictionary.  Times are converted to wall clock times and codes to
+        door status and event names so that the snapshot remains valid
+        across restarts and changes to DOOR_STATE_TRANSITIONS.
+        """
+        return {'devId': self._dev.id,
+                'doorStatus': self._doorStatus,
+                'openerDirection': self._openerDirection,
+                'priorEvent': self._priorEvent,
+                'priorEventTime': toWallTime(self._priorEventTime),
+                'trackStatus': self.DOOR_STATUSES[self._trackStatusCode],
+                'trackStartTime': toWallTime(self._trackStartTime),
+                'trackDropped': self._trackDropped,
+                'track': [(toWallTime(eventTime), self.EVENTS[eventCode],
+                           self.DOOR_STATUSES[newStatusCode])
+                          for eventTime, eventCode, newStatusCode
+                          in self._track]}
+
+    def restore(self, snapshot):
+        """
+        Resume the door from a snapshot returned by the snapshot method.  The
+        door status is set by the Plugin deviceStartComm method when the
+        VirtualGarageDoor instance is created; restore the opener direction,
+        the prior event, and the door state track.  Discard a track with a
+        status or event that is no longer in DOOR_STATE_TRANSITIONS.
+
+        If the door is moving and the built-in travel timer is selected,
+        restart the timer for the travel time remaining after the prior
+        event.  An external timer device continues to run during a restart.
+        """
+        with self._updateLock:
+            self._openerDirection = 1 if snapshot['openerDirection'] else 0
+            self._priorEvent = snapshot['priorEvent']
+            self._priorEventTime = min(
+                toMonotonicTime(snapshot['priorEventTime']), monotonic())
+
+            trackStatusCode = self.DOOR_STATUS_CODES.get(
+                snapshot['trackStatus'])
+            try:
+                track = [(toMonotonicTime(eventTime), self.EVENT_CODES[event],
+                          self.DOOR_STATUS_CODES[newDoorStatus])
+                         for eventTime, event, newDoorStatus
+                         in snapshot['track']]
+            except KeyError:
+                trackStatusCode = None
+            if trackStatusCode is not None:
+                self._track.clear()
+                self._track.extend(track)
+                self._trackStatusCode = trackStatusCode
+                self._trackStartTime = toMonotonicTime(
+                    snapshot['trackStartTime'])
+                self._trackDropped = snapshot['trackDropped']
+
+            if self._travelTimer and self._doorStatus in ('opening',
+                                                          'closing'):
+                remaining = self._config.tTime - (monotonic()
+                                                  - self._priorEventTime)
+                self._travelTimer.restart(self._dev.id, max(remaining, 0.0),
+                                          self._travelTimerExpired)
+
+    def reconfigure(self, dev, config):
+        """
+        Replace the opener device object and the parsed DeviceConfig object
+        after a name or pluginProps change that does not change the door model
+        (see the Plugin didDeviceCommPropertyChange method) or after a
+        monitored sensor is quarantined or readmitted, which changes only the
+        travel timer expired event qualifiers.  The door status, opener
+        direction, prior event, and door state track are retained.  The new
+        configuration takes effect with the next event.
+        """
+        with self._updateLock:
+            self._dev = dev
+            self._config = config
+            self._stateMirror.rebind(dev)
 
-    def _updateOpenerStatesOnServer(self, newDoorStatus):
+    def _updateOpenerStatesOnServer(self):
         """
         Update and optionally log the opener device states on the Indigo server
         if they have changed.  The states include the doorState, the doorStatus
@@ -444,32 +740,28 @@ class VirtualGarageDoor:
         is CLOSED and off otherwise.
 
         Also, set the state image on the Indigo Home window based on the value
-        of the newDoorStatus.  Select a green dot if the newDoorStatus is
-        'closed', a green lock if the newDoorStatus is 'closed-lk', and a red
-        dot otherwise.
+        of the door status.  Select a green dot if the door status is 'closed',
+        a green lock if the door status is 'closed-lk', and a red dot
+        otherwise.
+
+        Publish the changed states and the state image using the state mirror
+        so that a transition costs at most two server calls.  The states are
+        computed from the in-memory door status; server states are not read.
         """
 
-        # Proceed only if the newDoorStatus has changed from the current door
+        # Proceed only if the door status has changed from the published door
         # status.
 
-        doorStatus = self._dev.states['doorStatus']
-        if newDoorStatus == doorStatus:
+        newDoorStatus = self._doorStatus
+        if newDoorStatus == self._stateMirror.published('doorStatus'):
             return
 
-        # Compute, update, and optionally log the new opener states.
+        # Compute the new opener states.
 
         doorState = self.DOOR_STATES[newDoorStatus]
-        self._dev.updateStateOnServer('doorState', doorState)
-
-        self._dev.updateStateOnServer('doorStatus', newDoorStatus)
-
         onOffState = doorState is self.CLOSED
-        self._dev.updateStateOnServer('onOffState', onOffState,
-                                      uiValue=newDoorStatus)
-        if self._dev.pluginProps['logDoorStateChanges']:
-            L.info('"%s" update to %s', self._dev.name, newDoorStatus.upper())
 
-        # Select and update the state image.
+        # Select the state image.
 
         if newDoorStatus == 'closed':  # The door is CLOSED, but not LOCKED.
             image = indigo.kStateImageSel.SensorOn  # Select a green dot.
@@ -477,18 +769,125 @@ class VirtualGarageDoor:
             image = indigo.kStateImageSel.Locked  # Select a green lock.
         else:  # The door is not CLOSED and not LOCKED.
             image = indigo.kStateImageSel.SensorTripped  # Select a red dot.
-        self._dev.updateStateImageOnServer(image)
+
+        # Publish and optionally log the new opener states.
+
+        self._stateMirror.publish((('doorState', doorState, None),
+                                   ('doorStatus', newDoorStatus, None),
+                                   ('onOffState', onOffState, newDoorStatus)),
+                                  image)
+        if self._config.logDoorStateChanges:
+            L.info('"%s" update to %s', self._dev.name, newDoorStatus.upper())
+
+    def _renderDoorStateTrack(self):
+        """
+        Render the door state track text from the initial door status and the
+        transition records in the ring buffer.  If older records were dropped
+        from the ring buffer, indicate the omission with an ellipsis and
+        measure the first time interval from the first saved record.
+        """
+        if self._trackDropped:
+            text = '%s -> ...(%s)' % (
+                self.DOOR_STATUSES[self._trackStatusCode].upper(),
+                self._trackDropped)
+            priorTime = self._track[0][0]
+        else:
+            text = self.DOOR_STATUSES[self._trackStatusCode].upper()
+            priorTime = self._trackStartTime
+
+        for eventTime, eventCode, newStatusCode in self._track:
+            dt = eventTime - priorTime
+            priorTime = eventTime
+            timeText = ('%im' % int(round(dt / 60.0)) if dt >= 60.0
+                        else '%.2fs' % dt)
+            text += ' -> %s %s -> %s' % (
+                timeText, self.EVENTS[eventCode],
+                self.DOOR_STATUSES[newStatusCode].upper())
+        return text
+
+    def _dispatch(self, slot, description, function):
+        """
+        Submit a server command to the command dispatcher, if any, for
+        execution off the event processing path.  A pending command for the
+        same slot (target) is superseded.  Execute the command immediately if
+        there is no dispatcher.
+        """
+        if self._commandDispatcher:
+            self._commandDispatcher.submit(self._dev.id, slot, description,
+                                           function)
+        else:
+            function()
 
     def _timerAction(self, action):
         """
-        Execute the requested timer action for the travel timer associated with
-        the opener device.  Ignore the action if there is no timer available.
+        Execute the requested timer action ('restartTimer' or 'stopTimer') for
+        the travel timer associated with the opener device.  Use the built-in
+        travel timer if it is selected; otherwise, dispatch the action for
+        the external timer device.  A pending action for the timer device is
+        superseded by the new action.  Ignore the action if there is no timer
+        available.
         """
         L.threaddebug('_timerAction called "%s"', self._dev.name)
 
-        ttDevId = self._dev.pluginProps.get('ttDevId')
+        if self._travelTimer:  # Built-in timer is selected.
+            if action == 'restartTimer':
+                self._travelTimer.restart(self._dev.id, self._config.tTime,
+                                          self._travelTimerExpired)
+            else:
+                self._travelTimer.cancel(self._dev.id)
+            return
+
+        ttDevId = self._config.ttDevId
         if ttDevId:  # Timer is available.
-            self.TIMER.executeAction(action, deviceId=int(ttDevId))
+            self._dispatch(('timer', ttDevId), action,
+                           partial(self.TIMER.executeAction, action,
+                                   deviceId=ttDevId))
+
+    def _travelTimerExpired(self):
+        """
+        Built-in travel timer expiration callback.  It is called on the travel
+        timer thread.  Put a tt-exp event in the event queue, if any, so that
+        it is processed in order with the other events for the door;
+        otherwise, deliver it directly to the update method.
+        """
+        L.debug('"%s" event tt-exp', self._dev.name)
+        if self._eventQueue:
+            self._eventQueue.put(self._dev.id, self.update, 'tt-exp')
+        else:
+            self.update('tt-exp')
+
+    @classmethod
+    def _compileTransitions(cls):
+        """
+        Compile the DOOR_STATE_TRANSITIONS dictionary into the integer-indexed
+        TRANSITIONS table and the status/event code tuples and dictionaries
+        described in Part I.  Resolve the transition method names to method
+        functions so that the update method only indexes and calls.  This
+        method is called once when the module is loaded.
+        """
+        doorStatuses = tuple(cls.DOOR_STATE_TRANSITIONS)
+        events = tuple(dict.fromkeys(
+            event for transitions in cls.DOOR_STATE_TRANSITIONS.values()
+            for event in transitions))
+
+        cls.DOOR_STATUSES = doorStatuses
+        cls.DOOR_STATUS_CODES = {doorStatus: statusCode for statusCode,
+                                 doorStatus in enumerate(doorStatuses)}
+        cls.EVENTS = events
+        cls.EVENT_CODES = {event: eventCode for eventCode,
+                           event in enumerate(events)}
+
+        transitions = []
+        for doorStatus in doorStatuses:
+            row = [None] * len(events)
+            for event, (newDoorStatus, methodNames) \
+                    in cls.DOOR_STATE_TRANSITIONS[doorStatus].items():
+                methods = tuple(getattr(cls, methodName)
+                                for methodName in methodNames)
+                row[cls.EVENT_CODES[event]] = (
+                    cls.DOOR_STATUS_CODES[newDoorStatus], methods)
+            transitions.append(tuple(row))
+        cls.TRANSITIONS = tuple(transitions)
 
     ###########################################################################
     #                                                                         #
@@ -504,162 +903,70 @@ class VirtualGarageDoor:
     #                                                                         #
     #                              UPDATE METHOD                              #
     #                                                                         #
-    #  def update(self, event)                                                #
+    #  def update(self, event, eventTime=None)                                #
+    #  def _update(self, event, eventTime)                                    #
     #                                                                         #
     ###########################################################################
 
-    def update(self, event):
+    def update(self, event, eventTime=None):
         """
         Update the door states and the door state track in response to the
-        event provided in the argument.
+        event provided in the argument.  eventTime is the monotonic time of
+        the event if it is known (see the reorderBuffer module); otherwise,
+        the event is timed when it is processed.
 
         Check for a valid event and add event qualifiers for travel timer
         events that are dependent on the door status.  Look up the new door
-        status in the DOOR_STATE_TRANSITIONS dictionary and update the door
-        states on the Indigo server. Update the door state track with a new
-        transition including the time since the last event, the event, and the
-        new door status.  Perform transition functions as specified in the
-        DOOR_STATE_TRANSITIONS dictionary.
-        """
-
-        # The transition functions for use in the DOOR_STATE_TRANSITIONS data
-        # structure are defined below.  All functions include the same
-        # threaddebug log statement.
-
-        def _lock():
-            """
-            The door status is 'closed' and a ls-off, ps-off or ml-on event
-            occurred to intentionally lock it.  Execute a plugin action to lock
-            the virtual lock.
-            """
-            L.threaddebug('_lock called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            vlDevId = self._dev.pluginProps['vlDevId']
-            indigo.device.lock(int(vlDevId))
-
-        def _lock_ac():
-            """
-            The door was CLOSED.  Check to see if the lock after closing option
-            was requested.  If so, call the _lock function to lock the virtual
-            lock.
-            """
-            L.threaddebug('_lock_ac called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            if self._dev.pluginProps.get('lockAfterClosing'):  # lac requested.
-                _lock()
-
-        def _log():
-            """
-            Log the current door state track if requested and start a new track
-            beginning with the new door status.
-            """
-            L.threaddebug('_log called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            if self._dev.pluginProps['logDoorStateTracks']:
-                L.info('"%s" %s', self._dev.name, self._doorStateTrack)
-            self._doorStateTrack = newDoorStatus.upper()
-
-        def _rev():
-            """ The door was obstructed.  Reverse the opener direction. """
-            L.threaddebug('_rev called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            self._openerDirection ^= 1  # Reverse the opener direction.
-
-        def _start():
-            """
-            The door is moving.  Set the opener direction using the new door
-            status and restart the travel timer.
-            """
-            L.threaddebug('_start called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            if newDoorStatus == 'opening':
-                self._openerDirection = 0
-            elif newDoorStatus == 'closing':
-                self._openerDirection = 1
-
-            self._timerAction('restartTimer')
-
-        def _stop():
-            """
-            The door has reached a stationary state.  Stop the travel timer.
-            Also, reset the vibration sensor if present.
-            """
-            L.threaddebug('_stop called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            self._timerAction('stopTimer')
-
-            vsDevId = self._dev.pluginProps['vsDevId']
-            if vsDevId:  # Vibration sensor is present.
-                vsResetDelay = int(round(float(
-                    self._dev.pluginProps['vsResetDelay'])))
-                indigo.device.turnOff(int(vsDevId), delay=vsResetDelay)
-
-        def _unlock_ml():
-            """
-            The door is not CLOSED and an anomalous ml-on event occurred
-            putting it in the OBSTRUCTED state.  Immediately unlock the
-            mechanical lock and log a warning message to inform the user and
-            provide direction to close the door.
-            """
-            L.threaddebug('_unlock_ml called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            mlDevId = self._dev.pluginProps['mlDevId']
-            indigo.device.turnOff(int(mlDevId))
-            L.warning('"%s" the mechanical lock was LOCKED when the door was '
-                      '%s and was then automatically UNLOCKED; manually '
-                      'activate the door to close it.',
-                      self._dev.name, doorStatus.upper())
-
-        def _warn_ls():
-            """
-            The door is not CLOSED and an anomalous ls-off event occurred
-            putting it in the OBSTRUCTED state.  Log a warning message to
-            inform the user and provide direction to close the door.
-            """
-            L.threaddebug('_warn_ls called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            L.warning('"%s" the latch was disconnected when the door was %s; '
-                      'move the door manually if needed and reconnect the '
-                      'latch.', self._dev.name, doorStatus.upper())
-
-        def _warn_ps():
-            """
-            The door is not CLOSED and an anomalous ps-off event occurred
-            putting it in the OBSTRUCTED state.  Log a warning message to
-            inform the user and provide direction to close the door.
-            """
-            L.threaddebug('_warn_ps called "%s" %s%s',
-                          self._dev.name, doorStatus.upper(), transition)
-
-            L.warning('"%s" the power switch was turned off when the door was '
-                      '%s; turn on the switch and manually activate the door '
-                      'to close it.', self._dev.name, doorStatus.upper())
+        status in the compiled TRANSITIONS table using the in-memory door
+        status, save it, and update the door states on the Indigo server.
+        Append a transition record with the event time, the event code, and
+        the new status code to the door state track.  Perform transition
+        methods as specified in the table.
+
+        update is called by the Plugin's event queue workers and, if there
+        is no event queue, by the built-in travel timer thread.  Calls are
+        serialized with a reentrant lock.  If performance statistics are
+        enabled, record the execution time of the update.
+        """
+        with self._updateLock:
+            if self._performanceStats.enabled:
+                startTime = perf_counter()
+                self._update(event, eventTime)
+                self._doorStats.record('update', perf_counter() - startTime)
+            else:
+                self._update(event, eventTime)
+
+    def _update(self, event, eventTime):
+        """ Perform the update method with the update lock held. """
+        timing = self._performanceStats.enabled
 
         # Ignore events that can't affect the door state.
 
         if event in self.IGNORED_EVENTS:
+            if timing:
+                self._doorStats.count('ignored')
             return
 
         # Compute the time since the last event.
 
-        eventTime = datetime.now()
-        dt = eventTime - self._priorEventTime
-        timeSinceLastEvent = dt.total_seconds()
+        if eventTime is None:
+            eventTime = monotonic()
+        elif eventTime < self._priorEventTime:  # Keep the track in order.
+            eventTime = self._priorEventTime
+        timeSinceLastEvent = eventTime - self._priorEventTime
         self._priorEventTime = eventTime
 
-        # Check for a duplicate event within a 1-second interval.
+        # Check for a duplicate event within a 1-second interval.  Events
+        # from debounced devices are filtered by the Plugin's debouncer and
+        # are not checked.
 
-        if event == self._priorEvent and timeSinceLastEvent < 1.0:
+        if (event == self._priorEvent
+                and timeSinceLastEvent < self.DUPLICATE_EVENT_INTERVAL
+                and event[:2] not in self._config.debounceTimes):
             L.warning('"%s" duplicate event %s reported within 1 second',
                       self._dev.name, event)
+            if timing:
+                self._doorStats.count('duplicate')
             return
         self._priorEvent = event
 
@@ -667,46 +974,244 @@ class VirtualGarageDoor:
         # meanings based on the opener direction.
 
         if event == 'tt-exp':
-            if not self._openerDirection:  # Direction is opening.
-                osDevId = self._dev.pluginProps['osDevId']
-                event += '&os-none' if not osDevId else ''
-            else:  # Direction is closing.
-                csDevId = self._dev.pluginProps['csDevId']
-                event += '&cs-none' if not csDevId else ''
-
-        # Get the new door state from the DOOR_STATE_TRANSITIONS dictionary as
-        # a function of the current door status and the event.
+            event = self._config.ttExpEvents[self._openerDirection]
 
-        doorStatus = self._dev.states['doorStatus']
+        # Get the new door status and the transition methods from the
+        # TRANSITIONS table as a function of the in-memory door status and the
+        # event.
 
-        try:
-            newDoorStatus = self.DOOR_STATE_TRANSITIONS[doorStatus][event][0]
+        doorStatus = self._doorStatus
+        eventCode = self.EVENT_CODES.get(event)
+        cell = (None if eventCode is None else
+                self.TRANSITIONS[self._statusCode][eventCode])
 
-        except KeyError:  # Event is not in the dictionary for the door status.
+        if cell is None:  # Event is not allowed for the door status.
             L.warning('"%s" event %s is not in the dictionary for the door '
                       'state %s; event ignored',
                       self._dev.name, event, doorStatus.upper())
+            if timing:
+                self._doorStats.count('rejected')
             return
 
-        # Valid new door status.  Update door states on server if the
-        # door status has changed.
+        newStatusCode, transitionMethods = cell
+        newDoorStatus = self.DOOR_STATUSES[newStatusCode]
 
-        self._updateOpenerStatesOnServer(newDoorStatus)
+        # Track the virtual lock state of an accepted lock event independent
+        # of the door status.
 
-        # Format a transition string in the form of
-        # -> timeSinceLastEvent event -> newDoorStatus and append it to the
-        # door state track.
+        lockState = self.LOCK_EVENTS.get(event)
+        if lockState is not None:
+            self._lockState = lockState
 
-        if timeSinceLastEvent >= 60.0:
-            timeText = '%im' % int(round(timeSinceLastEvent / 60.0))
+        # Valid new door status.  Save it and update the door states on the
+        # server if the door status has changed.
+
+        self._statusCode = newStatusCode
+        self._doorStatus = newDoorStatus
+        if timing:
+            startTime = perf_counter()
+            self._updateOpenerStatesOnServer()
+            self._doorStats.record('_updateOpenerStatesOnServer',
+                                   perf_counter() - startTime)
         else:
-            timeText = '%.2fs' % timeSinceLastEvent
-        transition = ' -> %s %s -> %s' % (timeText, event,
-                                          newDoorStatus.upper())
-        self._doorStateTrack += transition
+            self._updateOpenerStatesOnServer()
+
+        # Append a transition record to the door state track ring buffer.
+        # Count the oldest record if it is dropped.
+
+        track = self._track
+        if len(track) == self.TRACK_CAPACITY:
+            self._trackDropped += 1
+        track.append((eventTime, eventCode, newStatusCode))
+
+        # Save the transition context for the transition methods and execute
+        # them.  Record their execution times by method name if performance
+        # statistics are enabled.
+
+        self._priorDoorStatus = doorStatus
+        self._event = event
+        for transitionMethod in transitionMethods:
+            if timing:
+                startTime = perf_counter()
+                transitionMethod(self)
+                self._doorStats.record(transitionMethod.__name__,
+                                       perf_counter() - startTime)
+            else:
+                transitionMethod(self)
+
+        # Record a warm-start snapshot of the door after every accepted
+        # transition.  The snapshot is written to the file by the door
+        # snapshot writer thread.
+
+        if self._doorSnapshot:
+            self._doorSnapshot.record(self.snapshot())
+
+    ###########################################################################
+    #                                                                         #
+    #                         CLASS VirtualGarageDoor                         #
+    #                                   PART                                  #
+    #                                                                         #
+    #                             III   III     III                           #
+    #                              I     I       I                            #
+    #                              I      I     I                             #
+    #                              I       I   I                              #
+    #                              I        I I                               #
+    #                             III       III                               #
+    #                                                                         #
+    #                           TRANSITION METHODS                            #
+    #                                                                         #
+    #  def _lock(self)                                                        #
+    #  def _lock_ac(self)                                                     #
+    #  def _log(self)                                                         #
+    #  def _rev(self)                                                         #
+    #  def _start(self)                                                       #
+    #  def _stop(self)                                                        #
+    #  def _unlock_ml(self)                                                   #
+    #  def _warn_ls(self)                                                     #
+    #  def _warn_ps(self)                                                     #
+    #                                                                         #
+    ###########################################################################
+
+    # The transition methods for use in the DOOR_STATE_TRANSITIONS data
+    # structure are defined below.  They are called by the update method with
+    # the transition context in the _priorDoorStatus, _event, and _doorStatus
+    # (new door status) instance attributes.  All methods include the
+    # same threaddebug log statement.
+
+    def _lock(self):
+        """
+        The door status is 'closed' and a ls-off, ps-off or ml-on event
+        occurred to intentionally lock it.  Execute a plugin action to lock
+        the virtual lock.
+        """
+        L.threaddebug('_lock called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        vlDevId = self._config.vlDevId
+        self._dispatch(('lock', vlDevId), 'lock',
+                       partial(indigo.device.lock, vlDevId))
+
+    def _lock_ac(self):
+        """
+        The door was CLOSED.  Check to see if the lock after closing option
+        was requested.  If so, call the _lock method to lock the virtual lock.
+        """
+        L.threaddebug('_lock_ac called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        if self._config.lockAfterClosing:  # lac requested.
+            self._lock()
+
+    def _log(self):
+        """
+        Log the current door state track if requested and start a new track
+        beginning with the new door status.
+        """
+        L.threaddebug('_log called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        if self._config.logDoorStateTracks:
+            L.info('"%s" %s', self._dev.name, self._renderDoorStateTrack())
+
+        # Start a new track at the time of the current transition.
+
+        self._track.clear()
+        self._trackStatusCode = self._statusCode
+        self._trackStartTime = self._priorEventTime
+        self._trackDropped = 0
+
+    def _rev(self):
+        """ The door was obstructed.  Reverse the opener direction. """
+        L.threaddebug('_rev called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        self._openerDirection ^= 1  # Reverse the opener direction.
+
+    def _start(self):
+        """
+        The door is moving.  Set the opener direction using the new door
+        status and restart the travel timer.
+        """
+        L.threaddebug('_start called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        if self._doorStatus == 'opening':
+            self._openerDirection = 0
+        elif self._doorStatus == 'closing':
+            self._openerDirection = 1
+
+        self._timerAction('restartTimer')
+
+    def _stop(self):
+        """
+        The door has reached a stationary state.  Stop the travel timer.
+        Also, reset the vibration sensor if present.
+        """
+        L.threaddebug('_stop called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        self._timerAction('stopTimer')
+
+        vsDevId = self._config.vsDevId
+        if vsDevId:  # Vibration sensor is present.
+            self._dispatch(('turnOff', vsDevId), 'vs turnOff',
+                           partial(indigo.device.turnOff, vsDevId,
+                                   delay=self._config.vsResetDelay))
+
+    def _unlock_ml(self):
+        """
+        The door is not CLOSED and an anomalous ml-on event occurred putting
+        it in the OBSTRUCTED state.  Immediately unlock the mechanical lock
+        and log a warning message to inform the user and provide direction to
+        close the door.
+        """
+        L.threaddebug('_unlock_ml called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        mlDevId = self._config.mlDevId
+        self._dispatch(('turnOff', mlDevId), 'ml turnOff',
+                       partial(indigo.device.turnOff, mlDevId))
+        L.warning('"%s" the mechanical lock was LOCKED when the door was %s '
+                  'and was then automatically UNLOCKED; manually activate the '
+                  'door to close it.', self._dev.name,
+                  self._priorDoorStatus.upper())
+
+    def _warn_ls(self):
+        """
+        The door is not CLOSED and an anomalous ls-off event occurred putting
+        it in the OBSTRUCTED state.  Log a warning message to inform the user
+        and provide direction to close the door.
+        """
+        L.threaddebug('_warn_ls called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        L.warning('"%s" the latch was disconnected when the door was %s; move '
+                  'the door manually if needed and reconnect the latch.',
+                  self._dev.name, self._priorDoorStatus.upper())
+
+    def _warn_ps(self):
+        """
+        The door is not CLOSED and an anomalous ps-off event occurred putting
+        it in the OBSTRUCTED state.  Log a warning message to inform the user
+        and provide direction to close the door.
+        """
+        L.threaddebug('_warn_ps called "%s" %s -> %s -> %s', self._dev.name,
+                      self._priorDoorStatus.upper(), self._event,
+                      self._doorStatus.upper())
+
+        L.warning('"%s" the power switch was turned off when the door was %s; '
+                  'turn on the switch and manually activate the door to close '
+                  'it.', self._dev.name, self._priorDoorStatus.upper())
+
 
-        # Execute transition functions.
+# Compile the door state transitions once when the module is loaded.
 
-        transitionFunctions = self.DOOR_STATE_TRANSITIONS[doorStatus][event][1]
-        for transitionFunction in transitionFunctions:
-            locals()[transitionFunction]()
+VirtualGarageDoor._compileTransitions()
@@ -0,0 +1,319 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                          MODULE benchmarkFleet.py                           #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  benchmarkFleet.py
+   TITLE:  Fleet-scale benchmark for Plugin.deviceUpdated event dispatch
+FUNCTION:  Loads the plugin in the headless plugin host with N openers (each
+           with a full monitored device set) and M unrelated devices, fires a
+           mix of relevant and irrelevant device updates, and reports the
+           deviceUpdated latency (p50/p99), events/sec, and allocations per
+           event for each fleet size.
+   USAGE:  python3 benchmarkFleet.py [-n OPENERS] [-m UNRELATED] [-e EVENTS]
+                                     [-r RELEVANT] [-a ALLOCATION_EVENTS]
+                                     [-w WORKERS] [-p PLUGIN_DIR]
+           OPENERS is a comma-separated list of fleet sizes (default
+           10,100,1000,5000).  RELEVANT is the fraction of events that are
+           monitored device state changes.  WORKERS is the number of plugin
+           event queue workers (default 4; 0 processes events inline).
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE benchmarkFleet.py DESCRIPTION:
+
+Each fleet size is benchmarked on a freshly loaded plugin with a synchronous
+plugin host.  Each opener has ar (pseudo relay), cs, os, and vs (contact
+sensor) devices and a built-in travel timer.  The vibration sensor reset
+delay is zero, and the flapping sensor limit is disabled because the
+benchmark cycles each door far faster than a real door.  Travel timer expirations for doors left in motion are
+delivered on the travel timer thread and are not timed.
+
+The event stream is a seeded random mix of:
+
+relevant     the next step of an nar open/close cycle for a random opener
+             (ar, cs, os, and vs onOffState changes)
+irrelevant   a batteryLevel change for a random monitored sensor, or an
+             onOffState change for a random unrelated device
+
+The plugin deviceUpdated method is wrapped to time each top-level call, so
+the latency is the dispatch cost seen by the Indigo host for one device
+update.  With event workers, this is the cost of classifying the update and
+queueing the event; the door update is performed on a worker thread.  With
+no workers, it includes the door update and any nested updates (e.g.,
+opener state changes) that it causes.  The stand-in server work that
+precedes the call is not included.  The processed events/sec is measured
+from the first event until the plugin event queue is idle.
+
+Allocations are measured in a separate tracemalloc pass over a prefix of the
+same event stream.  Allocated bytes/event is the mean transient peak of
+traced memory during a call; net blocks/event is the mean change in
+allocated memory blocks (retained allocations) per call.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import sys
+import tracemalloc
+
+from argparse import ArgumentParser
+from random import Random
+from threading import get_ident
+from time import perf_counter
+
+from pluginHost import PluginHost, PLUGIN_DIR
+
+# One nar open/close cycle of (monitored device type id, onOffState) steps.
+
+OPENER_CYCLE = (('ar', True), ('ar', False), ('cs', False), ('vs', True),
+                ('vs', False), ('os', True), ('ar', True), ('ar', False),
+                ('os', False), ('vs', True), ('vs', False), ('cs', True))
+
+SENSOR_STATES = {'onOffState': False, 'batteryLevel': 100}
+TRAVEL_TIME = '20'
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS FleetBenchmark                           #
+#                                                                             #
+###############################################################################
+
+class FleetBenchmark:
+    """
+    Build a fleet of openers and unrelated devices in a plugin host and
+    measure the Plugin.deviceUpdated dispatch cost for a mixed event stream.
+    """
+
+    def __init__(self, openers, unrelated, relevant, workers=4, seed=1,
+                 pluginDir=PLUGIN_DIR):
+        self.openers = openers
+        self.unrelated = unrelated
+        self.relevant = relevant
+        self.random = Random(seed)
+        self.latencies = []
+        self.allocatedBytes = 0
+        self.allocatedBlocks = 0
+        self.allocationCalls = 0
+        self._measureAllocations = False
+        self._depth = 0
+        self._threadId = get_ident()
+
+        self.host = host = PluginHost(
+            pluginDir, prefs={'loggingLevel': 'ERROR',
+                              'eventWorkers': str(workers),
+                              'flapLimit': '0'},
+            synchronous=True)
+        self.indigo = host.indigo
+        self._doors = []  # [{monitored device type id: device id}]
+        self._cycleSteps = []  # [next OPENER_CYCLE index for each door]
+        self._sensorIds = []
+        self._unrelatedIds = []
+
+        for number in range(unrelated):
+            dev = host.addDevice('unrelated-%s' % number, 'relay')
+            self._unrelatedIds.append(dev.id)
+        setUpStart = perf_counter()
+        host.load()
+        for number in range(openers):
+            door = {}
+            fields = {'vsResetDelay': '0', 'ttName': 'BUILT-IN',
+                      'tTime': TRAVEL_TIME}
+            for typeId, deviceTypeId in (('ar', 'pseudoRelay'),
+                                         ('cs', 'contactSensor'),
+                                         ('os', 'contactSensor'),
+                                         ('vs', 'contactSensor')):
+                name = 'door-%s-%s' % (number, typeId)
+                states = (dict(SENSOR_STATES) if typeId != 'ar' else None)
+                door[typeId] = host.addDevice(name, deviceTypeId, states).id
+                fields[typeId + 'Name'] = name
+                if typeId != 'ar':
+                    self._sensorIds.append(door[typeId])
+            host.setState(door['cs'], True)
+            host.addOpener('door-%s' % number, **fields)
+            self._doors.append(door)
+            self._cycleSteps.append(0)
+        self.setUpTime = perf_counter() - setUpStart
+
+        # Time each top-level Plugin.deviceUpdated call.
+
+        self._deviceUpdated = host.plugin.deviceUpdated
+        host.plugin.deviceUpdated = self._timedDeviceUpdated
+
+    def _timedDeviceUpdated(self, origDev, newDev):
+        if self._depth or get_ident() != self._threadId:
+            # Nested update (timed by the top-level call) or an update from
+            # another thread.
+            self._deviceUpdated(origDev, newDev)
+            return
+        self._depth += 1
+        try:
+            if self._measureAllocations:
+                blocks = sys.getallocatedblocks()
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                self._deviceUpdated(origDev, newDev)
+                self.allocatedBytes += (tracemalloc.get_traced_memory()[1]
+                                        - current)
+                self.allocatedBlocks += sys.getallocatedblocks() - blocks
+                self.allocationCalls += 1
+            else:
+                start = perf_counter()
+                self._deviceUpdated(origDev, newDev)
+                self.latencies.append(perf_counter() - start)
+        finally:
+            self._depth -= 1
+
+    def fire(self):
+        """ Fire one relevant or irrelevant device update. """
+        random = self.random
+        if self._doors and random.random() < self.relevant:
+            doorIndex = random.randrange(len(self._doors))
+            step = self._cycleSteps[doorIndex]
+            self._cycleSteps[doorIndex] = (step + 1) % len(OPENER_CYCLE)
+            typeId, value = OPENER_CYCLE[step]
+            self.host.setState(self._doors[doorIndex][typeId], value)
+        elif self._sensorIds and (not self._unrelatedIds
+                                  or random.random() < 0.25):
+            devId = random.choice(self._sensorIds)
+            level = 100 - self.indigo.devices[devId].states['batteryLevel']
+            self.host.setState(devId, level, 'batteryLevel')
+        elif self._unrelatedIds:
+            devId = random.choice(self._unrelatedIds)
+            onState = self.indigo.devices[devId].states['onOffState']
+            self.host.setState(devId, not onState)
+
+    def run(self, events):
+        """
+        Fire events, wait until the plugin has processed them, and return the
+        wall time.
+        """
+        start = perf_counter()
+        for _ in range(events):
+            self.fire()
+        self.host.waitUntilIdle(60.0)
+        return perf_counter() - start
+
+    def measureAllocations(self, events):
+        """ Fire events with tracemalloc active. """
+        self._measureAllocations = True
+        tracemalloc.start()
+        try:
+            self.run(events)
+        finally:
+            tracemalloc.stop()
+            self._measureAllocations = False
+
+    def close(self):
+        self.host.plugin.deviceUpdated = self._deviceUpdated
+        self.host.unload()
+
+
+###############################################################################
+#                                                                             #
+#                                 FUNCTIONS                                   #
+#                                                                             #
+###############################################################################
+
+def percentile(sortedValues, fraction):
+    """ Return the nearest-rank percentile of a sorted list. """
+    if not sortedValues:
+        return 0.0
+    index = min(len(sortedValues) - 1, int(fraction * len(sortedValues)))
+    return sortedValues[index]
+
+
+def main():
+    parser = ArgumentParser(description='Fleet-scale benchmark for '
+                                        'Plugin.deviceUpdated dispatch')
+    parser.add_argument('-n', '--openers', default='10,100,1000,5000',
+                        help='comma-separated list of opener counts')
+    parser.add_argument('-m', '--unrelated', type=int, default=5000,
+                        help='number of unrelated devices')
+    parser.add_argument('-e', '--events', type=int, default=50000,
+                        help='number of device updates per fleet size')
+    parser.add_argument('-r', '--relevant', type=float, default=0.2,
+                        help='fraction of monitored device state changes')
+    parser.add_argument('-a', '--allocation-events', type=int, default=5000,
+                        help='number of device updates in the allocation '
+                             'pass')
+    parser.add_argument('-w', '--workers', type=int, default=4,
+                        help='number of plugin event queue workers')
+    parser.add_argument('-p', '--plugin-dir', default=str(PLUGIN_DIR),
+                        help='directory containing plugin.py')
+    args = parser.parse_args()
+
+    print('%7s %8s %8s %10s %10s %9s %9s %11s %11s %9s'
+          % ('openers', 'devices', 'events', 'events/s', 'proc ev/s',
+             'p50 us', 'p99 us', 'alloc B/ev', 'net blk/ev', 'setup s'))
+    for openers in (int(n) for n in args.openers.split(',')):
+        benchmark = FleetBenchmark(openers, args.unrelated, args.relevant,
+                                   args.workers, pluginDir=args.plugin_dir)
+        try:
+            benchmark.run(min(1000, args.events))  # Warm up.
+            benchmark.latencies.clear()
+            wallTime = benchmark.run(args.events)
+            latencies = sorted(benchmark.latencies)
+            benchmark.measureAllocations(args.allocation_events)
+        finally:
+            benchmark.close()
+        dispatchTime = sum(latencies)
+        calls = benchmark.allocationCalls
+        print('%7s %8s %8s %10.0f %10.0f %9.1f %9.1f %11.0f %11.2f %9.1f'
+              % (openers, len(benchmark.indigo.devices), len(latencies),
+                 len(latencies) / dispatchTime if dispatchTime else 0.0,
+                 args.events / wallTime if wallTime else 0.0,
+                 percentile(latencies, 0.50) * 1e6,
+                 percentile(latencies, 0.99) * 1e6,
+                 benchmark.allocatedBytes / calls if calls else 0.0,
+                 benchmark.allocatedBlocks / calls if calls else 0.0,
+                 benchmark.setUpTime))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                       MODULE benchmarkTransitions.py                        #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  benchmarkTransitions.py
+   TITLE:  Micro-benchmark for the VirtualGarageDoor update method
+FUNCTION:  Drives a VirtualGarageDoor instance with a fixed stream of monitored
+           device events and reports the update throughput in events/sec.
+   USAGE:  python3 benchmarkTransitions.py [-e EVENTS] [-r REPEATS]
+                                           [-p PLUGIN_DIR]
+           Use the -p option to benchmark a different copy of the plugin
+           modules (e.g., a prior release) on the same event stream.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE benchmarkTransitions.py DESCRIPTION:
+
+The benchmark runs off-box under CPython with the indigo stand-in package in
+the tools directory.  The monitored devices are stand-in server devices, and
+the stand-in host is synchronous with no plugin loaded, so device commands
+(e.g., the vibration sensor reset with a zero delay) are applied inline and
+notify no one.  The opener device is a local BenchmarkDevice whose server
+calls are counted but not dispatched, so the benchmark measures the cost of
+the state machine itself.
+
+The event stream is a repeated nar open/close cycle for an opener with ar, cs,
+os, and vs devices.  It includes ignored events (ar-off, vs-off), redundant
+events, and transitions with one, two, and three transition methods.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import logging
+import sys
+
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+
+TOOLS_DIR = Path(__file__).resolve().parent
+PLUGIN_DIR = (TOOLS_DIR.parent / 'Virtual Garage Door.indigoPlugin'
+              / 'Contents' / 'Server Plugin')
+
+# One nar open/close cycle for an opener with ar, cs, os, and vs devices.
+
+EVENT_CYCLE = ('ar-on', 'ar-off', 'cs-off', 'vs-on', 'vs-off', 'os-on',
+               'ar-on', 'ar-off', 'os-off', 'vs-on', 'vs-off', 'cs-on')
+
+
+###############################################################################
+#                                                                             #
+#                                 FUNCTIONS                                   #
+#                                                                             #
+###############################################################################
+
+class BenchmarkDevice:
+    """
+    Opener device with the attributes and methods used by VirtualGarageDoor.
+    State updates are applied locally as they are by the Indigo server.
+    """
+    def __init__(self, pluginProps):
+        self.id = 1
+        self.name = 'benchmark-opener'
+        self.pluginProps = pluginProps
+        self.states = {'doorState': 1, 'doorStatus': 'closed',
+                       'onOffState': True}
+        self.serverCalls = 0
+
+    def updateStateOnServer(self, key, value, uiValue=None):
+        self.states[key] = value
+        self.serverCalls += 1
+
+    def updateStatesOnServer(self, keyValueList):
+        for keyValue in keyValueList:
+            self.states[keyValue['key']] = keyValue['value']
+        self.serverCalls += 1
+
+    def updateStateImageOnServer(self, image):
+        self.serverCalls += 1
+
+
+def newVirtualGarageDoor(vgdClass, dev):
+    """
+    Create a VirtualGarageDoor instance using the constructor signature of the
+    plugin version being benchmarked.  Versions that include the deviceConfig
+    module take a parsed DeviceConfig object.
+    """
+    try:
+        from deviceConfig import DeviceConfig
+    except ImportError:
+        return vgdClass(dev, 'closed')
+    return vgdClass(dev, DeviceConfig(dev.pluginProps), 'closed')
+
+
+def benchmark(vgdClass, events, repeats):
+    """
+    Create the monitored devices in the indigo stand-in.  Run the event
+    stream through a new VirtualGarageDoor instance repeats times and return
+    the best events/sec and the number of server calls per event.
+    """
+    import indigo
+    indigo.host.reset()
+    indigo.host.synchronous = True
+    pluginProps = {'vsResetDelay': '0', 'ttDevId': '', 'vlDevId': '',
+                   'mlDevId': '', 'lockAfterClosing': False,
+                   'logDoorStateChanges': False, 'logDoorStateTracks': False}
+    for mDevTypeId in ('ar', 'cs', 'os', 'vs'):
+        mDev = indigo.host.createDevice('benchmark-' + mDevTypeId)
+        pluginProps[mDevTypeId + 'DevId'] = str(mDev.id)
+    best = 0.0
+    callsPerEvent = 0.0
+    for _ in range(repeats):
+        dev = BenchmarkDevice(dict(pluginProps))
+        vgd = newVirtualGarageDoor(vgdClass, dev)
+        vgd._priorEvent = None
+        dev.serverCalls = 0
+        start = perf_counter()
+        for event in events:
+            vgd._priorEvent = None  # Defeat the pre-v1.6.0 duplicate check.
+            vgd.update(event)
+        elapsed = perf_counter() - start
+        best = max(best, len(events) / elapsed)
+        callsPerEvent = dev.serverCalls / len(events)
+    return best, callsPerEvent
+
+
+def main():
+    parser = ArgumentParser(description='VirtualGarageDoor.update '
+                                        'micro-benchmark')
+    parser.add_argument('-e', '--events', type=int, default=120000,
+                        help='number of events per run')
+    parser.add_argument('-r', '--repeats', type=int, default=5,
+                        help='number of runs; the best run is reported')
+    parser.add_argument('-p', '--plugin-dir', default=str(PLUGIN_DIR),
+                        help='directory containing virtualGarageDoor.py')
+    args = parser.parse_args()
+
+    sys.path[:0] = [args.plugin_dir, str(TOOLS_DIR)]  # indigo stand-in.
+    logging.getLogger('Plugin').setLevel(logging.WARNING)
+    from virtualGarageDoor import VirtualGarageDoor
+
+    cycles = max(1, args.events // len(EVENT_CYCLE))
+    events = EVENT_CYCLE * cycles
+    eventsPerSec, callsPerEvent = benchmark(VirtualGarageDoor, events,
+                                            args.repeats)
+    print('%s: %s events, best of %s runs: %.0f events/sec, %.2f server '
+          'calls/event' % (args.plugin_dir, len(events), args.repeats,
+                           eventsPerSec, callsPerEvent))
+
+
+if __name__ == '__main__':
+    main()
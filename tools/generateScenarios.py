@@ -0,0 +1,235 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                        MODULE generateScenarios.py                          #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  generateScenarios.py
+   TITLE:  Generate replayable use-case scenarios from trackAnalysis.txt
+FUNCTION:  Parses the monitored device configuration/use case table in
+           files/trackAnalysis.txt and writes it as machine-readable scenario
+           fixtures for replayScenarios.py.
+   USAGE:  python3 generateScenarios.py [-t TABLE] [-o OUTPUT]
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE generateScenarios.py DESCRIPTION:
+
+Each table entry in trackAnalysis.txt is a header line followed by one or
+more track lines:
+
+ar cs tt        nar-no  G       CLOSED  OPEN    OPEN    notes
+                                {activation OPENING}    [cs-off OPENING] ...
+
+The header gives the monitored device configuration, the use case (nar/ar
+for no activation relay/activation relay actuation and no/nc/io/ic for
+normal open, normal close, interrupted open, and interrupted close), the
+color/track error summary, and the physical start, physical end, and virtual
+end states.  The track lines interleave physical door events in braces with
+monitored device events and the resulting virtual door states in brackets.
+
+Each entry becomes a scenario with a list of timed steps.  Physical steps
+are kept for documentation and timing.  Event steps hold the monitored device
+event and the expected door status after the event.  Times are assigned from
+nominal delays for each kind of step so that the replay has a realistic
+event rhythm.
+
+The table predates the v1.5.0 OBSTRUCTED door state.  The STOPPED and
+REVERSING virtual states are mapped to 'obstructed'.  [null STATE] tokens
+represent automatic transitions of the old model with no monitored device
+event; they are kept as physical (documentation) steps.  tt-exp qualifiers
+(e.g., tt-exp&!os) are derived by the plugin from the configuration, so the
+replayed event is plain tt-exp.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import json
+import re
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+TABLE_FILE = TOOLS_DIR.parent / 'files' / 'trackAnalysis.txt'
+SCENARIOS_FILE = TOOLS_DIR / 'scenarios.json'
+
+MONITORED_DEVICE_TYPE_IDs = ('ar', 'cs', 'os', 'vs', 'tt')
+
+# Old model door states mapped to door status values.
+
+STATE_MAP = {'OPEN':      'open',
+             'CLOSED':    'closed',
+             'OPENING':   'opening',
+             'CLOSING':   'closing',
+             'STOPPED':   'obstructed',
+             'REVERSING': 'obstructed'}
+
+# Nominal delays (seconds) from the prior step for each physical event and
+# monitored device event.
+
+NOMINAL_DELAYS = {'activation': 1.0,
+                  'interrupt':  4.0,
+                  'null':       0.5,
+                  'stop':       6.0,
+                  'ar-on':      0.0,
+                  'vs-on':      0.5,
+                  'cs-off':     1.0,
+                  'os-off':     1.0,
+                  'cs-on':      0.2,
+                  'os-on':      0.2,
+                  'tt-exp':     2.0}
+
+TOKEN = re.compile(r'\{(\w+) (\w+)\}|\[([\w&!-]+) (\w+)\]')
+
+
+###############################################################################
+#                                                                             #
+#                                 FUNCTIONS                                   #
+#                                                                             #
+###############################################################################
+
+def parseHeader(line):
+    """
+    Parse a table entry header line.  Return a scenario dictionary without
+    steps.
+    """
+    fields = line.split()
+    devices = []
+    while fields[0] in MONITORED_DEVICE_TYPE_IDs:
+        devices.append(fields.pop(0))
+    useCase = fields.pop(0)
+    color = fields.pop(0)
+    trackErrors = int(fields.pop(0)) if fields[0].isdigit() else 0
+    physicalStart, physicalEnd, virtualEnd = fields[:3]
+    return {'name': '%s/%s' % ('-'.join(devices), useCase),
+            'devices': devices,
+            'useCase': useCase,
+            'color': color,
+            'trackErrors': trackErrors,
+            'physicalStart': STATE_MAP[physicalStart],
+            'physicalEnd': STATE_MAP[physicalEnd],
+            'tableVirtualEnd': STATE_MAP[virtualEnd],
+            'notes': ' '.join(fields[3:]),
+            'steps': []}
+
+
+def addSteps(scenario, line, clock):
+    """
+    Parse the physical and monitored device event tokens in a track line and
+    append timed steps to the scenario.  Return the updated clock.
+    """
+    for match in TOKEN.finditer(line):
+        physical, physicalState, event, virtualState = match.groups()
+        if physical or event == 'null':
+            name = physical or event
+            state = physicalState or virtualState
+            clock += NOMINAL_DELAYS[name]
+            scenario['steps'].append({'time': round(clock, 3),
+                                      'physical': name,
+                                      'state': STATE_MAP[state]})
+        else:
+            event = event.split('&')[0]  # Remove any tt-exp qualifier.
+            clock += NOMINAL_DELAYS[event]
+            scenario['steps'].append({'time': round(clock, 3),
+                                      'event': event,
+                                      'expected': STATE_MAP[virtualState]})
+    return clock
+
+
+def parseTable(tableText):
+    """ Parse the table text and return a list of scenario dictionaries. """
+    scenarios = []
+    scenario = None
+    clock = 0.0
+    started = False
+    for line in tableText.splitlines():
+        if line.startswith('='):
+            started = True
+            continue
+        if not started or not line.strip() or line.startswith('-'):
+            continue
+        if not line[0].isspace():  # Header line.
+            scenario = parseHeader(line)
+            scenarios.append(scenario)
+            clock = 0.0
+        elif scenario:  # Track line.
+            clock = addSteps(scenario, line, clock)
+
+    # Derive the expected final door status and door status track.
+
+    for scenario in scenarios:
+        track = ['%s %s' % (step['event'], step['expected'])
+                 for step in scenario['steps'] if 'event' in step]
+        scenario['expectedTrack'] = track
+        scenario['expectedStatus'] = (track[-1].split()[1] if track
+                                      else scenario['physicalStart'])
+    return scenarios
+
+
+def main():
+    parser = ArgumentParser(description='Generate replayable scenarios from '
+                                        'trackAnalysis.txt')
+    parser.add_argument('-t', '--table', default=str(TABLE_FILE),
+                        help='track analysis table file')
+    parser.add_argument('-o', '--output', default=str(SCENARIOS_FILE),
+                        help='scenario fixture file')
+    args = parser.parse_args()
+
+    scenarios = parseTable(Path(args.table).read_text())
+    fixtures = {'source': 'files/trackAnalysis.txt',
+                'stateMap': STATE_MAP,
+                'nominalDelays': NOMINAL_DELAYS,
+                'scenarios': scenarios}
+    with open(args.output, 'w') as outputFile:
+        json.dump(fixtures, outputFile, indent=1)
+        outputFile.write('\n')
+    print('%s scenarios written to %s' % (len(scenarios), args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,965 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                         MODULE indigo/__init__.py                           #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  indigo/__init__.py
+   TITLE:  Headless stand-in for the Indigo server API
+FUNCTION:  Provides the subset of the indigo module that is used by the
+           Virtual Garage Door plugin so that the unmodified Plugin class can
+           be run under CPython off-box for load tests, replays, and
+           profiling.
+   USAGE:  Put the tools directory ahead of any other indigo module on
+           sys.path and import indigo.  The pluginHost.py module does this
+           and manages the plugin lifecycle; it should normally be used
+           instead of importing this package directly.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE indigo/__init__.py DESCRIPTION:
+
+The stand-in mirrors the behavior of the Indigo server that the plugin
+depends on:
+
+(1) The devices dictionary holds master device objects.  Indexing or
+iterating it returns copies, as the server does.  Devices are found by id,
+name, or device object.
+
+(2) updateStateOnServer, updateStatesOnServer, and replacePluginPropsOnServer
+change the master device and the caller's copy.  When a state changes, a
+deviceUpdated(oldDev, newDev) callback is delivered to the plugin if it has
+subscribed to device changes or owns the device.
+
+(3) indigo.device commands (turnOn, turnOff, toggle, lock, unlock) with
+optional delay and duration are routed to the plugin actionControlDevice
+method for devices owned by the plugin and change the onOffState of all other
+devices.  indigo.actionGroup.execute counts executions and calls an optional
+callback.
+
+(4) indigo.server.getInstallFolderPath returns a temporary directory that
+is replaced by a new empty one when the host is reset, so that door snapshots
+are kept across a plugin unload and load but not across replays.
+indigo.server.getPlugin returns a PluginInfo object whose executeAction
+method is counted.  A Timers and Pesters stand-in implements the timer actions
+used by the plugin, including the one-second timeLeftSeconds countdown and the
+expired (timerStatus.active False, timeLeftSeconds '0') state.
+
+(5) indigo.PluginBase provides the default callbacks, including the device
+restart when the pluginProps of a started plugin device change.
+
+Callbacks into the plugin are delivered by the host object (indigo.host) on
+a single dispatch thread, as the Indigo plugin host does.  Set
+indigo.host.synchronous to True to deliver immediate callbacks on the calling
+thread for deterministic replays.  The host object also provides the
+server-side operations that the real server performs on behalf of users and
+physical devices (creating devices and action groups and setting device
+states).  Every server call made by the plugin is counted in
+indigo.server.calls.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import logging
+import sys
+
+from collections import Counter
+from copy import copy as shallowCopy
+from datetime import datetime
+from heapq import heappop, heappush
+from itertools import count
+from math import ceil
+from tempfile import TemporaryDirectory
+from threading import Condition, RLock, Thread, current_thread
+from time import monotonic, sleep
+from types import SimpleNamespace
+
+L = logging.getLogger('indigo')  # Stand-in logger.
+
+# The Indigo plugin host adds the THREADDEBUG logging level and the
+# Logger.threaddebug method before the plugin is imported.
+
+THREADDEBUG = 5
+if not hasattr(logging.Logger, 'threaddebug'):
+    logging.addLevelName(THREADDEBUG, 'THREADDEBUG')
+    logging.Logger.threaddebug = (
+        lambda self, *args, **kwargs: self.log(THREADDEBUG, *args, **kwargs))
+
+# Enumerations used by the plugin.
+
+kProtocol = SimpleNamespace(Plugin='Plugin', Insteon='Insteon',
+                            ZWave='ZWave')
+kStateImageSel = SimpleNamespace(Auto='Auto', NoImage='NoImage',
+                                 SensorOff='SensorOff', SensorOn='SensorOn',
+                                 SensorTripped='SensorTripped',
+                                 Locked='Locked', Unlocked='Unlocked',
+                                 TimerOff='TimerOff', TimerOn='TimerOn')
+kDeviceAction = SimpleNamespace(TurnOn='TurnOn', TurnOff='TurnOff',
+                                Toggle='Toggle', Lock='Lock',
+                                Unlock='Unlock',
+                                RequestStatus='RequestStatus')
+kUniversalAction = SimpleNamespace(RequestStatus='RequestStatus',
+                                   Beep='Beep', EnergyUpdate='EnergyUpdate',
+                                   EnergyReset='EnergyReset')
+
+# Default states for devices that are not plugin devices with registered
+# states (see host.registerStates).
+
+DEFAULT_STATES = {'onOffState': False}
+
+
+###############################################################################
+#                                                                             #
+#                           INDIGO CONTAINER TYPES                            #
+#                                                                             #
+###############################################################################
+
+class Dict(dict):
+    """ Stand-in for indigo.Dict. """
+
+
+class List(list):
+    """ Stand-in for indigo.List. """
+
+
+###############################################################################
+#                                                                             #
+#                                 CLASS Device                                #
+#                                                                             #
+###############################################################################
+
+class Device:
+    """
+    Device object with the attributes and methods used by the plugin.  An
+    instance held by the devices dictionary is the master copy; all other
+    instances are copies whose server methods update the master.
+    """
+
+    def __init__(self, devId, name, deviceTypeId='', pluginId='', states=None,
+                 pluginProps=None, enabled=True, description='', address='',
+                 folderId=0):
+        self.id = devId
+        self.name = name
+        self.deviceTypeId = deviceTypeId
+        self.pluginId = pluginId
+        self.states = Dict(DEFAULT_STATES if states is None else states)
+        self.pluginProps = Dict(pluginProps or {})
+        self.enabled = enabled
+        self.description = description
+        self.address = address
+        self.folderId = folderId
+        self.displayStateImageSel = kStateImageSel.Auto
+        self.lastChanged = datetime.now()
+
+    def __repr__(self):
+        return 'Device(%s, %r, %r)' % (self.id, self.name, self.deviceTypeId)
+
+    @property
+    def onState(self):
+        return self.states.get('onOffState')
+
+    def copy(self):
+        """ Return a copy with its own states and pluginProps dictionaries. """
+        dev = shallowCopy(self)
+        dev.states = Dict(self.states)
+        dev.pluginProps = Dict(self.pluginProps)
+        return dev
+
+    def updateStateOnServer(self, key, value, uiValue=None,
+                            decimalPlaces=None, clearErrorState=True):
+        _devices.updateStates(self.id, ((key, value),),
+                              'updateStateOnServer', self)
+
+    def updateStatesOnServer(self, keyValueList, clearErrorState=True):
+        _devices.updateStates(self.id, tuple((keyValue['key'],
+                                              keyValue['value'])
+                                             for keyValue in keyValueList),
+                              'updateStatesOnServer', self)
+
+    def updateStateImageOnServer(self, image):
+        _server.calls['updateStateImageOnServer'] += 1
+        self.displayStateImageSel = image
+        with _devices.lock:
+            master = _devices.master(self.id)
+            if master:
+                master.displayStateImageSel = image
+
+    def replacePluginPropsOnServer(self, props):
+        _server.calls['replacePluginPropsOnServer'] += 1
+        self.pluginProps = Dict(props)
+        _devices.replace(self.id, pluginProps=Dict(props))
+
+    def replaceOnServer(self):
+        _server.calls['replaceOnServer'] += 1
+        _devices.replace(self.id, name=self.name,
+                         description=self.description,
+                         address=self.address)
+
+    def refreshFromServer(self):
+        _server.calls['refreshFromServer'] += 1
+        master = _devices.master(self.id)
+        if master:
+            self.__dict__.update(master.copy().__dict__)
+
+
+###############################################################################
+#                                                                             #
+#                            CLASS DeviceDictionary                           #
+#                                                                             #
+###############################################################################
+
+class DeviceDictionary:
+    """
+    Stand-in for indigo.devices.  Indexing and iteration return device
+    copies.  The public methods without a counterpart in the Indigo API
+    (master, add, delete, updateStates, and replace) are used by the rest of
+    the stand-in to play the role of the server.
+    """
+
+    def __init__(self):
+        self.lock = RLock()
+        self._devices = {}  # {devId: master device}
+        self._names = {}  # {name: devId}
+        self._ids = count(100000001)
+        self.subscribed = False
+
+    # Indigo API.
+
+    def __getitem__(self, key):
+        dev = self.master(key)
+        if dev is None:
+            raise KeyError(key)
+        return dev.copy()
+
+    def __contains__(self, key):
+        return self.master(key) is not None
+
+    def __iter__(self):
+        return self.iter()
+
+    def __len__(self):
+        return len(self._devices)
+
+    def get(self, key, default=None):
+        dev = self.master(key)
+        return dev.copy() if dev else default
+
+    def keys(self):
+        return list(self._devices)
+
+    def iter(self, filter=''):
+        """
+        Iterate over device copies.  The filter is '', 'self', 'self.typeId',
+        or a plugin id.
+        """
+        pluginId, _, typeId = filter.partition('.')
+        if pluginId == 'self':
+            pluginId = host.plugin.pluginId if host.plugin else ''
+            if not pluginId:
+                return iter(())
+        elif filter.count('.') > 1:  # A plugin id, not 'self.typeId'.
+            pluginId, typeId = filter, ''
+        with self.lock:
+            selected = [dev.copy() for dev in self._devices.values()
+                        if (not pluginId or dev.pluginId == pluginId)
+                        and (not typeId or dev.deviceTypeId == typeId)]
+        return iter(selected)
+
+    def subscribeToChanges(self):
+        _server.calls['subscribeToChanges'] += 1
+        self.subscribed = True
+
+    # Server operations.
+
+    def master(self, key):
+        """ Return the master device for an id, name, or device object. """
+        if isinstance(key, Device):
+            key = key.id
+        elif isinstance(key, str):
+            key = self._names.get(key, key)
+        return self._devices.get(key)
+
+    def add(self, dev):
+        """ Add a new master device and notify the plugin. """
+        with self.lock:
+            if dev.name in self._names:
+                raise ValueError('device name "%s" is not unique' % dev.name)
+            dev.id = next(self._ids) if dev.id is None else dev.id
+            self._devices[dev.id] = dev
+            self._names[dev.name] = dev.id
+            newDev = dev.copy()
+        if _notifies(newDev):
+            host.call(host.plugin.deviceCreated, newDev)
+        return newDev
+
+    def delete(self, key):
+        """ Delete a master device and notify the plugin. """
+        with self.lock:
+            dev = self.master(key)
+            if dev is None:
+                raise KeyError(key)
+            del self._devices[dev.id]
+            del self._names[dev.name]
+        if _notifies(dev):
+            host.call(host.plugin.deviceDeleted, dev)
+
+    def updateStates(self, devId, items, callName, localDev=None):
+        """
+        Apply (key, value) state items to the master device and to the
+        caller's device copy.  Notify the plugin if any state changed.  Count
+        the server call if callName is not None.
+        """
+        if callName:
+            _server.calls[callName] += 1
+        with self.lock:
+            dev = self._devices.get(devId)
+            if dev is None:
+                raise KeyError('device id %s is not in the devices '
+                               'dictionary' % devId)
+            oldDev = None
+            for key, value in items:
+                if key not in dev.states:
+                    raise KeyError('"%s" state key %s is not defined'
+                                   % (dev.name, key))
+                if dev.states[key] != value:
+                    if oldDev is None:
+                        oldDev = dev.copy()
+                    dev.states[key] = value
+            if localDev is not None and localDev is not dev:
+                localDev.states.update(items)
+            if oldDev is None:
+                return
+            dev.lastChanged = datetime.now()
+            newDev = dev.copy()
+        if _notifies(newDev):
+            host.call(host.plugin.deviceUpdated, oldDev, newDev)
+
+    def replace(self, devId, **attributes):
+        """
+        Replace master device attributes (e.g., name or pluginProps) and
+        notify the plugin.
+        """
+        with self.lock:
+            dev = self._devices.get(devId)
+            if dev is None:
+                raise KeyError(devId)
+            oldDev = dev.copy()
+            if attributes.get('name', dev.name) != dev.name:
+                if attributes['name'] in self._names:
+                    raise ValueError('device name "%s" is not unique'
+                                     % attributes['name'])
+                del self._names[dev.name]
+                self._names[attributes['name']] = devId
+            for name, value in attributes.items():
+                setattr(dev, name, value)
+            newDev = dev.copy()
+        if _notifies(newDev):
+            host.call(host.plugin.deviceUpdated, oldDev, newDev)
+
+
+def _notifies(dev):
+    """
+    Return True if the plugin is to be notified of changes to a device.  The
+    plugin is notified of all device changes if it has subscribed to device
+    changes and of changes to its own devices in any case.
+    """
+    return host.plugin is not None and (_devices.subscribed
+                                        or host.owns(dev))
+
+
+###############################################################################
+#                                                                             #
+#                            CLASS DeviceCommands                             #
+#                                                                             #
+###############################################################################
+
+class DeviceCommands:
+    """
+    Stand-in for indigo.device.  Device commands are executed on the host
+    dispatch thread after an optional delay.  Commands for plugin devices
+    are delivered to the plugin actionControlDevice method.  Commands for all
+    other devices change the device onOffState.
+    """
+
+    ON_OFF_VALUES = {kDeviceAction.TurnOn:  True,
+                     kDeviceAction.TurnOff: False,
+                     kDeviceAction.Lock:    True,
+                     kDeviceAction.Unlock:  False}
+
+    OPPOSITES = {kDeviceAction.TurnOn:  kDeviceAction.TurnOff,
+                 kDeviceAction.TurnOff: kDeviceAction.TurnOn,
+                 kDeviceAction.Lock:    kDeviceAction.Unlock,
+                 kDeviceAction.Unlock:  kDeviceAction.Lock}
+
+    def create(self, protocol=kProtocol.Plugin, address='', name='',
+               description='', pluginId='', deviceTypeId='', props=None,
+               folder=None, **kwargs):
+        _server.calls['device.create'] += 1
+        states = host.states(pluginId, deviceTypeId)
+        dev = _devices.add(Device(None, name, deviceTypeId, pluginId,
+                                  states, props, description=description,
+                                  address=address))
+        if host.owns(dev) and dev.enabled:
+            host.call(host.plugin.deviceStartComm, dev.copy())
+        return dev
+
+    def delete(self, dev):
+        _server.calls['device.delete'] += 1
+        _devices.delete(dev)
+
+    def enable(self, dev, value=True):
+        """ Enable or disable a device and start or stop plugin devices. """
+        _server.calls['device.enable'] += 1
+        master = _devices.master(dev)
+        if master is None:
+            raise KeyError(dev)
+        if master.enabled != value:
+            master.enabled = value
+            if host.owns(master):
+                callback = (host.plugin.deviceStartComm if value
+                            else host.plugin.deviceStopComm)
+                host.call(callback, master.copy())
+
+    def turnOn(self, dev, delay=0, duration=0, **kwargs):
+        self._command('device.turnOn', dev, kDeviceAction.TurnOn, delay,
+                      duration)
+
+    def turnOff(self, dev, delay=0, duration=0, **kwargs):
+        self._command('device.turnOff', dev, kDeviceAction.TurnOff, delay,
+                      duration)
+
+    def toggle(self, dev, delay=0, duration=0, **kwargs):
+        self._command('device.toggle', dev, kDeviceAction.Toggle, delay,
+                      duration)
+
+    def lock(self, dev, delay=0, duration=0, **kwargs):
+        self._command('device.lock', dev, kDeviceAction.Lock, delay,
+                      duration)
+
+    def unlock(self, dev, delay=0, duration=0, **kwargs):
+        self._command('device.unlock', dev, kDeviceAction.Unlock, delay,
+                      duration)
+
+    def _command(self, callName, dev, deviceAction, delay, duration):
+        _server.calls[callName] += 1
+        master = _devices.master(dev)
+        if master is None:
+            raise KeyError(dev)
+        devId = master.id
+        if delay:
+            host.callLater(delay, self._execute, devId, deviceAction)
+        else:
+            host.call(self._execute, devId, deviceAction)
+        if duration and deviceAction in self.OPPOSITES:
+            host.callLater(delay + duration, self._execute, devId,
+                           self.OPPOSITES[deviceAction])
+
+    def _execute(self, devId, deviceAction):
+        dev = _devices.master(devId)
+        if dev is None or not dev.enabled:
+            return
+        if host.owns(dev):
+            action = SimpleNamespace(deviceAction=deviceAction,
+                                     deviceId=devId)
+            host.plugin.actionControlDevice(action, dev.copy())
+        else:
+            value = self.ON_OFF_VALUES.get(deviceAction, not dev.onState)
+            _devices.updateStates(devId, (('onOffState', value),), None)
+
+
+###############################################################################
+#                                                                             #
+#                              ACTION GROUPS                                  #
+#                                                                             #
+###############################################################################
+
+class ActionGroup:
+    """ Action group object with an optional execution callback. """
+
+    def __init__(self, agId, name, callback=None, description=''):
+        self.id = agId
+        self.name = name
+        self.description = description
+        self.callback = callback
+        self.executions = 0
+
+
+class ActionGroupDictionary:
+    """ Stand-in for indigo.actionGroups. """
+
+    def __init__(self):
+        self._actionGroups = {}
+        self._ids = count(200000001)
+
+    def __getitem__(self, key):
+        actionGroup = self.get(key)
+        if actionGroup is None:
+            raise KeyError(key)
+        return actionGroup
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return self.iter()
+
+    def __len__(self):
+        return len(self._actionGroups)
+
+    def get(self, key, default=None):
+        if isinstance(key, ActionGroup):
+            key = key.id
+        if isinstance(key, str):
+            for actionGroup in self._actionGroups.values():
+                if actionGroup.name == key:
+                    return actionGroup
+            return default
+        return self._actionGroups.get(key, default)
+
+    def iter(self, filter=''):
+        return iter(list(self._actionGroups.values()))
+
+    def add(self, name, callback=None, description=''):
+        actionGroup = ActionGroup(next(self._ids), name, callback,
+                                  description)
+        self._actionGroups[actionGroup.id] = actionGroup
+        return actionGroup
+
+
+class ActionGroupCommands:
+    """ Stand-in for indigo.actionGroup. """
+
+    def execute(self, actionGroup):
+        _server.calls['actionGroup.execute'] += 1
+        actionGroup = actionGroups[actionGroup]
+        actionGroup.executions += 1
+        if actionGroup.callback:
+            host.call(actionGroup.callback)
+
+
+###############################################################################
+#                                                                             #
+#                           SERVER AND PLUGIN PROXIES                         #
+#                                                                             #
+###############################################################################
+
+class PluginInfo:
+    """
+    Stand-in for the indigo.PluginInfo object returned by
+    indigo.server.getPlugin.  executeAction calls are counted and delegated to
+    an action method named by the action id, if the subclass defines one.
+    """
+
+    def __init__(self, pluginId, pluginDisplayName=''):
+        self.pluginId = pluginId
+        self.pluginDisplayName = pluginDisplayName or pluginId
+        self.executions = Counter()
+
+    def isEnabled(self):
+        return True
+
+    def isRunning(self):
+        return True
+
+    def executeAction(self, actionId, deviceId=0, props=None,
+                      waitUntilDone=True):
+        _server.calls['executeAction'] += 1
+        self.executions[actionId] += 1
+        method = getattr(self, 'action_' + actionId, None)
+        if method:
+            return method(deviceId, props or {})
+        L.debug('%s executeAction %s (no effect)', self.pluginId, actionId)
+
+
+class TimersAndPesters(PluginInfo):
+    """
+    Timers and Pesters plugin stand-in.  A started timer counts down in
+    one-second steps by updating timeLeftSeconds.  When it reaches zero, the
+    timer becomes inactive with timeLeftSeconds '0'.  A stopped timer becomes
+    inactive with its remaining time.
+    """
+
+    PLUGIN_ID = 'com.perceptiveautomation.indigoplugin.timersandpesters'
+    STATES = {'timerStatus': 'inactive', 'timerStatus.active': False,
+              'timerStatus.inactive': True, 'timerStatus.paused': False,
+              'timeLeftSeconds': '0'}
+    AMOUNT_TYPES = {'seconds': 1, 'minutes': 60, 'hours': 3600}
+
+    def __init__(self):
+        PluginInfo.__init__(self, self.PLUGIN_ID, 'Timers and Pesters')
+        self._generations = {}  # {devId: generation}
+
+    def action_setTimerStartValue(self, deviceId, props):
+        dev = _devices[deviceId]
+        props = dict(dev.pluginProps, **props)
+        _devices.replace(dev.id, pluginProps=Dict(props))
+
+    def action_startTimer(self, deviceId, props):
+        dev = _devices[deviceId]
+        amount = (float(dev.pluginProps.get('amount', 0))
+                  * self.AMOUNT_TYPES.get(dev.pluginProps.get('amountType'),
+                                          1))
+        generation = self._generations.get(dev.id, 0) + 1
+        self._generations[dev.id] = generation
+        remaining = max(1, ceil(amount))
+        self._update(dev.id, 'active', remaining)
+        host.callLater(1.0, self._tick, dev.id, generation, remaining - 1)
+
+    action_restartTimer = action_startTimer
+
+    def action_stopTimer(self, deviceId, props):
+        dev = _devices[deviceId]
+        self._generations[dev.id] = self._generations.get(dev.id, 0) + 1
+        self._update(dev.id, 'inactive', None)
+
+    def expire(self, devId):
+        """
+        Expire a timer immediately as if its countdown had reached zero.
+        Used by scenario replays to deliver travel timer expirations at
+        scripted times.
+        """
+        self._generations[devId] = self._generations.get(devId, 0) + 1
+        self._update(devId, 'inactive', 0)
+
+    def _tick(self, devId, generation, remaining):
+        if self._generations.get(devId) != generation:
+            return  # Timer was restarted or stopped.
+        if remaining > 0:
+            self._update(devId, 'active', remaining)
+            host.callLater(1.0, self._tick, devId, generation, remaining - 1)
+        else:
+            self._update(devId, 'inactive', 0)
+
+    @staticmethod
+    def _update(devId, status, remaining):
+        items = [('timerStatus', status),
+                 ('timerStatus.active', status == 'active'),
+                 ('timerStatus.inactive', status == 'inactive')]
+        if remaining is not None:
+            items.append(('timeLeftSeconds', str(remaining)))
+        _devices.updateStates(devId, tuple(items), None)
+
+
+class Server:
+    """ Stand-in for indigo.server. """
+
+    def __init__(self):
+        self.version = '2025.1.0'
+        self.apiVersion = '3.6'
+        self.calls = Counter()  # Server calls made by the plugin.
+        self._plugins = {}
+        self._installFolder = None
+
+    def getInstallFolderPath(self):
+        if self._installFolder is None:
+            self._installFolder = TemporaryDirectory(prefix='indigo-')
+        return self._installFolder.name
+
+    def resetInstallFolder(self):
+        if self._installFolder is not None:
+            self._installFolder.cleanup()
+            self._installFolder = None
+
+    def getPlugin(self, pluginId):
+        pluginInfo = self._plugins.get(pluginId)
+        if pluginInfo is None:
+            pluginInfo = self._plugins[pluginId] = PluginInfo(pluginId)
+        return pluginInfo
+
+    def registerPlugin(self, pluginInfo):
+        self._plugins[pluginInfo.pluginId] = pluginInfo
+
+    def getTime(self):
+        return datetime.now()
+
+    def log(self, message, type='', isError=False, level=logging.INFO):
+        L.log(logging.ERROR if isError else level, '%s %s', type, message)
+
+
+###############################################################################
+#                                                                             #
+#                                 CLASS Host                                  #
+#                                                                             #
+###############################################################################
+
+class Host:
+    """
+    Plugin host and server-side operations.  Callbacks are dispatched on a
+    single thread in due time order.  With synchronous True, immediate
+    callbacks are executed on the calling thread; delayed callbacks are
+    always dispatched on the host thread.
+    """
+
+    def __init__(self):
+        self.plugin = None
+        self.synchronous = False
+        self.callbackErrors = 0
+        self._condition = Condition()
+        self._heap = []
+        self._sequenceNumbers = count()
+        self._busy = False
+        self._thread = None
+        self._states = {}  # {(pluginId, deviceTypeId): default states}
+
+    # Dispatching.
+
+    def call(self, function, *args):
+        """ Call a function as soon as possible. """
+        if self.synchronous:
+            self._execute(function, args)
+        else:
+            self.callLater(0.0, function, *args)
+
+    def callLater(self, delay, function, *args):
+        """ Call a function on the host thread after delay seconds. """
+        with self._condition:
+            heappush(self._heap, (monotonic() + delay,
+                                  next(self._sequenceNumbers), function,
+                                  args))
+            if not self._thread:
+                self._thread = Thread(target=self._run, name='indigoHost',
+                                      daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def waitUntilIdle(self, timeout=10.0, includeDelayed=False):
+        """
+        Wait until there are no callbacks due (or no callbacks at all if
+        includeDelayed is True) and no callback is executing.  Return False
+        on timeout.
+        """
+        if current_thread() is self._thread:
+            return True
+        deadline = monotonic() + timeout
+        with self._condition:
+            while True:
+                now = monotonic()
+                pending = self._heap and (includeDelayed
+                                          or self._heap[0][0] <= now)
+                if not pending and not self._busy:
+                    return True
+                if now >= deadline:
+                    return False
+                self._condition.wait(min(0.01, deadline - now))
+
+    def reset(self):
+        """ Discard pending callbacks, devices, and counters. """
+        with self._condition:
+            self._heap.clear()
+        self.plugin = None
+        self.callbackErrors = 0
+        _devices.__init__()
+        _actionGroups.__init__()
+        _server.calls.clear()
+        _server.resetInstallFolder()
+
+    def _execute(self, function, args):
+        try:
+            function(*args)
+        except Exception:
+            self.callbackErrors += 1
+            L.exception('%s callback failed',
+                        getattr(function, '__name__', function))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._heap:
+                        wait = self._heap[0][0] - monotonic()
+                        if wait <= 0.0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                function, args = heappop(self._heap)[2:]
+                self._busy = True
+            self._execute(function, args)
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    # Server-side operations.
+
+    def owns(self, dev):
+        """ Return True if the device is owned by the running plugin. """
+        return self.plugin is not None and dev.pluginId == self.plugin.pluginId
+
+    def registerStates(self, pluginId, deviceTypeId, states):
+        """ Register the default states for a plugin device type. """
+        self._states[(pluginId, deviceTypeId)] = dict(states)
+
+    def states(self, pluginId, deviceTypeId):
+        """ Return the default states for a new device. """
+        return dict(self._states.get((pluginId, deviceTypeId),
+                                     DEFAULT_STATES))
+
+    def createDevice(self, name, deviceTypeId='contactSensor', pluginId='',
+                     states=None, props=None, enabled=True):
+        """
+        Create a device as a user would in the Indigo client.  Plugin devices
+        are not started; use device.enable to start them.
+        """
+        if states is None:
+            states = self.states(pluginId, deviceTypeId)
+        return _devices.add(Device(None, name, deviceTypeId, pluginId,
+                                   states, props, enabled))
+
+    def createActionGroup(self, name, callback=None):
+        """ Create an action group with an optional execution callback. """
+        return _actionGroups.add(name, callback)
+
+    def getDevice(self, dev):
+        """ Return a copy of a device as the server sees it. """
+        return _devices[dev]
+
+    def setStates(self, dev, **states):
+        """
+        Change device states as a physical device would.  State names that
+        are not valid Python identifiers may be passed with **{name: value}.
+        """
+        _devices.updateStates(_devices[dev].id, tuple(states.items()), None)
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS PluginBase                               #
+#                                                                             #
+###############################################################################
+
+class PluginBase:
+    """ Stand-in for indigo.PluginBase with the default callbacks. """
+
+    def __init__(self, pluginId, pluginDisplayName, pluginVersion,
+                 pluginPrefs):
+        self.pluginId = pluginId
+        self.pluginDisplayName = pluginDisplayName
+        self.pluginVersion = pluginVersion
+        self.pluginPrefs = pluginPrefs if pluginPrefs is not None else Dict()
+        self.stopThread = False
+
+        # Replace the event log handler of any prior plugin instance.
+
+        self.logger = logging.getLogger('Plugin')
+        for handler in list(self.logger.handlers):
+            if getattr(handler, 'indigoLogHandler', False):
+                self.logger.removeHandler(handler)
+        self.indigo_log_handler = logging.StreamHandler(sys.stdout)
+        self.indigo_log_handler.indigoLogHandler = True
+        self.indigo_log_handler.setFormatter(logging.Formatter(
+            '%(asctime)s ' + pluginDisplayName
+            + ' %(levelname)s %(message)s'))
+        self.logger.addHandler(self.indigo_log_handler)
+        self.logger.propagate = False
+        self.logger.setLevel(THREADDEBUG)
+
+        host.plugin = self
+
+    def startup(self):
+        pass
+
+    def shutdown(self):
+        pass
+
+    def sleep(self, seconds):
+        sleep(seconds)
+
+    def deviceStartComm(self, dev):
+        pass
+
+    def deviceStopComm(self, dev):
+        pass
+
+    def didDeviceCommPropertyChange(self, origDev, newDev):
+        return origDev.pluginProps != newDev.pluginProps
+
+    def deviceCreated(self, dev):
+        pass
+
+    def deviceDeleted(self, dev):
+        if dev.pluginId == self.pluginId:
+            self.deviceStopComm(dev)
+
+    def deviceUpdated(self, origDev, newDev):
+        """ Restart a started plugin device if its comm properties change. """
+        if (newDev.pluginId == self.pluginId and newDev.enabled
+                and self.didDeviceCommPropertyChange(origDev, newDev)):
+            self.deviceStopComm(origDev)
+            self.deviceStartComm(newDev)
+
+    def validatePrefsConfigUi(self, valuesDict):
+        return True, valuesDict
+
+    def validateDeviceConfigUi(self, valuesDict, typeId, devId):
+        return True, valuesDict
+
+    def actionControlDevice(self, action, dev):
+        pass
+
+    def actionControlUniversal(self, action, dev):
+        pass
+
+
+###############################################################################
+#                                                                             #
+#                           MODULE-LEVEL INSTANCES                            #
+#                                                                             #
+###############################################################################
+
+# The stand-in refers to its server-side instances by the private names so
+# that the public names may be replaced (e.g., by accounting proxies) without
+# affecting the server.
+
+host = Host()
+server = _server = Server()
+devices = _devices = DeviceDictionary()
+device = DeviceCommands()
+actionGroups = _actionGroups = ActionGroupDictionary()
+actionGroup = ActionGroupCommands()
+_server.registerPlugin(TimersAndPesters())
+host.registerStates(TimersAndPesters.PLUGIN_ID, 'timer',
+                    TimersAndPesters.STATES)
@@ -0,0 +1,372 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                           MODULE pluginHost.py                              #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  pluginHost.py
+   TITLE:  Headless host for running the Plugin class off-box
+FUNCTION:  Loads the unmodified plugin modules with the indigo stand-in
+           package, configures opener devices through the plugin's own
+           ConfigUI validation, and manages the plugin lifecycle for load
+           tests, replays, and profiling.
+   USAGE:  python3 pluginHost.py [-p PLUGIN_DIR] [-l LEVEL]
+           runs a short open/close demonstration.  Other tools import the
+           PluginHost class.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE pluginHost.py DESCRIPTION:
+
+The PluginHost class does what the Indigo plugin host and server do when a
+plugin is enabled and its devices are configured:
+
+(1) It reads the plugin id, name, and version from Info.plist, the default
+plugin preferences from PluginConfig.xml, and the ConfigUI field defaults and
+device states for each device type from Devices.xml.
+
+(2) It imports plugin.py from the plugin directory, instantiates the Plugin
+class, calls its startup method, and starts all enabled plugin devices.
+
+(3) Its addOpener method creates a disabled opener device, builds a values
+dictionary from the Devices.xml defaults and the caller's field values,
+validates it with the plugin validateDeviceConfigUi method (which may create
+travel timer and virtual lock devices), saves the pluginProps, and enables
+the device to start it.
+
+(4) Its unload method stops all plugin devices and calls the plugin shutdown
+method.
+
+Monitored devices (relays, sensors, and switches) are created with addDevice
+and driven with setState, which delivers deviceUpdated callbacks to the
+plugin exactly as a physical device state change would.  The plugin
+processes the resulting events on its event queue workers and executes the
+resulting server commands on its command dispatcher thread; waitUntilIdle
+waits for the host callbacks, the plugin event queue, and the plugin command
+dispatcher.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import logging
+import plistlib
+import sys
+
+from argparse import ArgumentParser
+from importlib import import_module
+from pathlib import Path
+from time import monotonic, sleep
+from xml.etree import ElementTree
+
+TOOLS_DIR = Path(__file__).resolve().parent
+PLUGIN_DIR = (TOOLS_DIR.parent / 'Virtual Garage Door.indigoPlugin'
+              / 'Contents' / 'Server Plugin')
+
+# ConfigUI field types that do not hold values.
+
+NON_VALUE_FIELD_TYPES = ('label', 'separator', 'button')
+
+# Initial values for state value types in Devices.xml.
+
+STATE_VALUE_DEFAULTS = {'Integer': 0, 'Number': 0.0, 'Boolean': False}
+
+# Extra states for device types defined with a type attribute in Devices.xml.
+
+TYPE_STATES = {'relay': {'onOffState': False},
+               'sensor': {'onOffState': False}}
+
+
+###############################################################################
+#                                                                             #
+#                              CLASS PluginHost                               #
+#                                                                             #
+###############################################################################
+
+class PluginHost:
+    """
+    The PluginHost class loads and runs one copy of the plugin with the
+    indigo stand-in package.  The stand-in is a single process-wide server,
+    so only one PluginHost instance may be loaded at a time.
+    """
+
+    def __init__(self, pluginDir=PLUGIN_DIR, prefs=None, synchronous=False):
+        """
+        Put the tools directory (for the indigo stand-in) and the plugin
+        directory on sys.path, import the stand-in, and read the plugin
+        bundle definitions.  prefs override the PluginConfig.xml defaults.
+        """
+        self.pluginDir = Path(pluginDir)
+        for path in (str(self.pluginDir), str(TOOLS_DIR)):
+            if path in sys.path:
+                sys.path.remove(path)
+            sys.path.insert(0, path)
+        self.indigo = import_module('indigo')
+        self.indigo.host.reset()
+        self.indigo.host.synchronous = synchronous
+
+        with open(self.pluginDir.parent / 'Info.plist', 'rb') as plistFile:
+            info = plistlib.load(plistFile)
+        self.pluginId = info['CFBundleIdentifier']
+        self.pluginDisplayName = info['CFBundleDisplayName']
+        self.pluginVersion = info['PluginVersion']
+
+        self.prefs = self._fieldDefaults(
+            ElementTree.parse(self.pluginDir / 'PluginConfig.xml').getroot())
+        self.prefs.update(prefs or {})
+
+        self.fieldDefaults = {}  # {deviceTypeId: {fieldId: default}}
+        devicesXml = ElementTree.parse(self.pluginDir / 'Devices.xml')
+        for deviceElement in devicesXml.getroot().iter('Device'):
+            typeId = deviceElement.get('id')
+            self.fieldDefaults[typeId] = self._fieldDefaults(
+                deviceElement.find('ConfigUI'))
+            states = dict(TYPE_STATES.get(deviceElement.get('type'), {}))
+            for stateElement in deviceElement.iter('State'):
+                valueType = stateElement.find('ValueType')
+                states[stateElement.get('id')] = STATE_VALUE_DEFAULTS.get(
+                    (valueType.text or '').strip(), '')
+            self.indigo.host.registerStates(self.pluginId, typeId, states)
+
+        self.plugin = None
+
+    @staticmethod
+    def _fieldDefaults(configElement):
+        """
+        Return a dictionary of the default values for the value fields in a
+        ConfigUI or PluginConfig element.  Checkbox defaults are bool.
+        """
+        defaults = {}
+        for field in configElement.iter('Field'):
+            fieldType = field.get('type')
+            if fieldType in NON_VALUE_FIELD_TYPES:
+                continue
+            default = field.get('defaultValue', '')
+            if fieldType == 'checkbox':
+                default = default.lower() == 'true'
+            defaults[field.get('id')] = default
+        return defaults
+
+    # Plugin lifecycle.
+
+    def load(self):
+        """
+        Import the plugin module, instantiate the Plugin class, call its
+        startup method, and start all enabled plugin devices.  Return the
+        Plugin instance.
+        """
+        sys.modules.pop('plugin', None)
+        pluginModule = import_module('plugin')
+        self.plugin = pluginModule.Plugin(
+            self.pluginId, self.pluginDisplayName, self.pluginVersion,
+            self.indigo.Dict(self.prefs))
+        self.plugin.startup()
+        for dev in self.indigo.devices.iter('self'):
+            if dev.enabled:
+                self.plugin.deviceStartComm(dev)
+        return self.plugin
+
+    def unload(self):
+        """ Stop all plugin devices and shut down the plugin. """
+        self.waitUntilIdle()
+        for dev in self.indigo.devices.iter('self'):
+            if dev.enabled:
+                self.plugin.deviceStopComm(dev)
+        self.plugin.shutdown()
+        self.indigo.host.plugin = None
+        self.plugin = None
+
+    def waitUntilIdle(self, timeout=10.0, includeDelayed=False):
+        """
+        Wait for the host to deliver all due callbacks and for the plugin to
+        process all buffered and queued events and pending commands.  Repeat until all are
+        idle because each can generate work for the others.  Return False on
+        timeout.
+        """
+        deadline = monotonic() + timeout
+        queues = [queue for queue in (
+            getattr(self.plugin, '_reorderBuffer', None),
+            getattr(self.plugin, '_eventQueue', None),
+            getattr(self.plugin, '_commandDispatcher', None)) if queue]
+        while True:
+            if not self.indigo.host.waitUntilIdle(deadline - monotonic(),
+                                                  includeDelayed):
+                return False
+            for queue in queues:
+                if not queue.waitUntilIdle(deadline - monotonic()):
+                    return False
+            if (self.indigo.host.waitUntilIdle(0.0, includeDelayed)
+                    and all(queue.waitUntilIdle(0.0) for queue in queues)):
+                return True
+
+    # Devices.
+
+    def addDevice(self, name, deviceTypeId='contactSensor', states=None,
+                  pluginId=''):
+        """ Create a monitored (relay, sensor, or switch) device. """
+        return self.indigo.host.createDevice(name, deviceTypeId, pluginId,
+                                             states)
+
+    def addTimer(self, name):
+        """ Create a Timers and Pesters timer device. """
+        timerPlugin = self.indigo.TimersAndPesters
+        return self.indigo.host.createDevice(
+            name, 'timer', timerPlugin.PLUGIN_ID,
+            props={'amount': 1.0, 'amountType': 'seconds'})
+
+    def addActionGroup(self, name, callback=None):
+        """ Create an action group with an optional execution callback. """
+        return self.indigo.host.createActionGroup(name, callback)
+
+    def addOpener(self, name, **fields):
+        """
+        Create, configure, and start an opener device.  fields are ConfigUI
+        field values (e.g., csName='garage-cs', ttName='BUILT-IN') that
+        override the Devices.xml defaults.  Raise ValueError if the plugin
+        validation fails.  Return a copy of the started opener device.
+        """
+        indigo = self.indigo
+        opDev = indigo.host.createDevice(
+            name, 'opener', self.pluginId,
+            props={'IsLockSubType': False}, enabled=False)
+        valuesDict = indigo.Dict(self.fieldDefaults['opener'])
+        for fieldId, value in fields.items():
+            valuesDict[fieldId] = value
+            if fieldId.endswith('Name') and fieldId[:2] + 'Selected' in \
+                    valuesDict:
+                valuesDict[fieldId[:2] + 'Selected'] = bool(value)
+
+        result = self.plugin.validateDeviceConfigUi(valuesDict, 'opener',
+                                                    opDev.id)
+        valuesDict = result[1]
+        errorsDict = result[2] if len(result) > 2 else {}
+        if not result[0] or errorsDict:
+            indigo.devices.delete(opDev.id)
+            raise ValueError('"%s" configuration errors: %s'
+                             % (name, dict(errorsDict)))
+
+        opDev.replacePluginPropsOnServer(valuesDict)
+        indigo.device.enable(opDev.id, True)
+        self.waitUntilIdle()
+        return indigo.host.getDevice(opDev.id)
+
+    def setState(self, dev, value, stateName='onOffState'):
+        """ Change a monitored device state as the physical device would. """
+        self.indigo.host.setStates(dev, **{stateName: value})
+
+    def state(self, dev, stateName):
+        """ Return the current server value of a device state. """
+        return self.indigo.host.getDevice(dev).states[stateName]
+
+
+###############################################################################
+#                                                                             #
+#                                  FUNCTIONS                                  #
+#                                                                             #
+###############################################################################
+
+def demonstrate(host):
+    """
+    Configure a door with ar, cs, os, and vs devices, a built-in travel
+    timer, and an automatic virtual lock.  Open and close the door with the
+    opener device commands while simulating the physical door with sensor
+    state changes.
+    """
+    indigo = host.indigo
+    for name, typeId in (('demo-ar', 'pseudoRelay'),
+                         ('demo-cs', 'contactSensor'),
+                         ('demo-os', 'contactSensor'),
+                         ('demo-vs', 'contactSensor')):
+        host.addDevice(name, typeId)
+    host.setState('demo-cs', True)
+
+    host.load()
+    opDev = host.addOpener('demo-opener', arName='demo-ar',
+                           csName='demo-cs', osName='demo-os',
+                           vsName='demo-vs', ttName='BUILT-IN', tTime='8',
+                           vlName='demo-virtualLock')
+
+    def doorStatus():
+        host.waitUntilIdle()
+        return host.state(opDev.id, 'doorStatus')
+
+    print('startup:', doorStatus())
+
+    indigo.device.turnOff(opDev.id)  # Open the door.
+    sleep(1.0)  # Activation relay pulse.
+    host.setState('demo-vs', True)
+    host.setState('demo-cs', False)
+    print('opening:', doorStatus())
+    host.setState('demo-os', True)
+    print('opened: ', doorStatus())
+
+    indigo.device.turnOn(opDev.id)  # Close the door.
+    sleep(1.0)
+    host.setState('demo-os', False)
+    print('closing:', doorStatus())
+    host.setState('demo-cs', True)
+    print('closed: ', doorStatus())
+
+    host.unload()
+    print('server calls:', dict(indigo.server.calls))
+
+
+def main():
+    parser = ArgumentParser(description='Virtual Garage Door headless '
+                                        'plugin host demonstration')
+    parser.add_argument('-p', '--plugin-dir', default=str(PLUGIN_DIR),
+                        help='directory containing plugin.py')
+    parser.add_argument('-l', '--logging-level', default='INFO',
+                        help='plugin loggingLevel preference')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    host = PluginHost(args.plugin_dir,
+                      prefs={'loggingLevel': args.logging_level})
+    demonstrate(host)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+# coding=utf-8
+"""
+###############################################################################
+#                                                                             #
+#                      Virtual Garage Door Indigo Plugin                      #
+#                         MODULE replayScenarios.py                           #
+#                                                                             #
+###############################################################################
+
+  BUNDLE:  Monitoring and control of conventional garage door openers in Indigo
+           (Virtual Garage Door.indigoPlugin)
+  MODULE:  replayScenarios.py
+   TITLE:  Replay the trackAnalysis.txt use-case scenarios through the plugin
+FUNCTION:  Loads the plugin in the headless plugin host, replays each
+           scenario's timed monitored device events through the
+           Plugin.deviceUpdated -> VirtualGarageDoor.update path, checks the
+           door status after each event and at the end of the scenario, and
+           reports the wall time for each scenario.
+   USAGE:  python3 replayScenarios.py [-f FIXTURES] [-s SCALE] [-k SUBSTRING]
+                                      [-v]
+           Use the -s option to scale the nominal scenario times (0 replays
+           events back to back).  Use the -k option to replay only the
+           scenarios whose names contain SUBSTRING.
+  AUTHOR:  papamac
+ VERSION:  1.6.0
+    DATE:  October 16, 2026
+
+UNLICENSE:
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org/>
+
+MODULE replayScenarios.py DESCRIPTION:
+
+The scenario fixtures (scenarios.json) are generated from
+files/trackAnalysis.txt by generateScenarios.py.  Each scenario is replayed
+on a freshly loaded plugin with a synchronous plugin host, so every
+monitored device state change is delivered to Plugin.deviceUpdated on the
+replay thread.  The runner waits until the plugin event queue is idle and
+then checks the door status after each event.
+
+For each scenario the runner creates the monitored devices in the scenario
+configuration (a pseudo relay for ar, contact sensors for cs, os, and vs,
+and a Timers and Pesters timer for tt), sets the sensor states for the
+physical start state, and adds an opener device.  An opener with no sensors
+always starts CLOSED; if the physical start state is OPEN, the runner first
+drives the door OPEN with an ar-on/tt-exp preamble.
+
+Events are replayed at the scenario times multiplied by the time scale:
+
+ar-on          pulse the activation relay on and off
+vs-on          turn the vibration sensor on (the plugin resets it)
+cs-xx, os-xx   set the sensor state
+tt-exp         expire the Timers and Pesters timer
+
+The VirtualGarageDoor duplicate event check interval (1 second) is scaled by
+the same time scale.
+
+A scenario passes if the door status track and the final door status match
+the expected values in the fixture.  The wall time includes the scaled
+delays; the processing time is the time spent delivering events.
+
+CHANGE LOG:
+
+v1.6.0  10/16/2026  Initial version.
+"""
+###############################################################################
+#                                                                             #
+#                       DUNDERS, IMPORTS, AND GLOBALS                         #
+#                                                                             #
+###############################################################################
+
+__author__ = 'papamac'
+__version__ = '1.6.0'
+__date__ = 'October 16, 2026'
+
+import json
+import sys
+
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter, sleep
+
+from pluginHost import PluginHost
+
+TOOLS_DIR = Path(__file__).resolve().parent
+SCENARIOS_FILE = TOOLS_DIR / 'scenarios.json'
+
+DEVICE_TYPE_IDs = {'ar': 'pseudoRelay',
+                   'cs': 'contactSensor',
+                   'os': 'contactSensor',
+                   'vs': 'contactSensor'}
+
+TRAVEL_TIME = '12.0'
+
+
+###############################################################################
+#                                                                             #
+#                             CLASS ScenarioReplay                            #
+#                                                                             #
+###############################################################################
+
+class ScenarioReplay:
+    """
+    Replay one scenario on a freshly loaded plugin and record the door status
+    track, the result, and the times.
+    """
+
+    def __init__(self, scenario, timeScale=0.0, loggingLevel='CRITICAL'):
+        self.scenario = scenario
+        self.timeScale = timeScale
+        self.loggingLevel = loggingLevel
+        self.track = []
+        self.errors = []
+        self.wallTime = 0.0
+        self.processingTime = 0.0
+        self._host = None
+        self._opDevId = None
+        self._names = {}  # {monitored device type id: device name}
+
+    @property
+    def passed(self):
+        return not self.errors
+
+    def run(self):
+        """ Set up the scenario, replay the events, and check the results. """
+        start = perf_counter()
+        self._setUp()
+        try:
+            clock = 0.0
+            for step in self.scenario['steps']:
+                if 'event' not in step:
+                    continue
+                delay = (step['time'] - clock) * self.timeScale
+                if delay > 0.0:
+                    sleep(delay)
+                clock = step['time']
+                status = self._deliver(step['event'])
+                self.track.append('%s %s' % (step['event'], status))
+                if status != step['expected']:
+                    self.errors.append('%s: expected %s, got %s'
+                                       % (step['event'], step['expected'],
+                                          status))
+            status = self._doorStatus()
+            if status != self.scenario['expectedStatus']:
+                self.errors.append('final: expected %s, got %s'
+                                   % (self.scenario['expectedStatus'],
+                                      status))
+            if self._host.indigo.host.callbackErrors:
+                self.errors.append('%s callback errors'
+                                   % self._host.indigo.host.callbackErrors)
+        finally:
+            self._host.unload()
+        self.wallTime = perf_counter() - start
+        return self.passed
+
+    def _setUp(self):
+        """
+        Load the plugin and create the monitored devices and the opener
+        device for the scenario configuration and physical start state.
+        """
+        self._host = host = PluginHost(
+            prefs={'loggingLevel': self.loggingLevel}, synchronous=True)
+        scenario = self.scenario
+        fields = {'vsResetDelay': '0', 'tTime': TRAVEL_TIME}
+        for typeId in scenario['devices']:
+            name = 'replay-%s' % typeId
+            self._names[typeId] = name
+            if typeId == 'tt':
+                host.addTimer(name)
+            else:
+                host.addDevice(name, DEVICE_TYPE_IDs[typeId])
+            fields[typeId + 'Name'] = name
+
+        closed = scenario['physicalStart'] == 'closed'
+        if 'cs' in self._names:
+            host.setState(self._names['cs'], closed)
+        if 'os' in self._names:
+            host.setState(self._names['os'], not closed)
+
+        host.load()
+
+        # Scale the duplicate event check interval with the scenario times.
+
+        vgdClass = sys.modules['virtualGarageDoor'].VirtualGarageDoor
+        vgdClass.DUPLICATE_EVENT_INTERVAL = 1.0 * self.timeScale
+
+        self._opDevId = host.addOpener('replay-opener', **fields).id
+
+        if self._doorStatus() != scenario['physicalStart']:
+            for event in ('ar-on', 'tt-exp'):  # Drive the door OPEN.
+                self._deliver(event)
+            if self._doorStatus() != scenario['physicalStart']:
+                raise RuntimeError('"%s" cannot set up the start state %s'
+                                   % (scenario['name'],
+                                      scenario['physicalStart']))
+
+    def _deliver(self, event):
+        """
+        Change the monitored device state for an event as the physical device
+        would and return the resulting door status.
+        """
+        host = self._host
+        typeId, value = event.split('-')
+        name = self._names[typeId]
+        start = perf_counter()
+        if typeId == 'ar':
+            host.setState(name, True)
+            host.setState(name, False)
+        elif typeId == 'tt':
+            timerPlugin = host.indigo.server.getPlugin(
+                host.indigo.TimersAndPesters.PLUGIN_ID)
+            timerPlugin.expire(host.indigo.devices[name].id)
+        else:
+            host.setState(name, value == 'on')
+        host.waitUntilIdle()
+        self.processingTime += perf_counter() - start
+        return self._doorStatus()
+
+    def _doorStatus(self):
+        return self._host.state(self._opDevId, 'doorStatus')
+
+
+###############################################################################
+#                                                                             #
+#                                  FUNCTIONS                                  #
+#                                                                             #
+###############################################################################
+
+def main():
+    parser = ArgumentParser(description='Replay the trackAnalysis.txt '
+                                        'use-case scenarios')
+    parser.add_argument('-f', '--fixtures', default=str(SCENARIOS_FILE),
+                        help='scenario fixture file')
+    parser.add_argument('-s', '--scale', type=float, default=0.01,
+                        help='time scale for the nominal scenario times')
+    parser.add_argument('-k', '--select', default='',
+                        help='replay scenarios whose names contain SELECT')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='show plugin log messages')
+    args = parser.parse_args()
+
+    loggingLevel = 'DEBUG' if args.verbose else 'CRITICAL'
+    with open(args.fixtures) as fixtureFile:
+        scenarios = json.load(fixtureFile)['scenarios']
+
+    failures = 0
+    totalTime = 0.0
+    for scenario in scenarios:
+        if args.select not in scenario['name']:
+            continue
+        replay = ScenarioReplay(scenario, args.scale, loggingLevel)
+        replay.run()
+        totalTime += replay.wallTime
+        print('%-4s %-22s %8.1f ms wall %7.2f ms processing'
+              % ('ok' if replay.passed else 'FAIL', scenario['name'],
+                 replay.wallTime * 1000, replay.processingTime * 1000))
+        if not replay.passed:
+            failures += 1
+            for error in replay.errors:
+                print('         %s' % error)
+            print('         track: %s' % ', '.join(replay.track))
+    print('%s failures, total wall time %.2f s' % (failures, totalTime))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())